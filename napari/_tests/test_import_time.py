@@ -5,6 +5,28 @@ import sys
 import pytest
 
 
+def _import_times(statement: str) -> dict[str, tuple[int, int]]:
+    """Run ``statement`` in a fresh interpreter and parse ``-X importtime``.
+
+    Returns
+    -------
+    dict
+        Mapping of module name to ``(self, cumulative)`` import time in
+        microseconds, for every module imported by ``statement``.
+    """
+    cmd = [sys.executable, '-X', 'importtime', '-c', statement]
+    proc = subprocess.run(cmd, capture_output=True, check=True)
+    times = {}
+    for line in proc.stderr.decode().splitlines():
+        if not line.startswith('import time:'):
+            continue
+        self_us, cumulative_us, name = line[len('import time:') :].split('|')
+        if not self_us.strip().isdigit():
+            continue  # header line
+        times[name.strip()] = (int(self_us), int(cumulative_us))
+    return times
+
+
 @pytest.mark.skipif(
     bool(os.environ.get('MIN_REQ')), reason='skip import time test on MIN_REQ'
 )
@@ -23,3 +45,127 @@ def test_import_time(tmp_path):
 
     # common culprit of slow imports
     assert 'pkg_resources' not in log
+
+
+# Heavy modules that must only be imported on first use. Checking which
+# modules get imported is deterministic, unlike wall clock budgets, so this is
+# what keeps startup from regressing on CI.
+DEFERRED_MODULES = {
+    'import napari': [
+        'napari.components',
+        'napari.layers',
+        'napari.utils.colormaps',
+        'napari.settings',
+        'npe2',
+        'vispy',
+        'pandas',
+        'scipy',
+        'dask',
+    ],
+    'import napari.layers, napari.components': [
+        'napari._vispy',
+        'napari._qt',
+        'napari._vendor',
+        'dask.array',
+        'scipy.interpolate',
+        'scipy.ndimage',
+        'scipy.spatial.transform',
+        'scipy.stats',
+        'skimage.draw',
+    ],
+}
+
+
+# Heavy modules that are still imported eagerly by the layer model. They are
+# tracked here so that they are moved to DEFERRED_MODULES once deferred:
+# - pandas: layer features tables are built with module level pandas imports
+#   across napari.layers (layer_utils, text_manager, string_encoding, ...).
+# - scipy: imported by numba, which jit compiles the label colormap kernels
+#   in napari.utils.colormaps.colormap at import, when numba is installed.
+# - the colormap tables: colormap_utils builds AVAILABLE_COLORMAPS from every
+#   vendored matplotlib and bop colormap at import.
+KNOWN_EAGER_MODULES = {
+    'import napari.layers, napari.components': [
+        'pandas',
+        'scipy',
+        'napari.utils.colormaps.vendored.cm',
+        'napari.utils.colormaps.bop_colors',
+    ],
+}
+
+
+@pytest.mark.skipif(
+    bool(os.environ.get('MIN_REQ')), reason='skip import time test on MIN_REQ'
+)
+@pytest.mark.parametrize(
+    ('statement', 'module'),
+    [
+        (statement, module)
+        for statement, modules in DEFERRED_MODULES.items()
+        for module in modules
+    ]
+    + [
+        pytest.param(
+            statement,
+            module,
+            marks=pytest.mark.xfail(reason='known eager import', strict=False),
+        )
+        for statement, modules in KNOWN_EAGER_MODULES.items()
+        for module in modules
+    ],
+)
+def test_deferred_imports(statement, module):
+    times = _import_times(statement)
+    assert module not in times, f'{statement!r} eagerly imported {module}'
+
+
+# Cumulative time, in seconds on a reference machine, to import each deferred
+# module on first use, after the statement that defers it.
+DEFERRED_IMPORT_BUDGETS = {
+    'napari.components': 5.0,
+    'napari.layers': 4.0,
+    'napari.utils.colormaps': 2.5,
+    'napari.settings': 3.5,
+    'npe2': 0.5,
+    'vispy': 0.25,
+    'pandas': 0.6,
+    'scipy': 0.2,
+    'dask': 0.25,
+    'napari._vispy': 4.5,
+    'napari._qt': 1.0,
+    'napari._vendor': 0.05,
+    'dask.array': 1.0,
+    'scipy.interpolate': 0.8,
+    'scipy.ndimage': 0.6,
+    'scipy.spatial.transform': 0.6,
+    'scipy.stats': 1.5,
+    'skimage.draw': 0.1,
+}
+
+
+@pytest.mark.skipif(
+    bool(os.environ.get('MIN_REQ')), reason='skip import time test on MIN_REQ'
+)
+@pytest.mark.parametrize(
+    ('statement', 'module'),
+    [
+        (statement, module)
+        for statement, modules in DEFERRED_MODULES.items()
+        for module in modules
+    ],
+)
+def test_deferred_import_budget(statement, module):
+    """Check the time to import a deferred module on first use.
+
+    Wall clock budgets are noisy on shared CI runners, so by default the
+    budgets are scaled generously and only catch gross regressions.
+    ``NAPARI_IMPORT_TIME_BUDGET`` sets the scale, e.g. ``1`` on a reference
+    benchmarking machine.
+    """
+    scale = float(os.environ.get('NAPARI_IMPORT_TIME_BUDGET', 5))
+    budget = DEFERRED_IMPORT_BUDGETS[module] * scale
+    times = _import_times(f'{statement}; import {module}')
+    cumulative = times[module][1] / 1e6
+    assert (
+        cumulative < budget
+    ), f'importing {module} took {cumulative:0.3f}s > budget {budget}s'
@@ -6,6 +6,7 @@ import pytest
 
 from napari._tests.utils import skip_on_win_ci
 from napari._version import __version__
+from napari.components import ViewerModel
 from napari.utils import nbscreenshot
 
 
@@ -29,6 +30,18 @@ def test_nbscreenshot(make_napari_viewer):
     assert version_byte_string in png_bytes
 
 
+def test_nbscreenshot_viewer_model():
+    """Test taking a screenshot of a viewer model, without a window."""
+    viewer = ViewerModel()
+    viewer._canvas_size = (60, 80)
+    viewer.add_image(np.random.random((10, 15)))
+
+    png_bytes = nbscreenshot(viewer)._repr_png_()
+
+    assert png_bytes.startswith(b'\x89PNG')
+    assert b'napari version' in png_bytes
+
+
 @skip_on_win_ci
 @pytest.mark.parametrize(
     ('alt_text_input', 'expected_alt_text'),
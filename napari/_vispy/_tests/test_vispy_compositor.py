@@ -0,0 +1,54 @@
+"""Compare the software compositor with screenshots of the vispy canvas."""
+
+import numpy as np
+import pytest
+
+from napari._tests.utils import skip_local_popups, skip_on_win_ci
+from napari.components._compositor import composite
+
+
+def _assert_similar(expected, actual, tolerance=16, max_fraction=0.02):
+    if expected.shape != actual.shape:
+        pytest.skip('the canvas has a different size on this screen')
+    different = (
+        np.abs(expected.astype(int) - actual.astype(int)).max(axis=-1)
+        > tolerance
+    )
+    assert different.mean() < max_fraction
+
+
+def _scene(viewer):
+    np.random.seed(0)
+    viewer.add_image(
+        np.random.random((64, 48)), colormap='magma', contrast_limits=(0, 1)
+    )
+    labels = np.zeros((64, 48), dtype=np.uint8)
+    labels[10:30, 5:25] = 2
+    labels[35:60, 20:45] = 5
+    viewer.add_labels(labels, translate=(2, 3))
+    viewer.add_image(
+        np.linspace(0, 1, 32 * 32).reshape(32, 32),
+        colormap='green',
+        blending='additive',
+        scale=(2, 1.5),
+        gamma=0.5,
+    )
+    viewer.add_points(
+        np.random.random((20, 2)) * 60, size=3, face_color='yellow'
+    )
+
+
+@skip_on_win_ci
+@skip_local_popups
+@pytest.mark.parametrize('zoom', [0.5, 1, 3])
+def test_composite_matches_screenshot(make_napari_viewer, zoom):
+    viewer = make_napari_viewer(show=True)
+    _scene(viewer)
+    viewer.reset_view()
+    viewer.camera.zoom *= zoom
+    viewer.layers[-1].refresh()
+
+    screenshot = viewer.screenshot(canvas_only=True, flash=False)
+    image = composite(viewer, size=screenshot.shape[:2])
+
+    _assert_similar(screenshot, image)
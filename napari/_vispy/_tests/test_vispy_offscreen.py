@@ -0,0 +1,36 @@
+import numpy as np
+import pytest
+
+from napari._vispy.offscreen import (
+    OffscreenCanvas,
+    _offscreen_app,
+    export_movie,
+)
+from napari.components import ViewerModel
+
+try:
+    _offscreen_app(None)
+except RuntimeError:
+    pytest.skip('no offscreen vispy backend', allow_module_level=True)
+
+
+def test_offscreen_canvas():
+    viewer = ViewerModel()
+    viewer.add_image(np.ones((10, 10)), colormap='red')
+    canvas = OffscreenCanvas(viewer, size=(60, 80))
+
+    image = canvas.render()
+
+    assert image.shape == (60, 80, 4)
+    assert image[30, 40, 0] == 255
+    canvas.close()
+
+
+def test_export_movie(tmp_path):
+    viewer = ViewerModel()
+    viewer.add_image(np.arange(4)[:, None, None] * np.ones((4, 10, 10)))
+    states = [{'dims': {'current_step': (t, 0, 0)}} for t in range(4)]
+
+    path = tmp_path / 'frame_{index}.png'
+    assert export_movie(viewer, states, path, size=(40, 40)) == 4
+    assert (tmp_path / 'frame_3.png').exists()
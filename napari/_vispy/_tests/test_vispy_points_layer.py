@@ -3,6 +3,7 @@ import pytest
 
 from napari._vispy.layers.points import VispyPointsLayer
 from napari.layers import Points
+from napari.layers.utils.text_manager import TextManager
 
 
 @pytest.mark.parametrize('opacity', [0, 0.3, 0.7, 1])
@@ -122,3 +123,83 @@ def test_change_antialiasing():
     vispy_layer = VispyPointsLayer(layer)
     layer.antialiasing = 5
     assert vispy_layer.node.antialias == layer.antialiasing
+
+
+def test_attribute_change_keeps_positions():
+    points = np.random.rand(5, 2) * 10
+    layer = Points(points, symbol='disc', face_color='red')
+    visual = VispyPointsLayer(layer)
+    markers = visual.node.points_markers
+    positions = markers._data['a_position'].copy()
+
+    layer.face_color = 'blue'
+    layer.symbol = ['square', 'star', 'disc', 'x', 'ring']
+
+    # only the changed attributes are updated in place
+    np.testing.assert_array_equal(markers._data['a_position'], positions)
+    np.testing.assert_array_equal(
+        markers._data['a_bg_color'], np.tile([0, 0, 1, 1], (5, 1))
+    )
+    expected = [markers._symbol_shader_values[str(s)] for s in layer.symbol]
+    np.testing.assert_array_equal(markers._data['a_symbol'], expected)
+
+
+def test_hover_keeps_selection_markers():
+    points = np.random.rand(10, 2) * 10
+    layer = Points(points)
+    visual = VispyPointsLayer(layer)
+    layer.mode = 'select'
+    layer.selected_data = {0, 1, 2}
+    selection = visual.node.selection_markers._data
+    assert len(selection) == 3
+
+    # hovering an unselected point only sets the hover marker
+    layer._value = 5
+    layer._set_highlight()
+    assert visual.node.selection_markers._data is selection
+    hover = visual.node.hover_markers._data['a_position']
+    np.testing.assert_allclose(hover[0, :2], points[5, ::-1])
+
+    # zooming only updates the highlight width
+    layer._set_highlight(force=True)
+    assert visual.node.selection_markers._data is selection
+
+    layer.selected_data = {0, 1}
+    assert len(visual.node.selection_markers._data) == 2
+
+
+def test_text_culled_to_canvas(monkeypatch):
+    monkeypatch.setattr(TextManager, '_max_view_count', 4)
+    points = np.array([[0, 0], [0, 1], [1, 0], [1, 1], [50, 50], [90, 90]])
+    layer = Points(points, features={'a': range(6)}, text='{a}')
+    vispy_layer = VispyPointsLayer(layer)
+    text_node = vispy_layer._get_text_node()
+
+    layer._update_draw(1, np.array([[-1, -1], [2, 2]]), (100, 100))
+    np.testing.assert_array_equal(text_node.text, ['0', '1', '2', '3'])
+
+    layer._update_draw(1, np.array([[40, 40], [60, 60]]), (100, 100))
+    np.testing.assert_array_equal(text_node.text, ['4'])
+
+
+def test_markers_set_data_matches_vispy():
+    from vispy.scene.visuals import Markers as BaseMarkers
+
+    from napari._vispy.visuals.markers import Markers
+    from napari.layers.points._points_constants import SYMBOL_CODES
+
+    pos = np.random.rand(3, 2)
+    colors = np.random.rand(3, 4).astype(np.float32)
+    names = ['disc', 'square', 'cross']
+    for symbol, codes in [
+        (names, np.array([SYMBOL_CODES[x] for x in names], dtype=np.int8)),
+        (None, None),
+    ]:
+        expected = BaseMarkers()
+        expected.set_data(pos, face_color=colors, symbol=symbol)
+        markers = Markers()
+        markers.set_data(pos, face_color=colors, symbol=codes)
+        for field in expected._data.dtype.names:
+            np.testing.assert_array_equal(
+                markers._data[field], expected._data[field]
+            )
@@ -1,4 +1,7 @@
+import numpy as np
+
 from napari._vispy.layers.tracks import VispyTracksLayer
+from napari.components.dims import Dims
 from napari.layers import Tracks
 
 
@@ -25,3 +28,28 @@ def test_tracks_graph_cleanup():
 
     assert visual.node._subvisuals[2]._pos is None
     assert visual.node._subvisuals[2]._connect is None
+
+
+def test_tracks_time_window():
+    """Test large datasets only upload the track vertices in the window."""
+    tracks_data = [[1, t, t, t] for t in range(10)]
+    layer = Tracks(tracks_data, tail_length=2)
+    layer._max_vertices_unwindowed = 5
+    visual = VispyTracksLayer(layer)
+    # at t=0, only t=0..1 are in the window
+    assert len(visual.node._subvisuals[0]._pos) == 2
+
+    layer._slice_dims(Dims(ndim=3, range=((0, 10, 1),) * 3, point=(4, 0, 0)))
+    visual._on_data_change()
+    pos = visual.node._subvisuals[0]._pos
+    np.testing.assert_array_equal(pos[:, 0], [1, 2, 3, 4, 5])
+    assert visual.node.tracks_filter.vertex_time.ravel().tolist() == [
+        1,
+        2,
+        3,
+        4,
+        5,
+    ]
+
+    layer.tail_length = 1
+    assert len(visual.node._subvisuals[0]._pos) == 4
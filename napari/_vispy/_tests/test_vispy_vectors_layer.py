@@ -1,7 +1,7 @@
 import numpy as np
 import pytest
 
-from napari._vispy.layers.vectors import (
+from napari.layers.vectors._vector_utils import (
     generate_vector_meshes,
     generate_vector_meshes_2D,
 )
@@ -140,3 +140,21 @@ def test_vector_style_change(
         assert counter.count == 0
     else:
         assert counter.count == 1
+
+
+def test_edge_color_change_keeps_mesh(make_napari_viewer):
+    viewer = make_napari_viewer()
+    layer = viewer.add_vectors(np.random.random((10, 2, 2)), edge_color='red')
+    visual = viewer.window._qt_viewer.canvas.layer_to_visual[layer]
+    vertices = visual.node.mesh_data.get_vertices()
+
+    layer.edge_color = 'blue'
+
+    # the mesh is not regenerated, only its colors are updated
+    assert visual.node.mesh_data.get_vertices() is vertices
+    np.testing.assert_array_equal(
+        visual.node.mesh_data.get_face_colors(), layer._view_face_color
+    )
+    np.testing.assert_array_equal(
+        visual.node.mesh_data.get_face_colors()[0], [0, 0, 1, 1]
+    )
@@ -164,8 +164,11 @@ class VispyCanvas:
         self.viewer.camera.events.mouse_zoom.connect(self._on_interactive)
         self.viewer.camera.events.zoom.connect(self._on_cursor)
         self.viewer.layers.events.reordered.connect(self._reorder_layers)
+        self.viewer.layers.events._batch_inserted.connect(self._reorder_layers)
         self.viewer.layers.events.removed.connect(self._remove_layer)
-        self.destroyed.connect(self._disconnect_theme)
+        # Offscreen backends, like EGL and OSMesa, have no native widget.
+        if hasattr(self._scene_canvas._backend, 'destroyed'):
+            self.destroyed.connect(self._disconnect_theme)
 
     @property
     def destroyed(self) -> pyqtBoundSignal:
@@ -575,7 +578,9 @@ class VispyCanvas:
         napari_layer.events.visible.connect(self._reorder_layers)
         self.viewer.camera.events.angles.connect(vispy_layer._on_camera_move)
 
-        self._reorder_layers()
+        # layers inserted in a batch are ordered together at its end
+        if not self.viewer.layers._batch_depth:
+            self._reorder_layers()
 
     def _remove_layer(self, event: Event) -> None:
         """Upon receiving event closes the Vispy visual, deletes it and reorders the still existing layers.
@@ -14,21 +14,28 @@ class VispyPointsLayer(VispyBaseLayer):
 
     def __init__(self, layer) -> None:
         node = PointsVisual()
+        # selection highlight last uploaded to the selection markers, so
+        # that hovering does not upload the whole selection again
+        self._highlight_state = None
         super().__init__(layer, node)
 
-        self.layer.events.symbol.connect(self._on_data_change)
-        self.layer.events.border_width.connect(self._on_data_change)
+        # Only the changed attribute is updated in the markers, the full
+        # data is only set again when the points in view change
+        self.layer.events.symbol.connect(self._on_symbol_change)
+        self.layer.events.border_width.connect(self._on_border_width_change)
         self.layer.events.border_width_is_relative.connect(
-            self._on_data_change
+            self._on_border_width_change
         )
-        self.layer.events.border_color.connect(self._on_data_change)
-        self.layer._border.events.colors.connect(self._on_data_change)
+        self.layer.events.border_color.connect(self._on_border_color_change)
+        self.layer._border.events.colors.connect(self._on_border_color_change)
         self.layer._border.events.color_properties.connect(
-            self._on_data_change
+            self._on_border_color_change
+        )
+        self.layer.events.face_color.connect(self._on_face_color_change)
+        self.layer._face.events.colors.connect(self._on_face_color_change)
+        self.layer._face.events.color_properties.connect(
+            self._on_face_color_change
         )
-        self.layer.events.face_color.connect(self._on_data_change)
-        self.layer._face.events.colors.connect(self._on_data_change)
-        self.layer._face.events.color_properties.connect(self._on_data_change)
         self.layer.events.highlight.connect(self._on_highlight_change)
         self.layer.text.events.connect(self._on_text_change)
         self.layer.events.shading.connect(self._on_shading_change)
@@ -50,31 +57,20 @@ class VispyPointsLayer(VispyBaseLayer):
             border_color = np.array([[0.0, 0.0, 0.0, 1.0]], dtype=np.float32)
             face_color = np.array([[1.0, 1.0, 1.0, 1.0]], dtype=np.float32)
             border_width = np.zeros(1)
-            symbol = ['o']
+            symbol = 'o'
         else:
             data = self.layer._view_data
             size = self.layer._view_size
             border_color = self.layer._view_border_color
             face_color = self.layer._view_face_color
             border_width = self.layer._view_border_width
-            symbol = [str(x) for x in self.layer._view_symbol]
+            symbol = self.layer._view_symbol_codes
 
         set_data = self.node.points_markers.set_data
 
         # use only last dimension to scale point sizes, see #5582
         scale = self.layer.scale[-1]
 
-        if self.layer.border_width_is_relative:
-            border_kw = {
-                'edge_width': None,
-                'edge_width_rel': border_width,
-            }
-        else:
-            border_kw = {
-                'edge_width': border_width * scale,
-                'edge_width_rel': None,
-            }
-
         set_data(
             data[:, ::-1],
             size=size * scale,
@@ -82,47 +78,83 @@ class VispyPointsLayer(VispyBaseLayer):
             # edge_color is the name of the vispy marker visual kwarg
             edge_color=border_color,
             face_color=face_color,
-            **border_kw,
+            **self._border_width_kwargs(border_width),
         )
 
         self.reset()
 
-    def _on_highlight_change(self):
-        settings = get_settings()
-        if len(self.layer._highlight_index) > 0:
-            # Color the hovered or selected points
-            data = self.layer._view_data[self.layer._highlight_index]
-            if data.ndim == 1:
-                data = np.expand_dims(data, axis=0)
-            size = self.layer._view_size[self.layer._highlight_index]
-            border_width = self.layer._view_border_width[
-                self.layer._highlight_index
-            ]
-            if self.layer.border_width_is_relative:
-                border_width = (
-                    border_width
-                    * self.layer._view_size[self.layer._highlight_index][-1]
-                )
-            symbol = self.layer._view_symbol[self.layer._highlight_index]
-        else:
-            data = np.zeros((1, self.layer._slice_input.ndisplay))
-            size = 0
-            symbol = ['o']
-            border_width = np.array([0])
+    def _border_width_kwargs(self, border_width: np.ndarray) -> dict:
+        if self.layer.border_width_is_relative:
+            return {'edge_width': None, 'edge_width_rel': border_width}
+        return {
+            'edge_width': border_width * self.layer.scale[-1],
+            'edge_width_rel': None,
+        }
 
-        scale = self.layer.scale[-1]
+    def _update_markers(self, **kwargs) -> None:
+        """Update some attributes of the markers of the points in view."""
+        markers = self.node.points_markers
+        n_view = len(self.layer._indices_view)
+        if (
+            n_view == 0
+            or not markers._can_update_data
+            or len(markers._data) != n_view
+        ):
+            # the points in view changed, or only the placeholder is shown
+            self._on_data_change()
+            return
+        markers.update_data(**kwargs)
+
+    def _on_symbol_change(self) -> None:
+        self._update_markers(symbol=self.layer._view_symbol_codes)
+        self._on_highlight_change()
+
+    def _on_border_width_change(self) -> None:
+        self._update_markers(
+            **self._border_width_kwargs(self.layer._view_border_width)
+        )
+        self._on_highlight_change()
+
+    def _on_border_color_change(self) -> None:
+        # edge_color is the name of the vispy marker visual kwarg
+        self._update_markers(edge_color=self.layer._view_border_color)
+
+    def _on_face_color_change(self) -> None:
+        self._update_markers(face_color=self.layer._view_face_color)
+
+    def _on_highlight_change(self, event=None):
+        settings = get_settings()
         highlight_thickness = settings.appearance.highlight.highlight_thickness
-        scaled_highlight = highlight_thickness * self.layer.scale_factor
-        scaled_size = (size + border_width) * scale
         highlight_color = tuple(settings.appearance.highlight.highlight_color)
+        edge_width = 2 * highlight_thickness * self.layer.scale_factor
 
-        self.node.selection_markers.set_data(
-            data[:, ::-1],
-            size=scaled_size,
-            symbol=symbol,
-            edge_width=scaled_highlight * 2,
-            edge_color=highlight_color,
-            face_color=transform_color('transparent'),
+        # The selection markers are only set again when the highlighted
+        # selection changed, e.g. not when hovering, or when the points
+        # attributes may have changed (direct calls without an event)
+        selected = self.layer._highlight_selected
+        state = self._highlight_state
+        if (
+            event is None
+            or state is None
+            or state[1] != highlight_color
+            or not np.array_equal(state[0], selected)
+        ):
+            self._set_highlight_markers(
+                self.node.selection_markers,
+                selected,
+                edge_width,
+                highlight_color,
+            )
+        elif state[2] != edge_width:
+            self.node.selection_markers.update_data(edge_width=edge_width)
+        self._highlight_state = (selected, highlight_color, edge_width)
+
+        hover = self.layer._highlight_hover
+        self._set_highlight_markers(
+            self.node.hover_markers,
+            [] if hover is None else [hover],
+            edge_width,
+            highlight_color,
         )
 
         if (
@@ -141,6 +173,44 @@ class VispyPointsLayer(VispyBaseLayer):
 
         self.node.update()
 
+    def _set_highlight_markers(self, markers, index, edge_width, color):
+        """Set highlight markers around the points in view at ``index``.
+
+        Parameters
+        ----------
+        markers : Markers
+            Markers visual to set the data of.
+        index : sequence of int
+            Indices of the highlighted points within the points in view.
+        edge_width : float
+            Width of the highlight.
+        color : tuple
+            Color of the highlight.
+        """
+        index = np.asarray(index, dtype=int)
+        if len(index) > 0:
+            data = self.layer._view_data[index]
+            size = self.layer._view_size[index]
+            border_width = self.layer._view_border_width[index]
+            if self.layer.border_width_is_relative:
+                border_width = border_width * size[-1]
+            symbol = self.layer._view_symbol_codes[index]
+        else:
+            data = np.zeros((1, self.layer._slice_input.ndisplay))
+            size = 0
+            symbol = 'o'
+            border_width = np.array([0])
+
+        scale = self.layer.scale[-1]
+        markers.set_data(
+            data[:, ::-1],
+            size=(size + border_width) * scale,
+            symbol=symbol,
+            edge_width=edge_width,
+            edge_color=color,
+            face_color=transform_color('transparent'),
+        )
+
     def _update_text(self, *, update_node=True):
         """Function to update the text node properties
 
@@ -200,6 +270,10 @@ class VispyPointsLayer(VispyBaseLayer):
             low + highlight_thickness,
             high + highlight_thickness,
         )
+        self.node.hover_markers.canvas_size_limits = (
+            low + highlight_thickness,
+            high + highlight_thickness,
+        )
         self.node.update()
 
     def reset(self):
@@ -1,3 +1,5 @@
+import numpy as np
+
 from napari._vispy.layers.base import VispyBaseLayer
 from napari._vispy.visuals.tracks import TracksVisual
 
@@ -11,6 +13,8 @@ class VispyTracksLayer(VispyBaseLayer):
 
     def __init__(self, layer) -> None:
         node = TracksVisual()
+        # indices of the track vertices currently drawn, None if all of them
+        self._track_window = None
         super().__init__(layer, node)
 
         self.layer.events.tail_width.connect(self._on_appearance_change)
@@ -39,6 +43,11 @@ class VispyTracksLayer(VispyBaseLayer):
         self.node.tracks_filter.current_time = self.layer.current_time
         self.node.graph_filter.current_time = self.layer.current_time
 
+        # stream the track vertices in the time window if it moved
+        window = self.layer._track_window
+        if not _same_window(window, self._track_window):
+            self._set_tracks_data(window)
+
         # add text labels if they're visible
         if self.node._subvisuals[1].visible:
             labels_text, labels_pos = self.layer.track_labels
@@ -66,32 +75,56 @@ class VispyTracksLayer(VispyBaseLayer):
         self.node._subvisuals[2].visible = self.layer.display_graph
 
         # set the width of the track tails
-        self.node._subvisuals[0].set_data(
-            width=self.layer.tail_width,
-            color=self.layer.track_colors,
-        )
+        window = self.layer._track_window
+        if window is None and self._track_window is None:
+            self.node._subvisuals[0].set_data(
+                width=self.layer.tail_width,
+                color=self.layer.track_colors,
+            )
+        else:
+            # the time window depends on the tail and head lengths
+            self._set_tracks_data(window)
         self.node._subvisuals[2].set_data(
             width=self.layer.tail_width,
         )
 
     def _on_tracks_change(self):
         """Update the shader when the track data changes."""
+        self._set_tracks_data(self.layer._track_window)
 
+        # Call to update order of translation values with new dims:
+        self._on_matrix_change()
+
+    def _set_tracks_data(self, window):
+        """Set the track vertices at the window indices, or all if None."""
+        self._track_window = window
         self.node.tracks_filter.use_fade = self.layer.use_fade
         self.node.tracks_filter.tail_length = self.layer.tail_length
-        self.node.tracks_filter.vertex_time = self.layer.track_times
 
+        if window is None:
+            times = self.layer.track_times
+            pos = self.layer._view_data
+            connex = self.layer.track_connex
+            colors = self.layer.track_colors
+        else:
+            if len(window) == 0:
+                # always pass one vertex, which is not connected to any other
+                window = np.zeros(1, dtype=int)
+            manager = self.layer._manager
+            times = self.layer.track_times[window]
+            pos = self.layer._pad_display_data(manager.track_vertices[window])
+            connex = manager.track_window_connex(window)
+            colors = self.layer.track_colors[window]
+
+        self.node.tracks_filter.vertex_time = times
         # change the data to the vispy line visual
         self.node._subvisuals[0].set_data(
-            pos=self.layer._view_data,
-            connect=self.layer.track_connex,
+            pos=pos,
+            connect=connex,
             width=self.layer.tail_width,
-            color=self.layer.track_colors,
+            color=colors,
         )
 
-        # Call to update order of translation values with new dims:
-        self._on_matrix_change()
-
     def _on_graph_change(self):
         """Update the shader when the graph data changes."""
 
@@ -124,3 +157,10 @@ class VispyTracksLayer(VispyBaseLayer):
         self._on_appearance_change()
         self._on_tracks_change()
         self._on_graph_change()
+
+
+def _same_window(window, other) -> bool:
+    """Whether two windows of track vertex indices are the same."""
+    if window is None or other is None:
+        return window is other
+    return np.array_equal(window, other)
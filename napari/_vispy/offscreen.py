@@ -0,0 +1,169 @@
+"""Rendering of a viewer without a window, e.g. on servers without a display.
+
+:class:`OffscreenCanvas` renders a ``ViewerModel`` with a vispy backend
+that does not need a display, like EGL or OSMesa software rendering, and
+:func:`export_movie` renders a sequence of viewer states to a movie.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional, Union
+
+import numpy as np
+from vispy.app import Application
+
+from napari._vispy.canvas import VispyCanvas
+from napari._vispy.utils.visual import create_vispy_layer
+from napari.components._render_frames import (
+    ViewerState,
+    iter_frames,
+    write_frames,
+)
+from napari.utils.key_bindings import KeymapHandler
+from napari.utils.translations import trans
+
+if TYPE_CHECKING:
+    from napari.components import ViewerModel
+    from napari.layers import Layer
+    from napari.utils.events import Event
+
+#: The vispy backends that are tried in order to render without a display.
+OFFSCREEN_BACKENDS = ('egl', 'osmesa')
+
+
+def _offscreen_app(backend: Optional[str]) -> Application:
+    errors = []
+    for name in (backend,) if backend else OFFSCREEN_BACKENDS:
+        try:
+            return Application(name)
+        except RuntimeError as e:
+            errors.append(str(e))
+    raise RuntimeError(
+        trans._(
+            'Could not create an offscreen vispy backend: {errors}',
+            deferred=True,
+            errors='; '.join(errors),
+        )
+    )
+
+
+class OffscreenCanvas(VispyCanvas):
+    """A canvas that renders a viewer to image arrays, without a window.
+
+    Parameters
+    ----------
+    viewer : napari.components.ViewerModel
+        The viewer to render.
+    size : tuple of int
+        The (height, width) of the rendered images.
+    backend : str, optional
+        The vispy backend. By default, the first one of
+        ``OFFSCREEN_BACKENDS`` that is available.
+    """
+
+    def __init__(
+        self,
+        viewer: ViewerModel,
+        size: tuple[int, int] = (512, 512),
+        backend: Optional[str] = None,
+    ) -> None:
+        key_map_handler = KeymapHandler()
+        key_map_handler.keymap_providers = [viewer]
+        super().__init__(
+            viewer,
+            key_map_handler,
+            app=_offscreen_app(backend),
+            size=size[::-1],
+            show=False,
+        )
+        self.viewer._canvas_size = self.size
+        for layer in self.viewer.layers:
+            self._add_layer(layer)
+        self.viewer.layers.events.inserted.connect(self._on_add_layer)
+
+    def _on_add_layer(self, event: Event) -> None:
+        self._add_layer(event.value)
+
+    def _add_layer(self, layer: Layer) -> None:
+        self.add_layer_visual_mapping(layer, create_vispy_layer(layer))
+
+    def _on_cursor(self) -> None:
+        """There is no cursor to show offscreen."""
+
+    def render(self) -> np.ndarray:
+        """Render the viewer in its current state.
+
+        Returns
+        -------
+        np.ndarray
+            The (height, width, 4) RGBA image, of type uint8.
+        """
+        # update the level of detail of multiscale layers, like a draw
+        # event does onscreen
+        self.on_draw(None)
+        return self._scene_canvas.render()
+
+    def close(self) -> None:
+        """Remove the layer visuals and close the canvas."""
+        self.viewer.layers.events.inserted.disconnect(self._on_add_layer)
+        self.viewer.layers.events.removed.disconnect(self._remove_layer)
+        self.viewer.layers.events.reordered.disconnect(self._reorder_layers)
+        self.viewer.layers.events._batch_inserted.disconnect(
+            self._reorder_layers
+        )
+        self._disconnect_theme()
+        for vispy_layer in self.layer_to_visual.values():
+            self.viewer.camera.events.disconnect(vispy_layer._on_camera_move)
+            vispy_layer.close()
+        self.layer_to_visual.clear()
+        self._scene_canvas.close()
+
+
+def export_movie(
+    viewer: ViewerModel,
+    states: Iterable[ViewerState],
+    path: Union[str, Path],
+    *,
+    size: tuple[int, int] = (512, 512),
+    fps: float = 24,
+    backend: Optional[str] = None,
+) -> int:
+    """Render a sequence of viewer states to a movie, without a display.
+
+    The layers are sliced for the next frame while the current one is
+    rendered, and the frames are encoded in the background.
+
+    Parameters
+    ----------
+    viewer : napari.components.ViewerModel
+        The viewer to render.
+    states : iterable of dict
+        The states of the viewer, as dicts with optional ``'dims'`` and
+        ``'camera'`` keys, whose values update ``viewer.dims`` and
+        ``viewer.camera``, e.g.
+        ``({'dims': {'current_step': (t, 0, 0)}} for t in range(100))``.
+    path : str or Path
+        The path of the movie, e.g. ``movie.mp4``, or of the images with
+        an ``{index}`` field, e.g. ``frames/{index:05d}.png``.
+    size : tuple of int
+        The (height, width) of the frames.
+    fps : float
+        The number of frames per second of the movie.
+    backend : str, optional
+        The vispy backend. By default, the first one of
+        ``OFFSCREEN_BACKENDS`` that is available.
+
+    Returns
+    -------
+    int
+        The number of frames written.
+    """
+    canvas = OffscreenCanvas(viewer, size=size, backend=backend)
+    try:
+        return write_frames(
+            iter_frames(viewer, states, canvas.render), path, fps=fps
+        )
+    finally:
+        canvas.close()
@@ -1,4 +1,4 @@
-from typing import Union
+from typing import Optional, Union
 
 import numpy as np
 from vispy.scene.visuals import Text
@@ -31,6 +31,18 @@ def update_text(
         text_values = layer._view_text
         colors = layer._view_text_color
         coords, anchor_x, anchor_y = layer._view_text_coords
+        # Laying out many strings is slow and unreadable when zoomed out,
+        # so only send the ones on the canvas, up to a maximum count.
+        indices = layer.text._cull_view(coords, _displayed_bbox(layer))
+        if indices is not None:
+            text_values = text_values[indices]
+            coords = coords[indices]
+            if colors.ndim == 2:
+                colors = colors[indices]
+            if len(indices) == 0:
+                text_values = np.array([''])
+                colors = np.zeros((4,), np.float32)
+                coords = np.zeros((1, ndisplay))
     else:
         text_values = np.array([''])
         colors = np.zeros((4,), np.float32)
@@ -74,3 +86,10 @@ def _has_visible_text(layer: Union[Points, Shapes]) -> bool:
     if len(layer._indices_view) == 0:
         return False
     return True
+
+
+def _displayed_bbox(layer: Union[Points, Shapes]) -> Optional[np.ndarray]:
+    """Get the displayed region of a layer in data coordinates if 2D."""
+    if layer._slice_input.ndisplay != 2:
+        return None
+    return layer.corner_pixels[:, layer._slice_input.displayed]
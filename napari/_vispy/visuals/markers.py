@@ -1,7 +1,11 @@
 from typing import ClassVar
 
+import numpy as np
+from vispy.color import ColorArray
 from vispy.scene.visuals import Markers as BaseMarkers
 
+from napari.layers.points._points_constants import Symbol
+
 clamp_shader = """
 float clamped_size = clamp($v_size, $canvas_size_min, $canvas_size_max);
 float clamped_ratio = clamped_size / $v_size;
@@ -10,6 +14,11 @@ v_edgewidth = v_edgewidth * clamped_ratio;
 gl_PointSize = $v_size + 4. * (v_edgewidth + 1.5 * u_antialias);
 """
 
+# fields of vispy's vertex data written in place by Markers.update_data
+_VERTEX_FIELDS = frozenset(
+    ('a_fg_color', 'a_bg_color', 'a_size', 'a_edgewidth', 'a_symbol')
+)
+
 old_vshader = BaseMarkers._shaders['vertex']
 new_vshader = old_vshader[:-2] + clamp_shader + '\n}'  # very ugly...
 
@@ -25,6 +34,137 @@ class Markers(BaseMarkers):
         super().__init__(*args, **kwargs)
         self.canvas_size_limits = 0, 10000
 
+    # shader value of each napari symbol code, see SYMBOL_CODES
+    _symbol_code_values = np.array(
+        [BaseMarkers._symbol_shader_values[str(x)] for x in Symbol],
+        dtype=np.float32,
+    )
+
+    def set_data(
+        self,
+        pos=None,
+        size=10.0,
+        edge_width=None,
+        edge_width_rel=None,
+        edge_color='black',
+        face_color='white',
+        symbol='o',
+    ):
+        """Set the data used to display this visual.
+
+        Same as vispy's ``MarkersVisual.set_data``, except that symbol can
+        also be an integer array of napari symbol codes, and that colors that
+        are already (N, 4) float arrays are used as is.
+        """
+        deferred = {}
+        if pos is not None:
+            # vispy builds the vertex data, and the attributes it would
+            # convert slowly are then written with update_data
+            if _is_rgba_array(edge_color):
+                deferred['edge_color'] = edge_color
+                edge_color = 'black'
+            if _is_rgba_array(face_color):
+                deferred['face_color'] = face_color
+                face_color = 'white'
+            if _is_symbol_codes(symbol):
+                deferred['symbol'] = symbol
+                symbol = 'o'
+        super().set_data(
+            pos,
+            size=size,
+            edge_width=edge_width,
+            edge_width_rel=edge_width_rel,
+            edge_color=edge_color,
+            face_color=face_color,
+            symbol=symbol,
+        )
+        if not deferred:
+            return
+        if self._can_update_data:
+            self.update_data(**deferred)
+            return
+        # unknown vertex layout: let vispy convert everything
+        super().set_data(
+            pos,
+            size=size,
+            edge_width=edge_width,
+            edge_width_rel=edge_width_rel,
+            edge_color=deferred.get('edge_color', edge_color),
+            face_color=deferred.get('face_color', face_color),
+            symbol=(
+                np.array([str(x) for x in Symbol])[deferred['symbol']]
+                if 'symbol' in deferred
+                else symbol
+            ),
+        )
+
+    @property
+    def _can_update_data(self) -> bool:
+        """Whether the vertex data can be updated in place."""
+        return self._data is not None and _VERTEX_FIELDS.issubset(
+            self._data.dtype.names or ()
+        )
+
+    def update_data(
+        self,
+        size=None,
+        edge_width=None,
+        edge_width_rel=None,
+        edge_color=None,
+        face_color=None,
+        symbol=None,
+    ):
+        """Update some of the per-marker attributes, keeping the others.
+
+        Parameters are as in `set_data`, and those that are None are left
+        unchanged. The number of markers must not change.
+        """
+        if edge_width is not None and edge_width_rel is not None:
+            raise ValueError(
+                'either edge_width or edge_width_rel should be provided, not both'
+            )
+        if not self._can_update_data:
+            raise RuntimeError(
+                'Markers vertex data has an unknown layout, '
+                f'update_data needs the fields {sorted(_VERTEX_FIELDS)}'
+            )
+        data = self._data
+        if size is not None:
+            data['a_size'] = size
+        if edge_width is not None:
+            edge_width = np.asarray(edge_width)
+            if np.any(edge_width < 0):
+                raise ValueError('edge_width cannot be negative')
+            data['a_edgewidth'] = edge_width
+        elif edge_width_rel is not None:
+            edge_width_rel = np.asarray(edge_width_rel)
+            if np.any(edge_width_rel < 0):
+                raise ValueError('edge_width_rel cannot be negative')
+            data['a_edgewidth'] = data['a_size'] * edge_width_rel
+        if edge_color is not None:
+            data['a_fg_color'] = _as_rgba(edge_color)
+        if face_color is not None:
+            data['a_bg_color'] = _as_rgba(face_color)
+        if symbol is not None:
+            data['a_symbol'] = self._symbol_values(symbol)
+
+        self._vbo.set_data(data)
+        self.shared_program.bind(self._vbo)
+        self.events.data_updated()
+        self.update()
+
+    def _symbol_values(self, symbol):
+        """Shader values of symbol names or napari symbol codes."""
+        codes = np.asarray(symbol)
+        if codes.dtype.kind in 'iu':
+            return self._symbol_code_values[codes]
+        if isinstance(symbol, str):
+            symbol = [symbol]
+        try:
+            return np.array([self._symbol_shader_values[x] for x in symbol])
+        except KeyError as e:
+            raise ValueError(f'symbols must one of {self.symbols}') from e
+
     def _compute_bounds(self, axis, view):
         # needed for entering 3D rendering mode when a points
         # layer is invisible and the self._data property is None
@@ -47,3 +187,26 @@ class Markers(BaseMarkers):
         self._canvas_size_limits = value
         self.shared_program.vert['canvas_size_min'] = value[0]
         self.shared_program.vert['canvas_size_max'] = value[1]
+
+
+def _is_rgba_array(color):
+    """Whether color is an (N, 4) float array that needs no validation."""
+    return (
+        isinstance(color, np.ndarray)
+        and color.dtype.kind == 'f'
+        and color.ndim == 2
+        and color.shape[1] == 4
+    )
+
+
+def _is_symbol_codes(symbol):
+    """Whether symbol is an integer array of napari symbol codes."""
+    return isinstance(symbol, np.ndarray) and symbol.dtype.kind in 'iu'
+
+
+def _as_rgba(color):
+    """Return color as RGBA values, without validating (N, 4) float arrays."""
+    if _is_rgba_array(color):
+        return color
+    rgba = ColorArray(color).rgba
+    return rgba[0] if len(rgba) == 1 else rgba
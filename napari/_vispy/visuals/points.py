@@ -16,6 +16,7 @@ class PointsVisual(ClippingPlanesMixin, Compound):
         - Markers for selection highlights (vispy.MarkersVisual)
         - Lines for highlights (vispy.LineVisual)
         - Text labels (vispy.TextVisual)
+        - Markers for the hover highlight (vispy.MarkersVisual)
     """
 
     def __init__(self) -> None:
@@ -25,6 +26,7 @@ class PointsVisual(ClippingPlanesMixin, Compound):
                 Markers(),
                 Line(),
                 Text(),
+                Markers(),
             ]
         )
         self.scaling = True
@@ -49,6 +51,11 @@ class PointsVisual(ClippingPlanesMixin, Compound):
         """Text labels visual"""
         return self._subvisuals[3]
 
+    @property
+    def hover_markers(self) -> Markers:
+        """Hover highlight markers visual"""
+        return self._subvisuals[4]
+
     @property
     def scaling(self) -> bool:
         """
@@ -62,6 +69,7 @@ class PointsVisual(ClippingPlanesMixin, Compound):
         scaling_txt = 'visual' if value else 'fixed'
         self.points_markers.scaling = scaling_txt
         self.selection_markers.scaling = scaling_txt
+        self.hover_markers.scaling = scaling_txt
 
     @property
     def antialias(self) -> float:
@@ -71,6 +79,7 @@ class PointsVisual(ClippingPlanesMixin, Compound):
     def antialias(self, value: float) -> None:
         self.points_markers.antialias = value
         self.selection_markers.antialias = value
+        self.hover_markers.antialias = value
 
     @property
     def spherical(self) -> bool:
@@ -88,3 +97,4 @@ class PointsVisual(ClippingPlanesMixin, Compound):
     def canvas_size_limits(self, value: tuple[int, int]) -> None:
         self.points_markers.canvas_size_limits = value
         self.selection_markers.canvas_size_limits = value
+        self.hover_markers.canvas_size_limits = value
@@ -0,0 +1,28 @@
+# See "Writing benchmarks" in the asv docs for more information.
+# https://asv.readthedocs.io/en/latest/writing_benchmarks.html
+# or the napari documentation on benchmarking
+# https://github.com/napari/napari/blob/main/docs/BENCHMARKS.md
+import numpy as np
+
+from napari.components import ViewerModel
+from napari.layers import Image
+
+
+class AddLayersSuite:
+    """Benchmarks for adding many small layers to the viewer model."""
+
+    param_names = ['n_layers']
+    params = [250, 1000]
+
+    def setup(self, n_layers):
+        self.viewer = ViewerModel()
+        self.layers = [Image(np.zeros((8, 8))) for _ in range(n_layers)]
+
+    def time_add_layers(self, n_layers):
+        """Time to add all layers in one batch."""
+        self.viewer.add_layers(self.layers)
+
+    def time_add_layers_looped(self, n_layers):
+        """Time to add all layers one at a time."""
+        for layer in self.layers:
+            self.viewer.layers.append(layer)
@@ -0,0 +1,57 @@
+# See "Writing benchmarks" in the asv docs for more information.
+# https://asv.readthedocs.io/en/latest/writing_benchmarks.html
+# or the napari documentation on benchmarking
+# https://github.com/napari/napari/blob/main/docs/BENCHMARKS.md
+import os
+
+import numpy as np
+from packaging.version import parse as parse_version
+from qtpy.QtWidgets import QApplication
+
+import napari
+
+NAPARI_0_4_19 = parse_version(napari.__version__) <= parse_version('0.4.19')
+
+
+class QtViewerViewPointsSuite:
+    """Benchmarks for updating the points visual in the viewer."""
+
+    params = [2**i for i in range(4, 22, 3)]
+
+    if 'PR' in os.environ:
+        skip_params = [(2**i,) for i in range(10, 22, 3)]
+
+    def setup(self, n):
+        _ = QApplication.instance() or QApplication([])
+        np.random.seed(0)
+        self.data = np.random.random((n, 2)) * 1000
+        self.symbol = np.random.choice(['disc', 'square', 'star'], n)
+        self.viewer = napari.Viewer()
+        self.layer = self.viewer.add_points(self.data, symbol=self.symbol)
+        if NAPARI_0_4_19:
+            self.visual = self.viewer.window._qt_viewer.layer_to_visual[
+                self.layer
+            ]
+        else:
+            self.visual = self.viewer.window._qt_viewer.canvas.layer_to_visual[
+                self.layer
+            ]
+
+    def teardown(self, n):
+        self.viewer.window.close()
+
+    def time_refresh(self, n):
+        """Time to refresh the points."""
+        self.layer.refresh()
+
+    def time_set_symbol(self, n):
+        """Time to set a symbol per point."""
+        self.layer.symbol = self.symbol
+
+    def time_set_face_color(self, n):
+        """Time to set the face color of all points."""
+        self.layer.face_color = 'red'
+
+    def time_set_border_width(self, n):
+        """Time to set the border width of all points."""
+        self.layer.border_width = 0.2
@@ -46,6 +46,9 @@ class TextManagerSuite:
     def time_create(self, n, string):
         TextManager(string=string, features=self.features)
 
+    def time_encode(self, n, string):
+        self.manager.string(self.features)
+
     def time_refresh(self, n, string):
         self.manager.refresh_text(self.features)
 
@@ -40,8 +40,17 @@ class TracksSuite:
         # create layer for the update benchmark
         self.layer = Tracks(self.data)
 
+        # every track but the first one is the child of the previous one
+        self.graph = {i: [i - 1] for i in range(1, n_tracks)}
+
     def time_create_layer(self, *_) -> None:
         Tracks(self.data)
 
     def time_update_layer(self, *_) -> None:
         self.layer.data = self.data
+
+    def time_set_graph(self, *_) -> None:
+        self.layer.graph = self.graph
+
+    def time_get_value(self, *_) -> None:
+        self.layer.get_value((1, 0.5, 0.5, 0.5))
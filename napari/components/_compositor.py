@@ -0,0 +1,430 @@
+"""Software rendering of a viewer with numpy, without OpenGL.
+
+The canvas of a viewer is rendered with vispy, which needs an OpenGL
+context, so machines without a GPU or a display cannot take screenshots.
+:func:`composite` renders the current 2D slices of the image, labels and
+points layers of a ``ViewerModel`` to an RGBA array instead, following what
+the vispy layers do: the same camera and layer transforms, contrast limits,
+gamma, colormaps, opacity and blending modes.
+
+The canvas is split into tiles, which are rendered in parallel threads.
+Other layer types and the canvas overlays (e.g. the scale bar) are not
+rendered, and neither are antialiasing or the selection highlights. Points
+are drawn as discs or squares, and overlapping translucent points show the
+one on top instead of blending with each other.
+"""
+
+from __future__ import annotations
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Callable, NamedTuple, Optional
+
+import numpy as np
+
+from napari.layers import Image, Labels, Points
+from napari.layers.points._points_constants import Symbol
+from napari.utils.colormaps.standardize_color import transform_color
+from napari.utils.theme import get_theme
+from napari.utils.translations import trans
+
+if TYPE_CHECKING:
+    from napari.components import ViewerModel
+    from napari.layers import Layer
+
+#: The number of rows and columns of the tiles rendered in parallel.
+DEFAULT_TILE_SIZE = 256
+
+
+class _Tile(NamedTuple):
+    """A tile of the canvas, with the world coordinates of its pixels."""
+
+    rows: slice
+    cols: slice
+    # world coordinates of the centers of the rows and of the columns
+    world_rows: np.ndarray
+    world_cols: np.ndarray
+
+
+#: Renders a layer in a tile, returning its colors and the drawn pixels.
+_Renderer = Callable[[_Tile], Optional[tuple[np.ndarray, np.ndarray]]]
+
+
+def composite(
+    viewer: ViewerModel,
+    size: Optional[tuple[int, int]] = None,
+    *,
+    tile_size: int = DEFAULT_TILE_SIZE,
+    max_workers: Optional[int] = None,
+) -> np.ndarray:
+    """Render the canvas of a viewer in 2D, without OpenGL.
+
+    Parameters
+    ----------
+    viewer : napari.components.ViewerModel
+        The viewer, displaying 2 dimensions.
+    size : tuple of int, optional
+        The (height, width) of the canvas. By default, the canvas size of
+        the viewer.
+    tile_size : int
+        The size of the tiles rendered in parallel.
+    max_workers : int, optional
+        The number of threads rendering the tiles.
+
+    Returns
+    -------
+    np.ndarray
+        The (height, width, 4) RGBA image of the canvas, of type uint8.
+    """
+    if viewer.dims.ndisplay != 2:
+        raise ValueError(
+            trans._(
+                'Only 2D canvases can be rendered without OpenGL.',
+                deferred=True,
+            )
+        )
+    height, width = size or viewer._canvas_size
+    background = transform_color(get_theme(viewer.theme).canvas.as_hex())[0]
+    canvas = np.empty((height, width, 4), dtype=np.float32)
+    canvas[...] = background
+
+    visible = [layer for layer in viewer.layers if layer.visible]
+    renderers = []
+    for layer in visible:
+        renderer = _make_renderer(layer, viewer.camera.zoom)
+        if renderer is not None:
+            # the bottommost visible layer blends differently with the
+            # canvas, see VispyBaseLayer._on_blending_change
+            renderers.append((renderer, layer.blending, layer is visible[0]))
+
+    center = np.asarray(viewer.camera.center[-2:], dtype=np.float64)
+    zoom = viewer.camera.zoom
+
+    def render_tile(tile: tuple[int, int]) -> None:
+        rows = slice(tile[0], min(tile[0] + tile_size, height))
+        cols = slice(tile[1], min(tile[1] + tile_size, width))
+        world_rows = (
+            center[0]
+            + (np.arange(rows.start, rows.stop) + 0.5 - height / 2) / zoom
+        )
+        world_cols = (
+            center[1]
+            + (np.arange(cols.start, cols.stop) + 0.5 - width / 2) / zoom
+        )
+        region = canvas[rows, cols]
+        for renderer, blending, first in renderers:
+            rendered = renderer(_Tile(rows, cols, world_rows, world_cols))
+            if rendered is not None:
+                _blend(region, *rendered, blending, first)
+
+    tiles = [
+        (row, col)
+        for row in range(0, height, tile_size)
+        for col in range(0, width, tile_size)
+    ]
+    with ThreadPoolExecutor(
+        max_workers=max_workers or min(8, os.cpu_count() or 1)
+    ) as executor:
+        list(executor.map(render_tile, tiles))
+    return np.round(np.clip(canvas, 0, 1) * 255).astype(np.uint8)
+
+
+def _blend(
+    dst: np.ndarray,
+    src: np.ndarray,
+    mask: np.ndarray,
+    blending: str,
+    first: bool,
+) -> None:
+    """Blend the colors of a layer into the drawn pixels of the canvas.
+
+    These are the blending functions of ``BLENDING_MODES``, applied to
+    colors with straight (not premultiplied) alpha.
+    """
+    src = src[mask]
+    under = dst[mask]
+    alpha = src[:, 3:]
+    out = np.empty_like(src)
+    if first:
+        if blending == 'minimum':
+            out[:, :3] = src[:, :3]
+        elif blending == 'additive':
+            out[:, :3] = src[:, :3] * alpha
+        else:
+            out[:, :3] = src[:, :3] * alpha + under[:, :3] * (1 - alpha)
+        out[:, 3] = src[:, 3] + under[:, 3]
+    elif blending == 'opaque':
+        out = src
+    elif blending == 'additive':
+        out[:, :3] = src[:, :3] * alpha + under[:, :3] * under[:, 3:]
+        out[:, 3] = src[:, 3] + under[:, 3]
+    elif blending == 'minimum':
+        out = np.minimum(src, under)
+    else:
+        out[:, :3] = src[:, :3] * alpha + under[:, :3] * (1 - alpha)
+        out[:, 3] = src[:, 3] + under[:, 3]
+    dst[mask] = np.clip(out, 0, 1)
+
+
+def _make_renderer(layer: Layer, zoom: float) -> Optional[_Renderer]:
+    if layer._slice_input.ndisplay != 2:
+        return None
+    if isinstance(layer, Labels):
+        return _make_labels_renderer(layer)
+    if isinstance(layer, Image):
+        return _make_image_renderer(layer)
+    if isinstance(layer, Points):
+        return _make_points_renderer(layer, zoom)
+    return None
+
+
+class _PixelSampler:
+    """Samples the pixels of the slice of an image or labels layer.
+
+    Like the vispy image visual, the pixel (i, j) of the slice covers the
+    square from (i - 0.5, j - 0.5) to (i + 0.5, j + 0.5) in data
+    coordinates, which are mapped to world coordinates by the layer
+    transforms.
+    """
+
+    def __init__(self, layer: Layer, values: np.ndarray) -> None:
+        self.values = values
+        displayed = layer._slice_input.displayed
+        transform = layer._transforms.simplified.set_slice(displayed)
+        offset = (
+            -layer._data_to_world.set_slice(displayed).linear_matrix
+            @ np.ones(2)
+            / 2
+        )
+        self.inverse = np.linalg.inv(transform.linear_matrix)
+        self.origin = transform.translate + offset
+        self.shape = np.array(values.shape[:2])
+
+    def texture_coords(self, tile: _Tile) -> np.ndarray:
+        """Return the (2, rows, cols) coordinates of a tile in the slice."""
+        world = np.stack(
+            np.meshgrid(
+                tile.world_rows - self.origin[0],
+                tile.world_cols - self.origin[1],
+                indexing='ij',
+            )
+        )
+        return np.einsum('ij,j...->i...', self.inverse, world)
+
+    def nearest(self, tile: _Tile) -> Optional[tuple[np.ndarray, np.ndarray]]:
+        """Return the nearest values of the pixels of a tile, and a mask of
+        the pixels inside the slice."""
+        if np.count_nonzero(self.inverse - np.diag(np.diag(self.inverse))):
+            coords = np.floor(self.texture_coords(tile)).astype(np.intp)
+            mask = np.all(
+                (coords >= 0) & (coords < self.shape[:, None, None]), 0
+            )
+            if not mask.any():
+                return None
+            coords = np.clip(coords, 0, (self.shape - 1)[:, None, None])
+            return self.values[coords[0], coords[1]], mask
+        # scaled and translated slices index rows and columns separately
+        rows = np.floor(
+            (tile.world_rows - self.origin[0]) * self.inverse[0, 0]
+        ).astype(np.intp)
+        cols = np.floor(
+            (tile.world_cols - self.origin[1]) * self.inverse[1, 1]
+        ).astype(np.intp)
+        in_rows = (rows >= 0) & (rows < self.shape[0])
+        in_cols = (cols >= 0) & (cols < self.shape[1])
+        if not (in_rows.any() and in_cols.any()):
+            return None
+        values = self.values[
+            np.ix_(
+                np.clip(rows, 0, self.shape[0] - 1),
+                np.clip(cols, 0, self.shape[1] - 1),
+            )
+        ]
+        return values, np.outer(in_rows, in_cols)
+
+    def linear(self, tile: _Tile) -> Optional[tuple[np.ndarray, np.ndarray]]:
+        """Return the bilinearly interpolated values of the pixels of a
+        tile, and a mask of the pixels inside the slice."""
+        coords = self.texture_coords(tile)
+        shape = self.shape[:, None, None]
+        mask = np.all((coords >= 0) & (coords < shape), 0)
+        if not mask.any():
+            return None
+        # texel centers are at half integers, and edges are clamped
+        coords = coords - 0.5
+        low = np.floor(coords)
+        weight = coords - low
+        low = low.astype(np.intp)
+        r0, c0 = np.clip(low, 0, shape - 1)
+        r1, c1 = np.clip(low + 1, 0, shape - 1)
+        wr, wc = weight
+        if self.values.ndim == 3:
+            wr, wc = wr[..., None], wc[..., None]
+        values = self.values.astype(np.float32, copy=False)
+        top = values[r0, c0] * (1 - wc) + values[r0, c1] * wc
+        bottom = values[r1, c0] * (1 - wc) + values[r1, c1] * wc
+        return top * (1 - wr) + bottom * wr, mask
+
+
+def _make_image_renderer(layer: Image) -> Optional[_Renderer]:
+    values = np.asarray(layer._slice.image.raw)
+    if values.ndim != (3 if layer.rgb else 2):
+        return None
+    sampler = _PixelSampler(layer, values)
+    sample = (
+        sampler.nearest
+        if layer.interpolation2d == 'nearest'
+        else sampler.linear
+    )
+    low, high = layer.contrast_limits
+    scale = 1 / (high - low) if high != low else 0
+    gamma = layer.gamma
+    colormap = layer.colormap
+    opacity = layer.opacity
+    alpha_scale = (
+        1 / np.iinfo(values.dtype).max
+        if np.issubdtype(values.dtype, np.integer)
+        else 1
+    )
+
+    def render(tile: _Tile) -> Optional[tuple[np.ndarray, np.ndarray]]:
+        sampled = sample(tile)
+        if sampled is None:
+            return None
+        sampled_values, mask = sampled
+        sampled_values = sampled_values.astype(np.float32, copy=False)
+        if layer.rgb:
+            rgba = np.ones(sampled_values.shape[:2] + (4,), dtype=np.float32)
+            rgba[..., :3] = (
+                np.clip((sampled_values[..., :3] - low) * scale, 0, 1) ** gamma
+            )
+            if sampled_values.shape[-1] == 4:
+                rgba[..., 3] = sampled_values[..., 3] * alpha_scale
+            nan = np.isnan(sampled_values).any(axis=-1)
+        else:
+            normalized = np.clip((sampled_values - low) * scale, 0, 1) ** gamma
+            rgba = colormap.map(np.nan_to_num(normalized).ravel())
+            rgba = rgba.reshape(normalized.shape + (4,)).astype(np.float32)
+            nan = np.isnan(sampled_values)
+        rgba[..., 3] *= opacity
+        return rgba, mask & ~nan
+
+    return render
+
+
+def _make_labels_renderer(layer: Labels) -> Optional[_Renderer]:
+    raw = np.asarray(layer._slice.image.raw)
+    if raw.ndim != 2:
+        return None
+    contour = layer._calculate_contour(
+        raw, tuple(slice(0, s) for s in raw.shape)
+    )
+    sampler = _PixelSampler(layer, raw if contour is None else contour)
+    colormap = layer.colormap
+    opacity = layer.opacity
+
+    def render(tile: _Tile) -> Optional[tuple[np.ndarray, np.ndarray]]:
+        sampled = sampler.nearest(tile)
+        if sampled is None:
+            return None
+        labels, mask = sampled
+        rgba = colormap.map(labels).astype(np.float32)
+        rgba[..., 3] *= opacity
+        return rgba, mask
+
+    return render
+
+
+def _make_points_renderer(layer: Points, zoom: float) -> Optional[_Renderer]:
+    if len(layer._indices_view) == 0:
+        return None
+    displayed = layer._slice_input.displayed
+    transform = layer._transforms.simplified.set_slice(displayed)
+    centers = (
+        layer._view_data @ transform.linear_matrix.T + transform.translate
+    )
+    # like the vispy markers, see VispyPointsLayer and the clamp_shader
+    scale = layer.scale[-1]
+    unclamped = np.maximum(layer._view_size * scale * zoom, 1e-12)
+    sizes = np.clip(unclamped, *layer.canvas_size_limits)
+    if layer.border_width_is_relative:
+        borders = layer._view_border_width * sizes
+    else:
+        borders = layer._view_border_width * scale * zoom * sizes / unclamped
+    outer = sizes / 2 + borders / 2
+    square = np.asarray(layer._view_symbol) == Symbol.SQUARE
+    face_colors = layer._view_face_color.astype(np.float32)
+    border_colors = layer._view_border_color.astype(np.float32)
+    opacity = layer.opacity
+
+    def render(tile: _Tile) -> Optional[tuple[np.ndarray, np.ndarray]]:
+        # the centers, in pixels of the tile
+        rows = (centers[:, 0] - tile.world_rows[0]) * zoom + 0.5
+        cols = (centers[:, 1] - tile.world_cols[0]) * zoom + 0.5
+        n_rows = tile.rows.stop - tile.rows.start
+        n_cols = tile.cols.stop - tile.cols.start
+        in_tile = np.flatnonzero(
+            (rows + outer > 0)
+            & (rows - outer < n_rows)
+            & (cols + outer > 0)
+            & (cols - outer < n_cols)
+        )
+        if len(in_tile) == 0:
+            return None
+        pixels, points, colors = [], [], []
+        radii = np.ceil(outer[in_tile]).astype(np.intp)
+        # points of the same radius share the offsets of their pixels
+        for radius in np.unique(radii):
+            group = in_tile[radii == radius]
+            offsets = np.arange(-radius, radius + 1)
+            offset_rows, offset_cols = (
+                a.ravel() for a in np.meshgrid(offsets, offsets, indexing='ij')
+            )
+            pixel_rows = np.floor(rows[group])[:, None].astype(np.intp) + (
+                offset_rows
+            )
+            pixel_cols = np.floor(cols[group])[:, None].astype(np.intp) + (
+                offset_cols
+            )
+            dr = np.abs(pixel_rows + 0.5 - rows[group, None])
+            dc = np.abs(pixel_cols + 0.5 - cols[group, None])
+            distance = np.where(
+                square[group, None], np.maximum(dr, dc), np.hypot(dr, dc)
+            ) - (sizes[group, None] / 2)
+            drawn = (
+                (distance <= borders[group, None] / 2)
+                & (pixel_rows >= 0)
+                & (pixel_rows < n_rows)
+                & (pixel_cols >= 0)
+                & (pixel_cols < n_cols)
+            )
+            face = distance < -borders[group, None] / 2
+            index, offset = np.nonzero(drawn)
+            pixels.append(
+                pixel_rows[index, offset] * n_cols + pixel_cols[index, offset]
+            )
+            points.append(group[index])
+            colors.append(
+                np.where(
+                    face[index, offset, None],
+                    face_colors[group[index]],
+                    border_colors[group[index]],
+                )
+            )
+        pixels = np.concatenate(pixels)
+        points = np.concatenate(points)
+        colors = np.concatenate(colors)
+        # the last point drawn on a pixel is on top
+        order = np.argsort(points, kind='stable')[::-1]
+        top_pixels, top = np.unique(pixels[order], return_index=True)
+        rgba = np.zeros((n_rows * n_cols, 4), dtype=np.float32)
+        mask = np.zeros(n_rows * n_cols, dtype=bool)
+        rgba[top_pixels] = colors[order[top]]
+        rgba[top_pixels, 3] *= opacity
+        mask[top_pixels] = True
+        return (
+            rgba.reshape(n_rows, n_cols, 4),
+            mask.reshape(n_rows, n_cols),
+        )
+
+    return render
@@ -19,6 +19,7 @@ from typing import (
     runtime_checkable,
 )
 
+from napari.components._slicing_processes import _SlicingProcessPool
 from napari.layers import Layer
 from napari.settings import get_settings
 from napari.utils.events.event import EmitterGroup, Event
@@ -102,6 +103,10 @@ class _LayerSlicer:
             manager for the slicing threading
         _force_sync: bool
             if true, forces slicing to execute synchronously
+        _process_pool : _SlicingProcessPool or None
+            worker processes that slice the image layers whose data can be
+            reopened, if enabled by the ``experimental.slicing_processes``
+            setting
         _layers_to_task : dict of tuples of layer weakrefs to futures
             task storage for cancellation logic
         _lock_layers_to_task : threading.RLock
@@ -111,6 +116,12 @@ class _LayerSlicer:
         self.events = EmitterGroup(source=self, ready=Event)
         self._executor: Executor = ThreadPoolExecutor(max_workers=1)
         self._force_sync = not get_settings().experimental.async_
+        slicing_processes = get_settings().experimental.slicing_processes
+        self._process_pool: Optional[_SlicingProcessPool] = (
+            _SlicingProcessPool(max_workers=slicing_processes)
+            if slicing_processes > 0
+            else None
+        )
         self._layers_to_task: dict[
             tuple[weakref.ReferenceType[Layer], ...], Future
         ] = {}
@@ -265,6 +276,8 @@ class _LayerSlicer:
         for task in tasks:
             task.cancel()
         self._executor.shutdown(wait=True)
+        if self._process_pool is not None:
+            self._process_pool.shutdown()
         self.events.disconnect()
         self.events.ready.disconnect()
 
@@ -283,7 +296,30 @@ class _LayerSlicer:
         dict[Layer, SliceResponse]: which contains the results of the slice
         """
         logger.debug('_LayerSlicer._slice_layers: %s', requests)
-        result = {layer: request() for layer, request in requests.items()}
+        futures = {}
+        if self._process_pool is not None:
+            # start slicing in the worker processes, to run concurrently
+            # with the requests sliced here
+            for layer, request in requests.items():
+                future = self._process_pool.submit(request)
+                if future is not None:
+                    futures[layer] = future
+        result = {
+            layer: request()
+            for layer, request in requests.items()
+            if layer not in futures
+        }
+        for layer, future in futures.items():
+            try:
+                result[layer] = self._process_pool.result(future)
+            except Exception:  # noqa: BLE001
+                logger.warning(
+                    'Slicing %s in a worker process failed, slicing it here',
+                    layer,
+                    exc_info=True,
+                )
+                result[layer] = requests[layer]()
+        result = {layer: result[layer] for layer in requests}
         self.events.ready(value=result)
         return result
 
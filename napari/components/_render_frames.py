@@ -0,0 +1,198 @@
+"""Rendering of a sequence of viewer states, e.g. to export a movie.
+
+Rendering the frames of many time points or camera angles one after the
+other alternates between slicing the layers, which waits on reading data,
+and rendering, which waits on the GPU or on software rendering.
+:func:`iter_frames` slices the layers for the next frame in background
+threads while the current frame is rendered, and :func:`write_frames`
+encodes the frames in a background thread while the next ones are
+rendered.
+
+The renderer is any function that renders the viewer in its current state
+to an image array, e.g. the ``render`` method of the offscreen canvas in
+``napari._vispy.offscreen``, which also provides ``export_movie``.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from collections.abc import Iterable, Iterator, Mapping
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from queue import Queue
+from typing import TYPE_CHECKING, Any, Callable, Union
+
+import numpy as np
+
+from napari.components._layer_slicer import _AsyncSliceable
+from napari.components.dims import Dims
+
+if TYPE_CHECKING:
+    from napari.components import ViewerModel
+    from napari.layers import Layer
+
+#: A viewer state, as updates of the viewer dims and camera, e.g.
+#: ``{'dims': {'current_step': (t, 0, 0)}, 'camera': {'angles': (0, a, 90)}}``
+ViewerState = Mapping[str, Mapping[str, Any]]
+
+
+def iter_frames(
+    viewer: ViewerModel,
+    states: Iterable[ViewerState],
+    render: Callable[[], np.ndarray],
+) -> Iterator[np.ndarray]:
+    """Yield the frames rendered for a sequence of viewer states.
+
+    The states are applied to the viewer one after the other, and the
+    layers are sliced for the next state while the current one is
+    rendered.
+
+    Parameters
+    ----------
+    viewer : ViewerModel
+        The viewer.
+    states : iterable of dict
+        The states of the viewer, as dicts with optional ``'dims'`` and
+        ``'camera'`` keys, whose values update ``viewer.dims`` and
+        ``viewer.camera``. Each state updates the previous one.
+    render : callable
+        The function that renders the viewer in its current state.
+
+    Yields
+    ------
+    np.ndarray
+        The frame rendered for each state.
+    """
+    slicer = viewer._layer_slicer
+    force_sync = slicer._force_sync
+    # Slices are applied here, without a viewer to handle async slices.
+    slicer._force_sync = True
+    executor = ThreadPoolExecutor(max_workers=min(4, os.cpu_count() or 1))
+    try:
+        states = iter(states)
+        state = next(states, None)
+        pending = _prefetch(viewer, state, executor)
+        while state is not None:
+            _apply(viewer, state, pending)
+            state = next(states, None)
+            pending = _prefetch(viewer, state, executor)
+            yield render()
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+        slicer._force_sync = force_sync
+
+
+def _prefetch(
+    viewer: ViewerModel,
+    state: ViewerState | None,
+    executor: ThreadPoolExecutor,
+) -> dict[Layer, Future]:
+    """Start slicing the layers for a state, without applying it."""
+    if state is None:
+        return {}
+    dims = Dims(**viewer.dims.dict())
+    dims.update(state.get('dims', {}))
+    pending = {}
+    for layer in viewer.layers:
+        if not (isinstance(layer, _AsyncSliceable) and layer.visible):
+            continue
+        request = layer._make_slice_request(dims)
+        if request.slice_input == layer._slice_input:
+            continue
+        layer._set_unloaded_slice_id(request.id)
+        pending[layer] = executor.submit(request)
+    return pending
+
+
+def _apply(
+    viewer: ViewerModel, state: ViewerState, pending: dict[Layer, Future]
+) -> None:
+    """Apply a state to the viewer, with the slices prefetched for it."""
+    for layer, future in pending.items():
+        response = future.result()
+        layer._update_slice_response(response)
+        layer._update_loaded_slice_id(response.request_id)
+        layer.events.set_data()
+        layer._update_thumbnail()
+        layer._set_highlight(force=True)
+    # The prefetched layers already have the slice input of the new dims,
+    # so only the other layers are sliced here.
+    viewer.dims.update(state.get('dims', {}))
+    viewer.camera.update(state.get('camera', {}))
+
+
+def write_frames(
+    frames: Iterable[np.ndarray],
+    path: Union[str, Path],
+    *,
+    fps: float = 24,
+) -> int:
+    """Write frames to a movie, or to a sequence of images.
+
+    The frames are encoded in a background thread, so the next frames are
+    rendered in the meantime.
+
+    Parameters
+    ----------
+    frames : iterable of np.ndarray
+        The frames, e.g. from :func:`iter_frames`.
+    path : str or Path
+        The path of the movie, in any format supported by imageio, e.g.
+        ``movie.mp4`` (with imageio-ffmpeg) or ``movie.gif``. A path with
+        an ``{index}`` field, e.g. ``frames/{index:05d}.png``, writes one
+        image per frame instead.
+    fps : float
+        The number of frames per second of the movie.
+
+    Returns
+    -------
+    int
+        The number of frames written.
+    """
+    path = str(path)
+    if '{' in path:
+
+        def write(index: int, frame: np.ndarray) -> None:
+            from napari.utils.io import imsave
+
+            imsave(path.format(index=index), frame)
+
+        close: Callable[[], None] = lambda: None  # noqa: E731
+    else:
+        import imageio.v2 as iio
+
+        writer = iio.get_writer(path, fps=fps)
+        write = lambda index, frame: writer.append_data(frame)  # noqa: E731
+        close = writer.close
+
+    # Frames are rendered at most two frames ahead of the encoder.
+    queue: Queue = Queue(maxsize=2)
+    errors: list[BaseException] = []
+
+    def encode() -> None:
+        index = 0
+        while (frame := queue.get()) is not None:
+            if not errors:
+                try:
+                    write(index, frame)
+                except BaseException as e:  # noqa: BLE001
+                    errors.append(e)
+            index += 1
+
+    thread = threading.Thread(target=encode, daemon=True)
+    thread.start()
+    count = 0
+    try:
+        for frame in frames:
+            if errors:
+                break
+            queue.put(frame)
+            count += 1
+    finally:
+        queue.put(None)
+        thread.join()
+        close()
+    if errors:
+        raise errors[0]
+    return count
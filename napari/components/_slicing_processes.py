@@ -0,0 +1,247 @@
+"""Slicing of image layers in worker processes.
+
+Some array backends (e.g. pure Python TIFF decoders, compressed HDF5
+datasets, or custom data wrappers) hold the GIL while decoding data, so
+slicing them in a thread does not run in parallel with the main thread or
+with other layers. When enabled with the ``experimental.slicing_processes``
+setting, image slice requests whose data can be reopened in another process
+are run in a pool of worker processes instead.
+
+The data is described by a picklable :class:`DataSource`, which each worker
+opens once and keeps open. Zarr arrays stored in directories, numpy memory
+maps, HDF5 datasets and multiscale data made of those are supported, and
+other data can opt in by implementing a ``__napari_data_source__`` method
+that returns a :class:`DataSource`. The sliced images are returned through
+shared memory, which the main process maps without copying.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import logging
+import mmap
+import multiprocessing
+from concurrent.futures import Future, ProcessPoolExecutor
+from contextlib import nullcontext
+from functools import lru_cache
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Callable, NamedTuple, Optional
+
+import numpy as np
+
+from napari.layers._multiscale_data import MultiScaleData
+from napari.layers.image._slice import (
+    _ImageSliceRequest,
+    _ImageSliceResponse,
+    _ImageView,
+)
+from napari.utils._shared_memory import shared_memory_array
+from napari.utils.misc import _is_array_type
+
+logger = logging.getLogger('napari.components._slicing_processes')
+
+
+class DataSource(NamedTuple):
+    """A picklable description of how to open layer data in another process.
+
+    Attributes
+    ----------
+    opener : callable
+        A module level function that returns the data.
+    args : tuple
+        The positional arguments of the opener.
+    kwargs : tuple of (str, Any) pairs
+        The keyword arguments of the opener.
+    """
+
+    opener: Callable[..., Any]
+    args: tuple = ()
+    kwargs: tuple[tuple[str, Any], ...] = ()
+
+    def open(self) -> Any:
+        """Open the data."""
+        return self.opener(*self.args, **dict(self.kwargs))
+
+
+def get_data_source(data: Any) -> Optional[DataSource]:
+    """Return the source of layer data, or None if it cannot be reopened.
+
+    Parameters
+    ----------
+    data : array-like or MultiScaleData
+        The data of an image layer.
+
+    Returns
+    -------
+    DataSource or None
+        The description of how to open the data in another process.
+    """
+    if hasattr(data, '__napari_data_source__'):
+        return data.__napari_data_source__()
+    if isinstance(data, MultiScaleData):
+        levels = tuple(get_data_source(level) for level in data)
+        if None in levels:
+            return None
+        return DataSource(_open_multiscale, levels)
+    if isinstance(data, np.memmap):
+        # views of a memory map share its file offset, so only the memory
+        # map itself can be reopened
+        if not isinstance(data.base, mmap.mmap) or data.filename is None:
+            return None
+        order = (
+            'F'
+            if data.flags.f_contiguous and not data.flags.c_contiguous
+            else 'C'
+        )
+        return DataSource(
+            np.memmap,
+            (data.filename,),
+            (
+                ('dtype', data.dtype),
+                ('mode', 'r'),
+                ('offset', data.offset),
+                ('shape', data.shape),
+                ('order', order),
+            ),
+        )
+    if _is_array_type(data, 'zarr.Array'):
+        import zarr
+
+        if isinstance(data.store, zarr.storage.DirectoryStore):
+            return DataSource(
+                zarr.open_array,
+                (data.store.path,),
+                (('path', data.path), ('mode', 'r')),
+            )
+        return None
+    if _is_array_type(data, 'h5py.Dataset'):
+        return DataSource(_open_hdf5, (data.file.filename, data.name))
+    return None
+
+
+def _open_multiscale(*levels: DataSource) -> list:
+    return [level.open() for level in levels]
+
+
+def _open_hdf5(filename: str, name: str) -> Any:
+    import h5py
+
+    return h5py.File(filename, 'r')[name]
+
+
+class _SharedArray(NamedTuple):
+    """The shared memory block holding an array."""
+
+    name: str
+    shape: tuple[int, ...]
+    dtype: np.dtype
+
+
+def _to_shared(array: np.ndarray) -> _SharedArray:
+    """Copy an array to a new shared memory block."""
+    shared_memory = SharedMemory(create=True, size=max(array.nbytes, 1))
+    shared = _SharedArray(shared_memory.name, array.shape, array.dtype)
+    np.ndarray(array.shape, dtype=array.dtype, buffer=shared_memory.buf)[
+        ...
+    ] = array
+    shared_memory.close()
+    return shared
+
+
+def _from_shared(shared: _SharedArray) -> np.ndarray:
+    """Map an array from a shared memory block, without copying it."""
+    shared_memory = SharedMemory(name=shared.name)
+    # the memory stays mapped until the returned array is deleted
+    shared_memory.unlink()
+    return shared_memory_array(shared_memory, shared.shape, shared.dtype)
+
+
+@lru_cache(maxsize=16)
+def _open(source: DataSource) -> Any:
+    return source.open()
+
+
+def _slice_in_worker(
+    request: _ImageSliceRequest, source: DataSource
+) -> tuple[_ImageSliceResponse, _SharedArray, Optional[_SharedArray]]:
+    """Slice reopened data in a worker process."""
+    request = dataclasses.replace(
+        request, data=_open(source), dask_indexer=nullcontext
+    )
+    response = request()
+    image = _to_shared(response.image.raw)
+    thumbnail = (
+        None
+        if response.thumbnail is response.image
+        else _to_shared(response.thumbnail.raw)
+    )
+    empty = _ImageView.from_view(np.empty((0,)))
+    return (
+        dataclasses.replace(response, image=empty, thumbnail=empty),
+        image,
+        thumbnail,
+    )
+
+
+def _receive(
+    result: tuple[_ImageSliceResponse, _SharedArray, Optional[_SharedArray]],
+) -> _ImageSliceResponse:
+    response, image, thumbnail = result
+    image_view = _ImageView.from_view(_from_shared(image))
+    thumbnail_view = (
+        image_view
+        if thumbnail is None
+        else _ImageView.from_view(_from_shared(thumbnail))
+    )
+    return dataclasses.replace(
+        response, image=image_view, thumbnail=thumbnail_view
+    )
+
+
+class _SlicingProcessPool:
+    """A pool of worker processes that slice image layers.
+
+    Parameters
+    ----------
+    max_workers : int
+        The number of worker processes.
+    """
+
+    def __init__(self, max_workers: int) -> None:
+        # forking a process with a running Qt application is not safe
+        self._executor = ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=multiprocessing.get_context('spawn'),
+        )
+
+    def submit(
+        self, request: Any
+    ) -> Optional[Future[tuple[_ImageSliceResponse, Any, Any]]]:
+        """Submit a slice request to the worker processes.
+
+        Parameters
+        ----------
+        request : slice request
+            The slice request of a layer.
+
+        Returns
+        -------
+        Future or None
+            The future result to pass to :meth:`result`, or None if the
+            request cannot be sliced in another process.
+        """
+        if not isinstance(request, _ImageSliceRequest):
+            return None
+        source = get_data_source(request.data)
+        if source is None:
+            return None
+        shippable = dataclasses.replace(request, data=None, dask_indexer=None)
+        return self._executor.submit(_slice_in_worker, shippable, source)
+
+    @staticmethod
+    def result(future: Future) -> _ImageSliceResponse:
+        """Return the slice response of a submitted request."""
+        return _receive(future.result())
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=True, cancel_futures=True)
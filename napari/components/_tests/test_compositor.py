@@ -0,0 +1,109 @@
+import numpy as np
+import pytest
+
+from napari.components import ViewerModel
+from napari.components._compositor import composite
+
+
+def _viewer(size=(300, 400)):
+    viewer = ViewerModel()
+    viewer._canvas_size = size
+    return viewer
+
+
+def test_composite_image_colors_and_placement():
+    viewer = _viewer()
+    viewer.add_image(np.arange(100, dtype=float).reshape(10, 10))
+    viewer.reset_view()
+
+    image = composite(viewer, tile_size=64)
+
+    assert image.shape == (300, 400, 4)
+    assert image.dtype == np.uint8
+    # the center of the canvas is in the center of pixel (5, 5)
+    np.testing.assert_array_equal(image[150, 200], [142, 142, 142, 255])
+    # the left edge of the image is column 0 of row 5
+    np.testing.assert_array_equal(image[150, 60], [129, 129, 129, 255])
+    # outside the image, the canvas is the background of the theme
+    assert image[150, 5, 3] == 255
+    assert not np.array_equal(image[150, 5], image[150, 60])
+
+
+def test_composite_image_translate_and_contrast():
+    viewer = _viewer((100, 100))
+    viewer.add_image(
+        np.ones((4, 4)),
+        translate=(4, 4),
+        scale=(2, 2),
+        contrast_limits=(0, 2),
+        gamma=2,
+    )
+    viewer.camera.center = (7, 7)
+    viewer.camera.zoom = 10
+
+    image = composite(viewer)
+
+    # the layer covers world [3, 11), so its corner is at canvas pixel 10
+    expected = round(0.5**2 * 255)
+    np.testing.assert_array_equal(image[50, 50, :3], expected)
+    np.testing.assert_array_equal(image[11, 11, :3], expected)
+    assert image[9, 9, 0] != expected
+
+
+def test_composite_additive_blending():
+    viewer = _viewer((50, 50))
+    viewer.add_image(np.ones((5, 5)), colormap='red', contrast_limits=(0, 1))
+    viewer.add_image(
+        np.ones((5, 5)),
+        colormap='green',
+        contrast_limits=(0, 2),
+        blending='additive',
+    )
+    viewer.reset_view()
+
+    image = composite(viewer)
+
+    np.testing.assert_array_equal(image[25, 25], [255, 128, 0, 255])
+
+
+def test_composite_points_on_image():
+    viewer = _viewer((100, 100))
+    viewer.add_image(np.zeros((10, 10)))
+    viewer.add_points(
+        [[2, 7]], size=2, face_color='red', border_width=0, opacity=1
+    )
+    viewer.camera.center = (4.5, 4.5)
+    viewer.camera.zoom = 10
+
+    image = composite(viewer)
+
+    # the center of the point is at canvas pixel (45 + 25, 45 - 25)
+    np.testing.assert_array_equal(image[25, 75], [255, 0, 0, 255])
+    # with a radius of 10 canvas pixels
+    np.testing.assert_array_equal(image[25, 83], [255, 0, 0, 255])
+    np.testing.assert_array_equal(image[25, 88], [0, 0, 0, 255])
+
+
+def test_composite_labels_opacity():
+    viewer = _viewer((50, 50))
+    data = np.zeros((5, 5), dtype=np.uint8)
+    data[2:, 2:] = 3
+    viewer.add_image(np.zeros((5, 5)))
+    layer = viewer.add_labels(data, opacity=0.5)
+    viewer.reset_view()
+
+    image = composite(viewer)
+
+    color = layer.colormap.map(np.array([3]))[0]
+    expected = np.round(color[:3] * 0.5 * 255)
+    np.testing.assert_allclose(image[45, 45, :3], expected, atol=1)
+    # background labels are transparent
+    np.testing.assert_array_equal(image[5, 5], [0, 0, 0, 255])
+
+
+def test_composite_3d_raises():
+    viewer = _viewer()
+    viewer.add_image(np.zeros((3, 4, 4)))
+    viewer.dims.ndisplay = 3
+    with pytest.raises(ValueError, match='2D'):
+        composite(viewer)
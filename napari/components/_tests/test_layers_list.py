@@ -7,6 +7,7 @@ import pytest
 from napari.components import LayerList
 from napari.layers import Image
 from napari.layers.utils._link_layers import get_linked_layers
+from napari.utils.naming import inc_name_count
 
 
 def test_empty_layers_list():
@@ -495,6 +496,38 @@ def test_world_extent_mixed_ndim():
     np.testing.assert_allclose(layers.extent.step, (4, 6, 2))
 
 
+def test_world_extent_updates_with_layers():
+    """Test world extent after moving, replacing and removing layers."""
+    layers = LayerList()
+    layer_a = Image(np.zeros((10, 10)))
+    layer_b = Image(np.zeros((5, 4, 5)), translate=(0, 2, 3))
+    layers.extend([layer_a, layer_b])
+    np.testing.assert_allclose(layers.extent.world, [[0, 0, 0], [4, 9, 9]])
+
+    # moving a layer within the extent keeps the other bounds
+    layer_b.translate = (0, 1, 1)
+    np.testing.assert_allclose(layers.extent.world, [[0, 0, 0], [4, 9, 9]])
+
+    # moving the layer that sets a bound moves the bound
+    layer_a.translate = (-5, 0)
+    np.testing.assert_allclose(layers.extent.world, [[0, -5, 0], [4, 4, 9]])
+    layer_a.scale = (0.5, 0.5)
+    np.testing.assert_allclose(layers.extent.world, [[0, -5, 0], [4, 4, 5]])
+    np.testing.assert_allclose(layers.extent.step, (1, 0.5, 0.5))
+
+    layers[0] = Image(np.zeros((3, 3)), translate=(20, 20))
+    np.testing.assert_allclose(layers.extent.world, [[0, 1, 1], [4, 22, 22]])
+    layer_a.translate = (-100, -100)
+    np.testing.assert_allclose(layers.extent.world, [[0, 1, 1], [4, 22, 22]])
+
+    # removing the only 3D layer removes the first dimension
+    layers.remove(layer_b)
+    np.testing.assert_allclose(layers.extent.world, [[20, 20], [22, 22]])
+    np.testing.assert_allclose(layers.extent.step, (1, 1))
+    layers.clear()
+    np.testing.assert_allclose(layers.extent.world, [[0, 0], [511, 511]])
+
+
 def test_world_extent_mixed_flipped():
     """Test world extent after adding data with a flip."""
     # Flipped data results in a negative scale value which should be
@@ -539,6 +572,51 @@ def test_name_uniqueness():
     assert [x.name for x in layers] == ['Image [1]', 'Image', 'Image [2]']
 
 
+def test_name_uniqueness_scales_linearly(monkeypatch):
+    """Adding many same-named layers should not rescan earlier names."""
+    from napari.components import layerlist
+
+    calls = []
+
+    def counting_inc_name_count(name):
+        calls.append(name)
+        return inc_name_count(name)
+
+    monkeypatch.setattr(layerlist, 'inc_name_count', counting_inc_name_count)
+    layers = LayerList()
+    n = 100
+    for _i in range(n):
+        layers.append(Image(np.zeros((4, 4)), name='Image'))
+    assert len(calls) < 2 * n
+    assert [x.name for x in layers] == ['Image'] + [
+        f'Image [{i}]' for i in range(1, n)
+    ]
+
+    # freed names are reused
+    layers.remove('Image [3]')
+    layers.append(Image(np.zeros((4, 4)), name='Image'))
+    assert layers[-1].name == 'Image [3]'
+
+    # renamed layers release their old name
+    layers['Image [5]'].name = 'other'
+    layers.append(Image(np.zeros((4, 4)), name='Image'))
+    assert layers[-1].name == 'Image [5]'
+
+
+def test_index_after_changes():
+    layers = LayerList(Image(np.zeros((4, 4))) for _i in range(5))
+    a, b, c, d, e = layers
+    layers.remove(b)
+    layers.insert(0, b)
+    layers.move(4, 1)
+    assert list(layers) == [b, e, a, c, d]
+    for i, layer in enumerate(layers):
+        assert layers.index(layer) == i
+    assert layers.index(e.name) == 1
+    with pytest.raises(ValueError, match='not in list'):
+        layers.index(Image(np.zeros((4, 4))))
+
+
 def test_readd_layers():
     layers = LayerList()
     imgs = []
@@ -0,0 +1,64 @@
+from multiprocessing.managers import SharedMemoryManager
+
+import numpy as np
+import pytest
+
+from napari.components.experimental.monitor._shared import (
+    SHARED_ARRAY_KEY,
+    SharedArrays,
+    map_shared_arrays,
+)
+
+
+@pytest.fixture()
+def shared_arrays():
+    manager = SharedMemoryManager()
+    manager.start()
+    shared_arrays = SharedArrays(manager)
+    yield shared_arrays
+    shared_arrays.close()
+    manager.shutdown()
+
+
+def test_publish_and_map(shared_arrays):
+    image = np.arange(12, dtype=np.uint16).reshape(3, 4)
+    points = np.random.random((5, 3))
+    data = {
+        'layers': {1: {'name': 'a', 'slice': image}},
+        'points': [points, 'other'],
+        'labels': np.array(['x', None], dtype=object),
+    }
+
+    published = shared_arrays.publish('poll', data)
+
+    descriptor = published['layers'][1]['slice'][SHARED_ARRAY_KEY]
+    assert descriptor['shape'] == [3, 4]
+    assert descriptor['dtype'] == image.dtype.str
+    assert published['points'][1] == 'other'
+    # object arrays cannot be shared, so they are left as they are
+    assert published['labels'] is data['labels']
+
+    mapped = map_shared_arrays(published)
+    assert mapped['layers'][1]['name'] == 'a'
+    np.testing.assert_array_equal(mapped['layers'][1]['slice'], image)
+    np.testing.assert_array_equal(mapped['points'][0], points)
+    assert mapped['points'][0].ctypes.data % 64 == 0
+
+
+def test_publish_double_buffers(shared_arrays):
+    first = shared_arrays.publish('key', np.zeros(10))
+    mapped_first = map_shared_arrays(first)
+    second = shared_arrays.publish('key', np.ones(10))
+    third = shared_arrays.publish('key', np.full(10, 2.0))
+
+    names = [d[SHARED_ARRAY_KEY]['name'] for d in (first, second, third)]
+    assert names[0] != names[1]
+    assert names[0] == names[2]
+    np.testing.assert_array_equal(map_shared_arrays(second), 1)
+    # the mapped array is a view of the buffer, which is written again
+    np.testing.assert_array_equal(mapped_first, 2)
+
+    # a larger array needs a larger buffer
+    fourth = shared_arrays.publish('key', np.arange(1000.0))
+    assert fourth[SHARED_ARRAY_KEY]['name'] not in names
+    np.testing.assert_array_equal(map_shared_arrays(fourth), np.arange(1000.0))
@@ -0,0 +1,116 @@
+from multiprocessing.shared_memory import SharedMemory
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from napari.components import LayerList
+from napari.components.experimental.remote._commands import RemoteCommands
+from napari.layers import Image, Points
+from napari.utils._shared_memory import shared_memory_array
+
+
+@pytest.fixture()
+def ring():
+    """A ring buffer of 4 frames of 3x5 pixels in shared memory."""
+    shape, dtype = (4, 3, 5), np.dtype(np.uint16)
+    shared_memory = SharedMemory(create=True, size=60 * dtype.itemsize)
+    descriptor = {
+        'name': shared_memory.name,
+        'shape': list(shape),
+        'dtype': dtype.str,
+        'offset': 0,
+    }
+    yield shared_memory_array(shared_memory, shape, dtype), descriptor
+    shared_memory.unlink()
+
+
+def _run(commands, command):
+    commands.process_command(SimpleNamespace(command=command))
+
+
+def test_append_frame_image(ring):
+    frames, descriptor = ring
+    layers = LayerList([Image(np.zeros((1, 3, 5), dtype=np.uint16))])
+    name = layers[0].name
+    commands = RemoteCommands(layers)
+    _run(
+        commands, {'attach_ring': {'layer': name, 'shared_array': descriptor}}
+    )
+
+    for i in range(6):
+        frames[i % 4] = i + 1
+        _run(commands, {'append_frame': {'layer': name, 'slot': i % 4}})
+
+    data = layers[0].data
+    assert data.shape == (7, 3, 5)
+    # the frames are copied out of the ring
+    frames[:] = 0
+    np.testing.assert_array_equal(data[:, 0, 0], [0, 1, 2, 3, 4, 5, 6])
+
+
+def test_append_frame_replaces_image_in_place(ring):
+    frames, descriptor = ring
+    data = np.zeros((3, 5), dtype=np.uint16)
+    layers = LayerList([Image(data)])
+    name = layers[0].name
+    commands = RemoteCommands(layers)
+    _run(
+        commands, {'attach_ring': {'layer': name, 'shared_array': descriptor}}
+    )
+
+    frames[2] = 7
+    _run(commands, {'append_frame': {'layer': name, 'slot': 2}})
+
+    assert layers[0].data is data
+    np.testing.assert_array_equal(data, 7)
+
+
+def test_append_frame_points():
+    shared_memory = SharedMemory(create=True, size=2 * 10 * 2 * 8)
+    frames = shared_memory_array(shared_memory, (2, 10, 2), np.float64)
+    layers = LayerList([Points(np.zeros((1, 2)))])
+    name = layers[0].name
+    commands = RemoteCommands(layers)
+    descriptor = {
+        'name': shared_memory.name,
+        'shape': [2, 10, 2],
+        'dtype': '<f8',
+        'offset': 0,
+    }
+    _run(
+        commands, {'attach_ring': {'layer': name, 'shared_array': descriptor}}
+    )
+
+    frames[1, :3] = [[1, 2], [3, 4], [5, 6]]
+    _run(commands, {'append_frame': {'layer': name, 'slot': 1, 'length': 3}})
+
+    np.testing.assert_array_equal(
+        layers[0].data, [[0, 0], [1, 2], [3, 4], [5, 6]]
+    )
+    _run(commands, {'detach_ring': {'layer': name}})
+    assert not commands._rings
+    shared_memory.unlink()
+
+
+@pytest.mark.parametrize(
+    'command',
+    [
+        {'detach_ring': 'Image'},
+        {'attach_ring': {'layer': 'Image'}},
+        {'append_frame': {'slot': 0}},
+        {'append_frame': {'layer': 'Image', 'slot': 4}},
+    ],
+)
+def test_malformed_command_is_ignored(ring, caplog, command):
+    _frames, descriptor = ring
+    layers = LayerList([Image(np.zeros((3, 5), dtype=np.uint16))])
+    commands = RemoteCommands(layers)
+    _run(
+        commands,
+        {'attach_ring': {'layer': 'Image', 'shared_array': descriptor}},
+    )
+
+    _run(commands, command)
+    assert 'Malformed RemoteCommands' in caplog.text
+    assert list(commands._rings) == ['Image']
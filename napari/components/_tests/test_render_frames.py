@@ -0,0 +1,58 @@
+import numpy as np
+import pytest
+from imageio.v3 import imiter, imread
+
+from napari.components import ViewerModel
+from napari.components._render_frames import iter_frames, write_frames
+
+
+def _render_slice(layer):
+    """Render the current slice of an image layer, like a canvas would."""
+    return lambda: np.asarray(layer._slice.image.raw).copy()
+
+
+def test_iter_frames():
+    viewer = ViewerModel()
+    data = np.arange(5)[:, None, None] * np.ones((5, 4, 6), dtype=np.uint8)
+    layer = viewer.add_image(data)
+    points = viewer.add_points([[1, 1, 1], [3, 2, 2]])
+    states = [{'dims': {'current_step': (t, 0, 0)}} for t in (1, 3, 3, 0)]
+    viewer._layer_slicer._force_sync = False
+
+    frames = []
+    for frame in iter_frames(viewer, states, _render_slice(layer)):
+        frames.append(frame)
+        # the viewer is in the state of the frame, and its layers too
+        assert viewer.dims.point[0] == layer._slice_input.world_slice.point[0]
+        t = viewer.dims.current_step[0]
+        assert points._indices_view.tolist() == (
+            [0] if t == 1 else [1] if t == 3 else []
+        )
+
+    assert [f[0, 0] for f in frames] == [1, 3, 3, 0]
+    assert viewer.dims.current_step == (0, 0, 0)
+    assert not viewer._layer_slicer._force_sync
+
+
+def test_iter_frames_camera():
+    viewer = ViewerModel()
+    viewer.add_image(np.zeros((4, 6)))
+    states = [{'camera': {'zoom': z}} for z in (1, 2)]
+
+    zooms = list(iter_frames(viewer, states, lambda: viewer.camera.zoom))
+
+    assert zooms == [1, 2]
+
+
+@pytest.mark.parametrize('name', ['movie.gif', 'frame_{index:02d}.png'])
+def test_write_frames(tmp_path, name):
+    frames = [np.full((8, 10, 4), 40 * i, dtype=np.uint8) for i in range(3)]
+
+    assert write_frames(iter(frames), tmp_path / name, fps=10) == 3
+
+    if '{' in name:
+        images = [imread(tmp_path / name.format(index=i)) for i in range(3)]
+    else:
+        images = list(imiter(tmp_path / name))
+    assert len(images) == 3
+    assert [image[0, 0, 0] for image in images] == [0, 40, 80]
@@ -0,0 +1,84 @@
+import numpy as np
+import pytest
+import zarr
+
+from napari.components import Dims
+from napari.components._layer_slicer import _LayerSlicer
+from napari.components._slicing_processes import (
+    _from_shared,
+    _SlicingProcessPool,
+    _to_shared,
+    get_data_source,
+)
+from napari.layers import Image, Labels
+from napari.utils._shared_memory import _SharedMemoryOwner
+
+
+def test_get_data_source_memmap(tmp_path):
+    data = np.memmap(
+        tmp_path / 'data.raw', dtype=np.uint16, mode='w+', shape=(4, 5)
+    )
+    data[:] = np.arange(20).reshape(4, 5)
+    data.flush()
+    source = get_data_source(data)
+    np.testing.assert_array_equal(source.open(), data)
+    # views of a memory map cannot be reopened
+    assert get_data_source(data[1:]) is None
+    assert get_data_source(np.zeros(3)) is None
+
+
+def test_get_data_source_zarr(tmp_path):
+    data = zarr.open(
+        str(tmp_path / 'data.zarr'), mode='w', shape=(4, 5), dtype=np.uint8
+    )
+    data[:] = 3
+    np.testing.assert_array_equal(get_data_source(data).open(), data[:])
+    assert get_data_source(zarr.zeros((4, 5))) is None
+
+
+def test_shared_array_round_trip():
+    array = np.arange(12, dtype=np.float32).reshape(3, 4)
+    shared = _from_shared(_to_shared(array))
+    np.testing.assert_array_equal(shared, array)
+    assert isinstance(shared.base, _SharedMemoryOwner)
+
+
+@pytest.fixture()
+def process_layer_slicer():
+    layer_slicer = _LayerSlicer()
+    layer_slicer._force_sync = False
+    # as set up by the experimental.slicing_processes setting
+    layer_slicer._process_pool = _SlicingProcessPool(max_workers=2)
+    yield layer_slicer
+    layer_slicer.shutdown()
+
+
+def test_slice_in_processes(process_layer_slicer, tmp_path):
+    data = zarr.open(
+        str(tmp_path / 'image.zarr'),
+        mode='w',
+        shape=(8, 7, 6),
+        chunks=(1, 7, 6),
+        dtype=np.float32,
+    )
+    data[:] = np.random.default_rng(0).random((8, 7, 6))
+    labels_data = zarr.open(
+        str(tmp_path / 'labels.zarr'), mode='w', shape=(8, 7, 6), dtype=int
+    )
+    labels_data[2, 3, 4] = 5
+    image = Image(data, multiscale=False)
+    labels = Labels(labels_data, multiscale=False)
+    in_memory = Image(np.ones((8, 7, 6)))
+    dims = Dims(ndim=3, ndisplay=2, point=(2, 0, 0))
+
+    future = process_layer_slicer.submit(
+        layers=[image, labels, in_memory], dims=dims
+    )
+    # the results are keyed by weak references to the layers
+    result = {ref(): response for ref, response in future.result(60).items()}
+    assert list(result) == [image, labels, in_memory]
+    np.testing.assert_array_equal(result[image].image.raw, data[2])
+    assert isinstance(result[image].image.raw.base, _SharedMemoryOwner)
+    np.testing.assert_array_equal(result[labels].image.raw, labels_data[2])
+    np.testing.assert_array_equal(result[in_memory].image.raw, 1)
+    assert not isinstance(result[in_memory].image.raw.base, _SharedMemoryOwner)
@@ -1,7 +1,9 @@
+import numpy as np
 import pytest
 
 from napari.components._viewer_key_bindings import (
     hold_for_pan_zoom,
+    jump_to_selected_label,
     show_only_layer_above,
     show_only_layer_below,
     toggle_selected_visibility,
@@ -9,6 +11,7 @@ from napari.components._viewer_key_bindings import (
     toggle_unselected_visibility,
 )
 from napari.components.viewer_model import ViewerModel
+from napari.layers.labels import Labels
 from napari.layers.points import Points
 from napari.settings import get_settings
 from napari.utils.theme import available_themes, get_system_theme
@@ -153,3 +156,19 @@ def make_viewer_with_three_layers():
     viewer.layers.append(layer2)
     viewer.layers.append(layer3)
     return viewer
+
+
+def test_jump_to_selected_label():
+    data = np.zeros((10, 20, 20), dtype=np.uint8)
+    data[6:9, 12:15, 2:5] = 3
+    viewer = ViewerModel()
+    layer = viewer.add_layer(Labels(data, scale=(1, 2, 2)))
+    layer.selected_label = 3
+    jump_to_selected_label(viewer)
+    assert viewer.dims.point == (7, 26, 6)
+    assert viewer.camera.center[-2:] == (26, 6)
+
+    # a missing label does not move the view
+    layer.selected_label = 4
+    jump_to_selected_label(viewer)
+    assert viewer.dims.point == (7, 26, 6)
@@ -41,6 +41,43 @@ def test_add_image():
     assert viewer.dims.ndim == 2
 
 
+def test_add_layers():
+    """Test adding many layers at once."""
+    viewer = ViewerModel()
+    tiles = [
+        Image(np.full((4, 8, 8), i), translate=(0, 0, 8 * i)) for i in range(5)
+    ]
+    inserted = []
+    viewer.layers.events._batch_inserted.connect(
+        lambda e: inserted.append(e.value)
+    )
+
+    added = viewer.add_layers(tiles)
+
+    assert added == tiles
+    assert list(viewer.layers) == tiles
+    assert inserted == [tiles]
+    assert viewer.dims.range[2] == (0, 39, 1)
+    # the dims are centered, as when adding the first layer
+    assert viewer.dims.current_step[0] == 1
+    for i, layer in enumerate(tiles):
+        assert layer._slice_input.world_slice.point[0] == 1
+        np.testing.assert_array_equal(layer._slice.image.raw, i)
+
+
+def test_batch_insert():
+    """Test that layers added in a batch are updated at its end."""
+    viewer = ViewerModel()
+    viewer.add_image(np.zeros((10, 10)))
+    with viewer.layers.batch_insert():
+        viewer.add_image(np.zeros((20, 10)))
+        removed = viewer.add_image(np.zeros((30, 10)))
+        viewer.layers.remove(removed)
+        viewer.add_image(np.zeros((5, 10)), translate=(100, 0))
+        assert viewer.dims.range[0] == (0, 19, 1)
+    assert viewer.dims.range[0] == (0, 104, 1)
+
+
 def test_add_image_multichannel_share_memory():
     viewer = ViewerModel()
     image = np.random.random((10, 5, 64, 64))
@@ -4,6 +4,7 @@ from typing import TYPE_CHECKING
 
 from napari.components.viewer_model import ViewerModel
 from napari.utils.action_manager import action_manager
+from napari.utils.notifications import show_info
 from napari.utils.theme import available_themes, get_system_theme
 from napari.utils.translations import trans
 
@@ -186,6 +187,36 @@ def hold_for_pan_zoom(viewer: ViewerModel):
         selected_layer.mode = previous_mode
 
 
+@register_viewer_action(trans._('Jump to the selected label.'))
+def jump_to_selected_label(viewer: ViewerModel):
+    """Move the slice and the camera to the center of the selected label.
+
+    The label is found with the spatial index of the active labels layer,
+    which only reads the chunks of the data that contain the label.
+    """
+    from napari.layers import Labels
+
+    layer = viewer.layers.selection.active
+    if not isinstance(layer, Labels):
+        return
+    bounding_box = layer.spatial_index.bounding_box(layer.selected_label)
+    if bounding_box is None:
+        show_info(
+            trans._(
+                'Label {label} is not in the data',
+                deferred=True,
+                label=layer.selected_label,
+            )
+        )
+        return
+    center = layer.data_to_world((bounding_box[0] + bounding_box[1] - 1) / 2)
+    ndim = viewer.dims.ndim
+    viewer.dims.set_point(range(ndim - len(center), ndim), center)
+    viewer.camera.center = tuple(
+        viewer.dims.point[axis] for axis in viewer.dims.displayed
+    )
+
+
 @register_viewer_action(trans._('Show all key bindings'))
 def show_shortcuts(viewer: Viewer):
     pref_list = viewer.window._open_preferences_dialog()._list
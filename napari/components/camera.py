@@ -2,7 +2,6 @@ import warnings
 from typing import Optional, Union
 
 import numpy as np
-from scipy.spatial.transform import Rotation as R
 
 from napari._pydantic_compat import validator
 from napari.utils.events import EventedModel
@@ -78,6 +77,8 @@ class Camera(EventedModel):
         3-tuple. This direction is in 3D scene coordinates, the world coordinate
         system for three currently displayed dimensions.
         """
+        from scipy.spatial.transform import Rotation as R
+
         rotation_matrix = R.from_euler(
             seq='yzx', angles=self.angles, degrees=True
         ).as_matrix()
@@ -146,6 +147,8 @@ class Camera(EventedModel):
         x_vector /= np.linalg.norm(x_vector)
 
         # construct rotation matrix, convert to euler angles
+        from scipy.spatial.transform import Rotation as R
+
         rotation_matrix = np.column_stack((up_vector, view_vector, x_vector))
         euler_angles = R.from_matrix(rotation_matrix).as_euler(
             seq='yzx', degrees=True
@@ -1,6 +1,7 @@
 """Monitor service."""
 
 from napari.components.experimental.monitor._monitor import monitor
+from napari.components.experimental.monitor._shared import map_shared_arrays
 from napari.components.experimental.monitor._utils import numpy_dumps
 
-__all__ = ['monitor', 'numpy_dumps']
+__all__ = ['map_shared_arrays', 'monitor', 'numpy_dumps']
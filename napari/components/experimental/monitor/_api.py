@@ -6,6 +6,7 @@ from queue import Empty, Queue
 from threading import Event
 from typing import ClassVar, NamedTuple
 
+from napari.components.experimental.monitor._shared import SharedArrays
 from napari.utils.events import EmitterGroup
 
 LOGGER = logging.getLogger('napari.monitor')
@@ -75,7 +76,8 @@ class MonitorApi:
     functionality to SyncManager. See the official Python docs for
     multiprocessing.managers.SyncManager.
 
-    Numpy can natively use shared memory buffers, something we want to try.
+    Numpy arrays in napari_data are passed through shared memory buffers
+    instead of being pickled, see SharedArrays.
     """
 
     # BaseManager.register() is a bit weird. Not sure now to best deal with
@@ -144,6 +146,9 @@ class MonitorApi:
             self._manager.client_messages(),
         )
 
+        # Shared memory buffers for the arrays in napari_data.
+        self._shared_arrays = SharedArrays(self._manager)
+
     @property
     def manager(self) -> SharedMemoryManager:
         """Our shared memory manager.
@@ -169,6 +174,7 @@ class MonitorApi:
         this event was set.
         """
         self._remote.napari_shutdown.set()
+        self._shared_arrays.close()
 
     def poll(self):
         """Poll client_messages for new messages."""
@@ -201,9 +207,16 @@ class MonitorApi:
         Parameters
         ----------
         data : dict
-            Add this data, replacing anything with the same key.
+            Add this data, replacing anything with the same key. Numpy
+            arrays are copied to shared memory buffers, and replaced by
+            descriptors that clients map with map_shared_arrays().
         """
-        self._remote.napari_data.update(data)
+        self._remote.napari_data.update(
+            {
+                key: self._shared_arrays.publish(key, value)
+                for key, value in data.items()
+            }
+        )
 
     def send_napari_message(self, message: dict) -> None:
         """Send a message to shared memory clients.
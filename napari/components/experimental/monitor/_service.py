@@ -87,10 +87,18 @@ The client can access data['tiled_image_layer']. Clients should be
 resilient to missing data. Nn case the napari version is different than
 expected, or is just not producing that data for some reason.
 
-Future Work
------------
-We plan to investigate the use of numpy shared memory buffers for bulk
-binary data. Possibly using recarray to organized things.
+Passing Arrays
+--------------
+Numpy arrays in the added data are not pickled. They are copied to shared
+memory buffers allocated by the SharedMemoryManager, and replaced by small
+descriptors with the name of the buffer and the shape, dtype and offset of
+the array. Clients map the arrays without copying them:
+
+    from napari.components.experimental.monitor import map_shared_arrays
+
+    poll = map_shared_arrays(data['poll'])
+
+See napari/components/experimental/monitor/_shared.py for details.
 """
 
 import copy
@@ -141,9 +149,9 @@ class MonitorService:
     dict proxy object instead. That serializes to JSON under the hood,
     but it's nicer that doing int ourselves.
 
-    So this class is not doing much right now. However if we add true
-    shared memory buffers for numpy, etc. then this class might manager
-    those.
+    Numpy arrays are passed through shared memory buffers allocated by the
+    manager, which MonitorApi manages. So this class only starts the
+    clients, and shuts down the manager, which unlinks those buffers.
     """
 
     def __init__(self, config: dict, manager: SharedMemoryManager) -> None:
@@ -0,0 +1,192 @@
+"""Shared memory buffers for the arrays that napari shares with clients.
+
+Sharing arrays through the napari_data dict proxy pickles them and sends
+them over a socket, which is too slow to stream images or points at frame
+rate. Instead, the arrays in the data added with
+``MonitorApi.add_napari_data`` are copied to named shared memory buffers,
+and replaced in the shared data by a small descriptor:
+
+    {
+        "shared_array": {
+            "name": "psm_2f8e1c3a",
+            "shape": [512, 512],
+            "dtype": "<u2",
+            "offset": 0
+        }
+    }
+
+All the arrays of a top-level key are packed in one buffer, at the given
+offsets. Each key has two buffers, which are written alternately, so a
+client can read the last published arrays while the next ones are being
+written. Clients map the arrays without copying them with
+:func:`map_shared_arrays`.
+"""
+
+from multiprocessing.managers import SharedMemoryManager
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Callable
+
+import numpy as np
+
+from napari.utils._shared_memory import (
+    attach_shared_memory,
+    shared_memory_array,
+)
+
+SHARED_ARRAY_KEY = 'shared_array'
+
+# Offsets of the arrays in a buffer are aligned like numpy allocations.
+_ALIGNMENT = 64
+
+
+def _map_values(value: Any, func: Callable[[Any], Any]) -> Any:
+    """Apply func to the values in nested dicts, lists and tuples."""
+    if isinstance(value, dict):
+        return {k: _map_values(v, func) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return type(value)(_map_values(v, func) for v in value)
+    return func(value)
+
+
+def _is_shareable(value: Any) -> bool:
+    return isinstance(value, np.ndarray) and not value.dtype.hasobject
+
+
+class SharedArrays:
+    """Copies the arrays of the shared data to shared memory buffers.
+
+    Parameters
+    ----------
+    manager : SharedMemoryManager
+        The manager of the monitor, which unlinks the buffers when it shuts
+        down.
+    """
+
+    def __init__(self, manager: SharedMemoryManager) -> None:
+        self._manager = manager
+        # The two buffers of each key, and the one to write next.
+        self._buffers: dict[str, list[SharedMemory]] = {}
+        self._next: dict[str, int] = {}
+
+    def publish(self, key: str, data: Any) -> Any:
+        """Copy the arrays in data to the shared memory buffer of a key.
+
+        Parameters
+        ----------
+        key : str
+            The top-level key of the data.
+        data : Any
+            The data, with arrays possibly nested in dicts, lists and tuples.
+
+        Returns
+        -------
+        Any
+            The data, with its arrays replaced by their descriptors.
+        """
+        arrays: list[np.ndarray] = []
+        _map_values(data, lambda v: _is_shareable(v) and arrays.append(v))
+        if not arrays:
+            return data
+
+        offsets = []
+        size = 0
+        for array in arrays:
+            offsets.append(size)
+            size += -(-array.nbytes // _ALIGNMENT) * _ALIGNMENT
+        shared_memory = self._get_buffer(key, size)
+
+        descriptors = iter(zip(arrays, offsets))
+
+        def _publish(value: Any) -> Any:
+            if not _is_shareable(value):
+                return value
+            array, offset = next(descriptors)
+            shared_memory_array(
+                shared_memory, array.shape, array.dtype, offset
+            )[...] = array
+            return {
+                SHARED_ARRAY_KEY: {
+                    'name': shared_memory.name,
+                    'shape': list(array.shape),
+                    'dtype': array.dtype.str,
+                    'offset': offset,
+                }
+            }
+
+        return _map_values(data, _publish)
+
+    def close(self) -> None:
+        """Close the buffers, which the manager unlinks when it shuts down."""
+        for buffers in self._buffers.values():
+            for shared_memory in buffers:
+                shared_memory.close()
+        self._buffers.clear()
+
+    def _get_buffer(self, key: str, size: int) -> SharedMemory:
+        """Return the next buffer of a key, with at least size bytes."""
+        buffers = self._buffers.setdefault(key, [])
+        index = self._next.get(key, 0)
+        self._next[key] = 1 - index
+        if index < len(buffers) and buffers[index].size >= size:
+            return buffers[index]
+        # Grow by powers of two, so that arrays of slowly growing sizes do
+        # not allocate a buffer every time. The manager keeps the replaced
+        # buffers until it shuts down.
+        shared_memory = self._manager.SharedMemory(
+            1 << (size - 1).bit_length()
+        )
+        if index < len(buffers):
+            buffers[index].close()
+            buffers[index] = shared_memory
+        else:
+            buffers.append(shared_memory)
+        return shared_memory
+
+
+def map_shared_array(descriptor: dict) -> np.ndarray:
+    """Map a shared array from its descriptor, without copying it.
+
+    Parameters
+    ----------
+    descriptor : dict
+        The name of the shared memory buffer, and the shape, dtype and
+        offset of the array in it.
+
+    Returns
+    -------
+    np.ndarray
+        The array, which keeps the buffer mapped.
+    """
+    shared_memory = attach_shared_memory(descriptor['name'])
+    return shared_memory_array(
+        shared_memory,
+        tuple(descriptor['shape']),
+        np.dtype(descriptor['dtype']),
+        descriptor['offset'],
+    )
+
+
+def map_shared_arrays(data: Any) -> Any:
+    """Replace the shared array descriptors in shared data with arrays.
+
+    This is meant for monitor clients, e.g. ``map_shared_arrays(data['poll'])``.
+    The arrays are overwritten when napari publishes the next data for the
+    same key but one, so copy them to keep them.
+
+    Parameters
+    ----------
+    data : Any
+        Data read from the napari_data dict.
+
+    Returns
+    -------
+    Any
+        The data, with its shared array descriptors replaced by arrays.
+    """
+    if isinstance(data, dict) and set(data) == {SHARED_ARRAY_KEY}:
+        return map_shared_array(data[SHARED_ARRAY_KEY])
+    if isinstance(data, dict):
+        return {k: map_shared_arrays(v) for k, v in data.items()}
+    if isinstance(data, (list, tuple)):
+        return type(data)(map_shared_arrays(v) for v in data)
+    return data
@@ -2,12 +2,54 @@
 
 import json
 import logging
+from typing import Optional
 
+import numpy as np
+
+from napari.components.experimental.monitor._shared import (
+    SHARED_ARRAY_KEY,
+    map_shared_array,
+)
 from napari.components.layerlist import LayerList
+from napari.layers import Image, Layer, Points
 
 LOGGER = logging.getLogger('napari.monitor')
 
 
+class _FrameStack:
+    """Frames appended along the first axis of an array, without copying
+    the previous frames every time.
+
+    The frames are stored in a buffer whose capacity doubles when it is
+    full, and the data is a view of its filled part.
+
+    Parameters
+    ----------
+    data : np.ndarray
+        The initial frames.
+    """
+
+    def __init__(self, data: np.ndarray) -> None:
+        self._buffer = np.empty(
+            (max(2 * len(data), 1), *data.shape[1:]), dtype=data.dtype
+        )
+        self._buffer[: len(data)] = data
+        self.data = self._buffer[: len(data)]
+
+    def append(self, frame: np.ndarray) -> np.ndarray:
+        """Append a frame, and return the frames."""
+        length = len(self.data)
+        if length == len(self._buffer):
+            buffer = np.empty(
+                (2 * length, *self._buffer.shape[1:]), dtype=self._buffer.dtype
+            )
+            buffer[:length] = self.data
+            self._buffer = buffer
+        self._buffer[length] = frame
+        self.data = self._buffer[: length + 1]
+        return self.data
+
+
 class RemoteCommands:
     """Commands that a remote client can call.
 
@@ -22,6 +64,27 @@ class RemoteCommands:
     Layer or LayerList. If they did it would create circular dependencies
     because people need to be able to import the monitor from anywhere.
 
+    Ingesting Frames
+    ----------------
+    Clients can push frames into an image or points layer without pickling
+    them. A client first writes a ring buffer of frames in shared memory,
+    i.e. an array whose first axis is the slot of each frame, and attaches
+    it to a layer with its shared array descriptor (see
+    napari/components/experimental/monitor/_shared.py):
+
+        {"attach_ring": {"layer": "camera", "shared_array": {...}}}
+
+    Then for each frame written in the ring, it sends:
+
+        {"append_frame": {"layer": "camera", "slot": 3}}
+
+    See append_frame() for how the frame updates the layer. Finally, it
+    detaches the ring from the layer:
+
+        {"detach_ring": {"layer": "camera"}}
+
+    Malformed commands are logged and ignored.
+
     Parameters
     ----------
     layers : LayerList
@@ -37,6 +100,10 @@ class RemoteCommands:
 
     def __init__(self, layers: LayerList) -> None:
         self.layers = layers
+        # The ring buffer of frames attached to each layer name.
+        self._rings: dict[str, np.ndarray] = {}
+        # The growable buffer of the frames appended to image layers.
+        self._stacks: dict[str, _FrameStack] = {}
 
     def process_command(self, event) -> None:
         """Process this one command from the remote client.
@@ -63,3 +130,93 @@ class RemoteCommands:
                 method(args)
             except AttributeError:
                 LOGGER.exception('RemoteCommands.%s does not exist.', name)
+            except (KeyError, IndexError, TypeError):
+                LOGGER.exception(
+                    'Malformed RemoteCommands.%s command: %s', name, args
+                )
+
+    def attach_ring(self, args: dict) -> None:
+        """Attach a ring buffer of frames in shared memory to a layer.
+
+        Parameters
+        ----------
+        args : dict
+            The name of the layer, and the shared array descriptor of the
+            ring buffer, whose first axis is the slot of each frame.
+        """
+        ring = map_shared_array(args[SHARED_ARRAY_KEY])
+        self.detach_ring(args)
+        self._rings[args['layer']] = ring
+
+    def detach_ring(self, args: dict) -> None:
+        """Detach the ring buffer of a layer, if any.
+
+        Parameters
+        ----------
+        args : dict
+            The name of the layer.
+        """
+        name = args['layer']
+        self._rings.pop(name, None)
+        self._stacks.pop(name, None)
+
+    def append_frame(self, args: dict) -> None:
+        """Update a layer with a frame from its ring buffer.
+
+        A frame with the shape of the data of an image layer replaces its
+        data in place, e.g. for a live view. Otherwise, the frame is
+        appended along the first axis of the data, e.g. the time axis.
+
+        For a points layer, the frame holds the coordinates of the points
+        to add. Its optional "length" is the number of points in the slot,
+        by default all of them.
+
+        Parameters
+        ----------
+        args : dict
+            The name of the layer, the slot of the frame in the ring
+            buffer, and optionally the number of points in the slot.
+        """
+        name = args['layer']
+        ring = self._rings.get(name)
+        layer = self._get_layer(name)
+        if ring is None or layer is None:
+            LOGGER.warning('No ring buffer attached to layer %s', name)
+            return
+        # The client overwrites the slot later, so frames are copied out.
+        frame = ring[args['slot']]
+        if isinstance(layer, Points):
+            layer.add(frame[: args.get('length')])
+        elif isinstance(layer, Image) and not layer.multiscale:
+            self._update_image(name, layer, frame)
+        else:
+            LOGGER.warning('Cannot append frames to layer %s', name)
+
+    def _get_layer(self, name: str) -> Optional[Layer]:
+        try:
+            return self.layers[name]
+        except KeyError:
+            return None
+
+    def _update_image(
+        self, name: str, layer: Image, frame: np.ndarray
+    ) -> None:
+        data = layer.data
+        if (
+            isinstance(data, np.ndarray)
+            and data.flags.writeable
+            and data.shape == frame.shape
+        ):
+            data[...] = frame
+            layer.refresh()
+            return
+        if data.shape[1:] != frame.shape:
+            LOGGER.warning(
+                'Frame of shape %s does not fit layer %s', frame.shape, name
+            )
+            return
+        stack = self._stacks.get(name)
+        if stack is None or stack.data is not data:
+            # the data was set by someone else since the last frame
+            stack = self._stacks[name] = _FrameStack(np.asarray(data))
+        layer.data = stack.append(frame)
@@ -9,6 +9,7 @@ from typing import Optional
 
 from napari.components.experimental.monitor import monitor
 from napari.components.layerlist import LayerList
+from napari.layers._scalar_field.scalar_field import ScalarFieldBase
 
 LOGGER = logging.getLogger('napari.monitor')
 
@@ -34,14 +35,15 @@ class RemoteMessages:
         include static information that rarely changes. Although if it's
         small, maybe it's okay.
 
-        The message looks like:
+        The current slice of visible image and labels layers is included,
+        and passed through shared memory. The message looks like:
 
         {
             "poll": {
                 "layers": {
                     13482484: {
-                        "tile_state": ...
-                        "tile_config": ...
+                        "name": "cells",
+                        "slice": {"shared_array": {...}}
                     }
                 }
             }
@@ -49,7 +51,11 @@ class RemoteMessages:
         """
         self._frame_number += 1
 
-        layers: dict[int, dict] = {}
+        layers: dict[int, dict] = {
+            id(layer): {'name': layer.name, 'slice': layer._slice.image.raw}
+            for layer in self.layers
+            if isinstance(layer, ScalarFieldBase) and layer.visible
+        }
 
         monitor.add_data({'poll': {'layers': layers}})
         self._send_frame_time()
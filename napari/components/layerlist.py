@@ -3,15 +3,18 @@ from __future__ import annotations
 import itertools
 import typing
 import warnings
-from collections.abc import Iterable
+from collections import Counter
+from collections.abc import Generator, Iterable
+from contextlib import contextmanager
 from functools import cached_property
-from typing import TYPE_CHECKING, Optional, Union
+from typing import TYPE_CHECKING, Callable, Optional, Union
 
 import numpy as np
 
 from napari.components.dims import RangeTuple
 from napari.layers import Layer
 from napari.layers.utils.layer_utils import Extent
+from napari.utils.events import EmitterGroup
 from napari.utils.events.containers import SelectableEventedList
 from napari.utils.naming import inc_name_count
 from napari.utils.translations import trans
@@ -26,6 +29,95 @@ def get_name(layer: Layer) -> str:
     return layer.name
 
 
+class _RunningMinimum:
+    """Element-wise minimum of arrays of layers, updated incrementally.
+
+    Each layer contributes a (k, D) array, whose last columns are aligned
+    with the last columns of the minimum, like the extents of layers with
+    different numbers of dimensions. NaN values are ignored.
+
+    The arrays of layers are only computed when the minimum is needed, and
+    only for the layers added or invalidated since then. Adding a layer, or
+    changing one that does not attain the minimum, updates the minimum in
+    place, while removing or changing a layer that attains it recomputes it
+    from all the layers.
+
+    Parameters
+    ----------
+    rows : int
+        The number of rows k of the arrays.
+    get_values : callable
+        The function returning the (k, D) array of a layer.
+    """
+
+    def __init__(
+        self, rows: int, get_values: Callable[[Layer], np.ndarray]
+    ) -> None:
+        self._rows = rows
+        self._get_values = get_values
+        self._values: dict[Layer, np.ndarray] = {}
+        self._ndims: Counter[int] = Counter()
+        self._stale: set[Layer] = set()
+        # None when it needs to be recomputed from all the layers
+        self._minimum: Optional[np.ndarray] = np.empty((rows, 0))
+
+    def invalidate(self, layer: Layer) -> None:
+        """Mark the array of a new or changed layer to be updated."""
+        self._stale.add(layer)
+
+    def remove(self, layer: Layer) -> None:
+        """Remove the array of a layer from the minimum."""
+        self._stale.discard(layer)
+        if layer in self._values:
+            self._discard(self._values.pop(layer))
+
+    @property
+    def minimum(self) -> np.ndarray:
+        """array, shape (k, D): The minimum, NaN where no layer has values."""
+        for layer in self._stale:
+            values = np.asarray(self._get_values(layer), dtype=float)
+            if layer in self._values:
+                self._discard(self._values[layer])
+            self._values[layer] = values
+            self._ndims[values.shape[1]] += 1
+            if self._minimum is not None:
+                self._minimum = _aligned_fmin(self._minimum, values)
+        self._stale.clear()
+        if self._minimum is None:
+            minimum = np.empty((self._rows, 0))
+            for values in self._values.values():
+                minimum = _aligned_fmin(minimum, values)
+            self._minimum = minimum
+        return self._minimum
+
+    def _discard(self, values: np.ndarray) -> None:
+        ndim = values.shape[1]
+        self._ndims[ndim] -= 1
+        if not self._ndims[ndim]:
+            del self._ndims[ndim]
+        if self._minimum is None:
+            return
+        if ndim == 0 or np.any(values <= self._minimum[:, -ndim:]):
+            self._minimum = None
+        elif not self._ndims:
+            self._minimum = np.empty((self._rows, 0))
+        elif self._minimum.shape[1] > max(self._ndims):
+            self._minimum = self._minimum[:, -max(self._ndims) :]
+
+
+def _aligned_fmin(minimum: np.ndarray, values: np.ndarray) -> np.ndarray:
+    """Element-wise minimum of arrays aligned on their last columns."""
+    ndim = values.shape[1]
+    if ndim > minimum.shape[1]:
+        padding = np.full((len(minimum), ndim - minimum.shape[1]), np.nan)
+        minimum = np.hstack([padding, minimum])
+    else:
+        minimum = minimum.copy()
+    if ndim:
+        minimum[:, -ndim:] = np.fmin(minimum[:, -ndim:], values)
+    return minimum
+
+
 class LayerList(SelectableEventedList[Layer]):
     """List-like layer collection with built-in reordering and callback hooks.
 
@@ -61,10 +153,48 @@ class LayerList(SelectableEventedList[Layer]):
         emitted when the current item has changed.
     selection.events._current : (value: _T)
         emitted when the current item has changed. (Private event)
+    _batch_inserted : (value: list of Layer)
+        emitted after the layers inserted in a ``batch_insert`` context are
+        all inserted. (Private event)
 
     """
 
     def __init__(self, data=()) -> None:
+        # minimum of the world extents of the layers and of their steps, as
+        # rows of (min, -max, step), updated when the extent of a layer
+        # changes
+        self._extent_minimum = _RunningMinimum(
+            3,
+            lambda layer: (
+                layer.extent.world[0],
+                -layer.extent.world[1],
+                layer.extent.step,
+            ),
+        )
+        self._extent_augmented_minimum = _RunningMinimum(
+            2,
+            lambda layer: (
+                layer._extent_augmented.world[0],
+                -layer._extent_augmented.world[1],
+            ),
+        )
+        # names of the layers, to make new names unique without going
+        # through all the layers
+        self._names: Counter[str] = Counter()
+        self._layer_names: dict[Layer, str] = {}
+        # last unique name made from a name, while all the names made from it
+        # before are still taken
+        self._name_hints: dict[str, str] = {}
+        # positions of the layers, see index
+        self._positions: dict[Layer, int] = {}
+        # layers inserted in the current batch_insert context
+        self._batch_depth = 0
+        self._batch_layers: list[Layer] = []
+        self._batch_activate = True
+        # EventedList adds its events to this group
+        self.events = EmitterGroup(
+            source=self, auto_connect=False, _batch_inserted=None
+        )
         super().__init__(
             data=data,
             basetype=Layer,
@@ -110,8 +240,55 @@ class LayerList(SelectableEventedList[Layer]):
 
     def _process_delete_item(self, item: Layer):
         super()._process_delete_item(item)
-        item.events.extent.disconnect(self._clean_cache)
-        item.events._extent_augmented.disconnect(self._clean_cache)
+        self._untrack_extent(item)
+        self._untrack_name(item)
+
+    def _track_name(self, layer: Layer):
+        self._layer_names[layer] = layer.name
+        self._names[layer.name] += 1
+        layer.events.name.connect(self._on_name_change)
+
+    def _untrack_name(self, layer: Layer):
+        layer.events.name.disconnect(self._on_name_change)
+        self._discard_name(self._layer_names.pop(layer))
+
+    def _discard_name(self, name: str):
+        self._names[name] -= 1
+        if not self._names[name]:
+            del self._names[name]
+            # a name made from another one may be free again
+            self._name_hints.clear()
+
+    def _on_name_change(self, event):
+        layer = event.source
+        self._discard_name(self._layer_names[layer])
+        self._layer_names[layer] = layer.name
+        self._names[layer.name] += 1
+
+    def _track_extent(self, layer: Layer):
+        self._clean_cache()
+        self._extent_minimum.invalidate(layer)
+        self._extent_augmented_minimum.invalidate(layer)
+        layer.events.extent.connect(self._on_extent_change)
+        layer.events._extent_augmented.connect(
+            self._on_extent_augmented_change
+        )
+
+    def _untrack_extent(self, layer: Layer):
+        layer.events.extent.disconnect(self._on_extent_change)
+        layer.events._extent_augmented.disconnect(
+            self._on_extent_augmented_change
+        )
+        self._extent_minimum.remove(layer)
+        self._extent_augmented_minimum.remove(layer)
+        self._clean_cache()
+
+    def _on_extent_change(self, event):
+        self._extent_minimum.invalidate(event.source)
+        self._clean_cache()
+
+    def _on_extent_augmented_change(self, event):
+        self._extent_augmented_minimum.invalidate(event.source)
         self._clean_cache()
 
     def _clean_cache(self):
@@ -141,11 +318,23 @@ class LayerList(SelectableEventedList[Layer]):
         new_name : str
             Coerced, unique name.
         """
-        existing_layers = {x.name for x in self if x is not layer}
-        for _ in range(len(self)):
-            if name in existing_layers:
-                name = inc_name_count(name)
-        return name
+        own_name = self._layer_names.get(layer) if layer is not None else None
+
+        def is_taken(name: str) -> bool:
+            return self._names[name] > (name == own_name)
+
+        if not is_taken(name):
+            return name
+        # all the names from ``name`` to its hint are taken, so start from
+        # the hint, unless they may include the name of ``layer``
+        new_name = (
+            name if own_name is not None else self._name_hints.get(name, name)
+        )
+        while is_taken(new_name):
+            new_name = inc_name_count(new_name)
+        if own_name is None:
+            self._name_hints[name] = new_name
+        return new_name
 
     def _update_name(self, event):
         """Coerce name of the layer in `event.layer`."""
@@ -153,10 +342,9 @@ class LayerList(SelectableEventedList[Layer]):
         layer.name = self._coerce_name(layer.name, layer)
 
     def _ensure_unique(self, values, allow=()):
-        bad = set(self._list) - set(allow)
         values = tuple(values) if isinstance(values, Iterable) else (values,)
         for v in values:
-            if v in bad:
+            if v in self._layer_names and v not in allow:
                 raise ValueError(
                     trans._(
                         "Layer '{v}' is already present in layer list",
@@ -166,6 +354,26 @@ class LayerList(SelectableEventedList[Layer]):
                 )
         return values
 
+    def index(
+        self, value: Layer, start: int = 0, stop: Optional[int] = None
+    ) -> int:
+        """Return first index of value.
+
+        Layers are looked up in a cache of their positions, which is checked
+        on use and rebuilt when the list has changed, so that looking up the
+        layers of a large list does not scan it each time.
+        """
+        if isinstance(value, Layer) and start == 0 and stop is None:
+            i = self._positions.get(value)
+            if i is None or i >= len(self._list) or self._list[i] is not value:
+                self._positions = {
+                    layer: i for i, layer in enumerate(self._list)
+                }
+                i = self._positions.get(value)
+            if i is not None:
+                return i
+        return super().index(value, start, stop)
+
     @typing.overload
     def __getitem__(self, item: Union[int, str]) -> Layer: ...
 
@@ -181,6 +389,11 @@ class LayerList(SelectableEventedList[Layer]):
             value = self._ensure_unique(value, old)
         elif isinstance(key, int):
             (value,) = self._ensure_unique((value,), (old,))
+            if value is not old:
+                self._untrack_extent(old)
+                self._untrack_name(old)
+                self._track_extent(value)
+                self._track_name(value)
         super().__setitem__(key, value)
 
     def insert(self, index: int, value: Layer):
@@ -188,11 +401,56 @@ class LayerList(SelectableEventedList[Layer]):
         (value,) = self._ensure_unique((value,))
         new_layer = self._type_check(value)
         new_layer.name = self._coerce_name(new_layer.name)
-        self._clean_cache()
-        new_layer.events.extent.connect(self._clean_cache)
-        new_layer.events._extent_augmented.connect(self._clean_cache)
+        self._track_extent(new_layer)
+        self._track_name(new_layer)
+        if self._batch_depth:
+            self._batch_layers.append(new_layer)
         super().insert(index, new_layer)
 
+    def extend(self, values: Iterable[Layer]):
+        """Insert the layers of ``values`` at the end, in one batch."""
+        with self.batch_insert():
+            super().extend(values)
+
+    @contextmanager
+    def batch_insert(self) -> Generator[None, None, None]:
+        """Context in which many layers are inserted at once.
+
+        The ``inserted`` event is emitted for each layer as usual, but the
+        viewer and the canvas wait for the end of the context to update the
+        dims, slice the new layers and order the layer visuals, once for all
+        of them, which is much faster when adding hundreds of layers.
+
+        Examples
+        --------
+        >>> with viewer.layers.batch_insert():  # doctest: +SKIP
+        ...     for tile, position in zip(tiles, positions):
+        ...         viewer.add_image(tile, translate=position)
+        """
+        if not self._batch_depth:
+            # activate only the last inserted layer, at the end
+            self._batch_activate, self._activate_on_insert = (
+                self._activate_on_insert,
+                False,
+            )
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                self._activate_on_insert = self._batch_activate
+            if not self._batch_depth and self._batch_layers:
+                present = set(self._list)
+                layers = [
+                    layer for layer in self._batch_layers if layer in present
+                ]
+                self._batch_layers = []
+                if layers:
+                    if self._activate_on_insert:
+                        self.selection.active = layers[-1]
+                    self.events._batch_inserted(value=layers)
+
     def remove_selected(self):
         """Remove selected layers from LayerList, but first unlink them."""
         if not self.selection:
@@ -216,7 +474,7 @@ class LayerList(SelectableEventedList[Layer]):
         -------
         extent_world : array, shape (2, D)
         """
-        return self._get_extent_world([layer.extent for layer in self])
+        return self._extent_world_from_minimum(self._extent_minimum)
 
     @cached_property
     def _extent_world_augmented(self) -> np.ndarray:
@@ -229,11 +487,24 @@ class LayerList(SelectableEventedList[Layer]):
         -------
         extent_world : array, shape (2, D)
         """
-        return self._get_extent_world(
-            [layer._extent_augmented for layer in self],
-            augmented=True,
+        return self._extent_world_from_minimum(
+            self._extent_augmented_minimum, augmented=True
         )
 
+    def _extent_world_from_minimum(self, running_minimum, augmented=False):
+        """Extent of layers in world coordinates, from their running minimum.
+
+        Same as ``_get_extent_world`` for all the layers, without going
+        through the extents of the layers that did not change.
+        """
+        if len(self) == 0:
+            return self._get_extent_world([], augmented=augmented)
+        minimum = running_minimum.minimum
+        # 512 element default extent as documented in `_get_extent_world`
+        min_v = np.nan_to_num(minimum[0], nan=-0.5)
+        max_v = np.nan_to_num(-minimum[1], nan=511.5)
+        return np.vstack([min_v, max_v])
+
     def _get_min_and_max(self, mins_list, maxes_list):
         # Reverse dimensions since it is the last dimensions that are
         # displayed.
@@ -305,7 +576,9 @@ class LayerList(SelectableEventedList[Layer]):
         -------
         step_size : array, shape (D,)
         """
-        return self._get_step_size([layer.extent for layer in self])
+        if len(self) == 0:
+            return np.ones(self.ndim)
+        return self._extent_minimum.minimum[2].copy()
 
     def _step_size_from_scales(self, scales):
         # Reverse order so last axes of scale with different ndim are aligned
@@ -356,7 +629,9 @@ class LayerList(SelectableEventedList[Layer]):
         Extent bounds are inclusive. See Layer.extent for a detailed explanation
         of how extents are calculated.
         """
-        return self.get_extent(list(self))
+        return Extent(
+            data=None, world=self._extent_world, step=self._step_size
+        )
 
     @property
     def _ranges(self) -> tuple[RangeTuple, ...]:
@@ -4,7 +4,7 @@ import inspect
 import itertools
 import os
 import warnings
-from collections.abc import Iterator, Sequence
+from collections.abc import Iterable, Iterator, Sequence
 from functools import lru_cache
 from pathlib import Path
 from typing import (
@@ -278,6 +278,7 @@ class ViewerModel(KeymapProvider, MousemapProvider, EventedModel):
             self._update_status_bar_from_cursor
         )
         self.layers.events.inserted.connect(self._on_add_layer)
+        self.layers.events._batch_inserted.connect(self._on_add_layers)
         self.layers.events.removed.connect(self._on_remove_layer)
         self.layers.events.reordered.connect(self._on_grid_change)
         self.layers.events.reordered.connect(self._on_layers_change)
@@ -621,13 +622,35 @@ class ViewerModel(KeymapProvider, MousemapProvider, EventedModel):
             layer.events.mode.connect(self._on_layer_mode_change)
         self._layer_help_from_mode(layer)
 
+        # the layers inserted in a batch are updated together at its end
+        if not self.layers._batch_depth:
+            self._update_new_layers([layer])
+
+    def _on_add_layers(self, event):
+        """Update the viewer for the layers inserted in a batch.
+
+        Parameters
+        ----------
+        event : napari.utils.event.Event
+            Event whose value is the list of inserted layers.
+        """
+        self._update_new_layers(event.value)
+
+    def _update_new_layers(self, layers: list[Layer]) -> None:
+        """Update dims and grid, and slice new layers."""
         # Update dims and grid model
         self._on_layers_change()
-        self._on_grid_change()
-        # Slice current layer based on dims
-        self._update_layers(layers=[layer])
-
-        if len(self.layers) == 1:
+        if self.grid.enabled:
+            self._on_grid_change()
+        else:
+            # without a grid, the other layers stay where they are
+            extent = self._sliced_extent_world_augmented
+            for layer in layers:
+                self._subplot(layer, (0, 0), extent)
+        # Slice new layers based on dims
+        self._update_layers(layers=layers)
+
+        if len(self.layers) == len(layers):
             # set dims slider to the middle of all dimensions
             self.reset_view()
             self.dims._go_to_center_step()
@@ -696,7 +719,8 @@ class ViewerModel(KeymapProvider, MousemapProvider, EventedModel):
             del layer._overlays[overlay]
 
         self._on_layers_change()
-        self._on_grid_change()
+        if self.grid.enabled:
+            self._on_grid_change()
 
     def add_layer(self, layer: Layer) -> Layer:
         """Add a layer to the viewer.
@@ -718,6 +742,28 @@ class ViewerModel(KeymapProvider, MousemapProvider, EventedModel):
         self.layers.append(layer)
         return layer
 
+    def add_layers(self, layers: Iterable[Layer]) -> list[Layer]:
+        """Add several layers to the viewer at once.
+
+        This is much faster than adding the layers one at a time when adding
+        hundreds of layers, e.g. the tiles of a mosaic, as the dims, the
+        grid and the canvas are updated once for all the layers, and the
+        layers are sliced together.
+
+        Parameters
+        ----------
+        layers : iterable of :class:`napari.layers.Layer`
+            Layers to add.
+
+        Returns
+        -------
+        layers : list of :class:`napari.layers.Layer`
+            The layers that were added.
+        """
+        layers = list(layers)
+        self.layers.extend(layers)
+        return layers
+
     @rename_argument(
         from_name='interpolation',
         to_name='interpolation2d',
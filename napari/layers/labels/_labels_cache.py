@@ -0,0 +1,210 @@
+"""Write-behind cache of the chunks of on-disk labels data being edited.
+
+Painting on zarr or tensorstore arrays with fancy indexing reads, decodes,
+encodes and writes every chunk touched by a brush dab, several times per
+dab. Instead, labels edits go through a :class:`ChunkCache`, which loads
+each touched chunk into memory once, applies the edits there, and writes
+the edited chunks back when flushed, e.g. in the background when a paint
+stroke ends.
+"""
+
+from collections import OrderedDict
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Optional
+
+import numpy as np
+
+from napari.utils.misc import _is_array_type
+
+#: Default maximum size of the chunks held in memory by a cache.
+DEFAULT_MAX_BYTES = 2**27
+
+
+def get_chunk_shape(data: Any) -> Optional[tuple[int, ...]]:
+    """Return the chunk shape of an on-disk array, or None for other arrays.
+
+    Parameters
+    ----------
+    data : array-like
+        The labels data.
+
+    Returns
+    -------
+    tuple of int or None
+        The shape of the chunks written by zarr and tensorstore arrays.
+    """
+    if isinstance(data, np.ndarray):
+        return None
+    if _is_array_type(data, 'zarr.Array'):
+        return tuple(data.chunks)
+    if _is_array_type(data, 'tensorstore.TensorStore'):
+        shape = data.chunk_layout.write_chunk.shape
+        if shape is not None and all(shape):
+            return tuple(shape)
+    return None
+
+
+class ChunkCache:
+    """Write-behind cache of the chunks of an array that is being edited.
+
+    Reading or writing elements loads the chunks that contain them into
+    memory once, and writes are applied to the loaded chunks, which are
+    marked as dirty. Dirty chunks are written back to the array when
+    flushed, or when they are evicted to keep the loaded chunks within
+    ``max_bytes``. Writes run in order in a background thread, and loading
+    a chunk from the array waits for them.
+
+    Parameters
+    ----------
+    data : array-like
+        The chunked array, which supports reading and writing a chunk with a
+        tuple of slices, like zarr or tensorstore arrays.
+    chunk_shape : tuple of int
+        The shape of the chunks of the array.
+    max_bytes : int
+        The maximum size of the loaded chunks.
+    """
+
+    def __init__(
+        self,
+        data: Any,
+        chunk_shape: tuple[int, ...],
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ) -> None:
+        self.data = data
+        self.chunk_shape = np.asarray(chunk_shape, dtype=np.intp)
+        self.max_bytes = max_bytes
+        self.dtype = np.dtype(getattr(data.dtype, 'numpy_dtype', data.dtype))
+        self._chunks: OrderedDict[tuple[int, ...], np.ndarray] = OrderedDict()
+        self._dirty: set[tuple[int, ...]] = set()
+        self._nbytes = 0
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pending: list[Future] = []
+
+    @property
+    def dirty(self) -> bool:
+        """True if some edits have not been written to the array yet."""
+        return bool(self._dirty) or any(not f.done() for f in self._pending)
+
+    def __getitem__(self, indices: tuple) -> Any:
+        """Get the values at a tuple of integer (array) indices."""
+        shape, flat_indices = _flatten_indices(indices)
+        values = np.empty(len(flat_indices[0]), dtype=self.dtype)
+        for key, where, local in self._group_by_chunk(flat_indices):
+            values[where] = self._load(key)[local]
+        return values.reshape(shape) if shape else values[0]
+
+    def __setitem__(self, indices: tuple, value: Any) -> None:
+        """Set the values at a tuple of integer (array) indices."""
+        shape, flat_indices = _flatten_indices(indices)
+        value = np.broadcast_to(np.asarray(value, dtype=self.dtype), shape)
+        value = value.ravel()
+        for key, where, local in self._group_by_chunk(flat_indices):
+            self._load(key)[local] = value[where]
+            self._dirty.add(key)
+
+    def flush(self, block: bool = True) -> None:
+        """Write the dirty chunks to the array.
+
+        Parameters
+        ----------
+        block : bool
+            If True, wait until all the chunks are written. Otherwise, the
+            chunks are written in the background.
+        """
+        for key in sorted(self._dirty):
+            chunk = self._chunks[key]
+            # Keep editing the cached chunk while a copy is being written.
+            self._submit(key, chunk if block else chunk.copy())
+        self._dirty.clear()
+        if block:
+            self._wait()
+
+    def close(self) -> None:
+        """Write the dirty chunks and stop the background writes."""
+        self.flush()
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+        self._chunks.clear()
+        self._nbytes = 0
+
+    def _group_by_chunk(
+        self, flat_indices: list[np.ndarray]
+    ) -> Iterator[tuple[tuple[int, ...], np.ndarray, tuple[np.ndarray, ...]]]:
+        """Yield each chunk key with the positions and local indices in it."""
+        if len(flat_indices[0]) == 0:
+            return
+        coords = np.stack(flat_indices)
+        chunk_coords = coords // self.chunk_shape[:, np.newaxis]
+        grid_shape = -(-np.asarray(self.data.shape) // self.chunk_shape)
+        chunk_ids = np.ravel_multi_index(tuple(chunk_coords), grid_shape)
+        if np.all(chunk_ids == chunk_ids[0]):
+            # e.g. a small brush dab inside a single chunk
+            ids = chunk_ids[:1]
+            groups = [np.arange(len(chunk_ids))]
+        else:
+            ids, inverse = np.unique(chunk_ids, return_inverse=True)
+            order = np.argsort(inverse, kind='stable')
+            bounds = np.searchsorted(inverse[order], np.arange(len(ids) + 1))
+            groups = [
+                order[start:stop]
+                for start, stop in zip(bounds[:-1], bounds[1:])
+            ]
+        for chunk_id, where in zip(ids.tolist(), groups):
+            key = np.unravel_index(chunk_id, grid_shape)
+            origin = np.asarray(key) * self.chunk_shape
+            local = tuple(coords[:, where] - origin[:, np.newaxis])
+            yield tuple(int(k) for k in key), where, local
+
+    def _slices(self, key: tuple[int, ...]) -> tuple[slice, ...]:
+        return tuple(
+            slice(k * c, min((k + 1) * c, s))
+            for k, c, s in zip(key, self.chunk_shape, self.data.shape)
+        )
+
+    def _load(self, key: tuple[int, ...]) -> np.ndarray:
+        """Return a cached chunk, reading it from the array if needed."""
+        chunk = self._chunks.get(key)
+        if chunk is not None:
+            self._chunks.move_to_end(key)
+            return chunk
+        # A previous version of the chunk may still be being written.
+        self._wait()
+        chunk = np.asarray(self.data[self._slices(key)], dtype=self.dtype)
+        if not chunk.flags.writeable:
+            chunk = chunk.copy()
+        self._chunks[key] = chunk
+        self._nbytes += chunk.nbytes
+        while self._nbytes > self.max_bytes and len(self._chunks) > 1:
+            evicted_key, evicted = self._chunks.popitem(last=False)
+            self._nbytes -= evicted.nbytes
+            if evicted_key in self._dirty:
+                self._dirty.discard(evicted_key)
+                self._submit(evicted_key, evicted)
+        return chunk
+
+    def _submit(self, key: tuple[int, ...], chunk: np.ndarray) -> None:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1)
+        self._pending = [f for f in self._pending if not f.done()]
+        self._pending.append(self._executor.submit(self._write, key, chunk))
+
+    def _write(self, key: tuple[int, ...], chunk: np.ndarray) -> None:
+        self.data[self._slices(key)] = chunk
+
+    def _wait(self) -> None:
+        """Wait for the background writes, raising their errors if any."""
+        pending, self._pending = self._pending, []
+        for future in pending:
+            future.result()
+
+
+def _flatten_indices(
+    indices: tuple,
+) -> tuple[tuple[int, ...], list[np.ndarray]]:
+    """Broadcast integer (array) indices and flatten them to 1D arrays."""
+    arrays = [np.asarray(i, dtype=np.intp) for i in indices]
+    shape = np.broadcast_shapes(*(a.shape for a in arrays))
+    return shape, [np.broadcast_to(a, shape).ravel() for a in arrays]
@@ -0,0 +1,313 @@
+"""Spatial index of the labels in a labels array.
+
+Label-level operations, like filling a label everywhere or finding where a
+label is, would otherwise scan the whole array. The array is split into
+chunks (the chunks of zarr or tensorstore arrays, or blocks of
+:data:`DEFAULT_BLOCK_SIZE` elements for other arrays), and the index holds
+the number of voxels of each label in each chunk, so that those operations
+only read the chunks that contain the label.
+
+The index is built in the background, one chunk per task, and is kept up
+to date from the changes made by the labels layer.
+"""
+
+import os
+import threading
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Optional, Union
+
+import numpy as np
+
+from napari.layers.labels._labels_cache import get_chunk_shape
+
+#: Number of elements of the blocks indexed for arrays that are not chunked.
+DEFAULT_BLOCK_SIZE = 2**18
+
+Region = tuple[Union[int, slice], ...]
+
+
+def _default_chunk_shape(shape: tuple[int, ...]) -> tuple[int, ...]:
+    """Return the shape of the blocks of about DEFAULT_BLOCK_SIZE elements."""
+    edge = max(round(DEFAULT_BLOCK_SIZE ** (1 / max(len(shape), 1))), 1)
+    return tuple(max(min(edge, s), 1) for s in shape)
+
+
+class LabelsSpatialIndex:
+    """Voxel counts of each label in each chunk of a labels array.
+
+    Parameters
+    ----------
+    data : array-like
+        The labels array, which supports reading a chunk with a tuple of
+        slices.
+    chunk_shape : tuple of int, optional
+        The shape of the indexed chunks. By default, the chunk shape of zarr
+        and tensorstore arrays, or blocks of ``DEFAULT_BLOCK_SIZE`` elements.
+
+    Attributes
+    ----------
+    chunk_shape : np.ndarray
+        The shape of the indexed chunks.
+    grid_shape : np.ndarray
+        The number of chunks along each axis.
+    """
+
+    def __init__(
+        self, data: Any, chunk_shape: Optional[tuple[int, ...]] = None
+    ) -> None:
+        self.data = data
+        shape = tuple(data.shape)
+        if chunk_shape is None:
+            chunk_shape = get_chunk_shape(data) or _default_chunk_shape(shape)
+        self.chunk_shape = np.asarray(chunk_shape, dtype=np.intp)
+        self.grid_shape = -(
+            -np.asarray(shape, dtype=np.intp) // self.chunk_shape
+        )
+        # label -> chunk id -> number of voxels
+        self._chunks: dict[int, dict[int, int]] = {}
+        self._counts: dict[int, int] = {}
+        self._bounding_boxes: dict[int, np.ndarray] = {}
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pending: dict[int, Future] = {}
+        # number of finished chunk scans, counted from the worker threads
+        self._n_done = 0
+        self._n_done_lock = threading.Lock()
+        # chunks edited while the index is being built
+        self._stale: set[int] = set()
+        self._ready = False
+
+    @property
+    def ready(self) -> bool:
+        """True if the index is built, i.e. queries do not wait.
+
+        Once all the chunks are scanned in the background, the scans are
+        merged into the index on the first check, which does not block.
+        """
+        if (
+            not self._ready
+            and self._executor is not None
+            and self._n_done == len(self._pending)
+        ):
+            self.wait()
+        return self._ready
+
+    @property
+    def labels(self) -> np.ndarray:
+        """The sorted labels in the array."""
+        self.wait()
+        return np.array(sorted(self._counts))
+
+    def start(self) -> None:
+        """Start building the index in the background."""
+        if self._ready or self._executor is not None:
+            return
+        self._executor = ThreadPoolExecutor(
+            max_workers=min(4, os.cpu_count() or 1)
+        )
+        self._n_done = 0
+        pending = {}
+        for chunk_id in range(int(np.prod(self.grid_shape))):
+            future = self._executor.submit(self._scan, chunk_id)
+            future.add_done_callback(self._on_scan_done)
+            pending[chunk_id] = future
+        self._pending = pending
+
+    def _on_scan_done(self, future: Future) -> None:
+        with self._n_done_lock:
+            self._n_done += 1
+
+    def wait(self) -> None:
+        """Finish building the index, blocking until it is ready."""
+        if self._ready:
+            return
+        self.start()
+        pending, self._pending = self._pending, {}
+        for chunk_id, future in pending.items():
+            labels, counts = (
+                self._scan(chunk_id)
+                if chunk_id in self._stale
+                else future.result()
+            )
+            for label, count in zip(labels.tolist(), counts.tolist()):
+                self._add(label, chunk_id, count)
+        self._stale.clear()
+        self._shutdown()
+        self._ready = True
+
+    def close(self) -> None:
+        """Stop building the index."""
+        self._shutdown(cancel=True)
+        self._pending = {}
+
+    def update(self, indices: tuple, old_values: Any, new_values: Any) -> None:
+        """Update the index with changes to the array.
+
+        Parameters
+        ----------
+        indices : tuple of arrays
+            The integer indices of the changed elements.
+        old_values : int or array
+            The labels of the elements before the change.
+        new_values : int or array
+            The labels of the elements after the change.
+        """
+        chunk_ids = self._chunk_ids(indices)
+        if chunk_ids.size == 0:
+            return
+        if not self._ready:
+            # rescanned when the index is built
+            self._stale.update(np.unique(chunk_ids).tolist())
+            return
+        for values, sign in ((old_values, -1), (new_values, 1)):
+            values = np.broadcast_to(np.asarray(values), chunk_ids.shape)
+            for label, chunk_id, count in _count_pairs(values, chunk_ids):
+                self._add(label, chunk_id, sign * count)
+
+    def count(self, label: int) -> int:
+        """Return the number of voxels of a label."""
+        self.wait()
+        return self._counts.get(int(label), 0)
+
+    def chunks(self, label: int) -> np.ndarray:
+        """Return the (n, ndim) grid coordinates of the chunks of a label."""
+        self.wait()
+        chunk_ids = np.fromiter(
+            self._chunks.get(int(label), ()), dtype=np.intp
+        )
+        return np.stack(
+            np.unravel_index(np.sort(chunk_ids), self.grid_shape), axis=-1
+        )
+
+    def chunk_slices(
+        self, label: int, region: Optional[Region] = None
+    ) -> list[Region]:
+        """Return the parts of a region in the chunks that contain a label.
+
+        Parameters
+        ----------
+        label : int
+            The label.
+        region : tuple of int or slice, optional
+            The region of the array, as an index with an integer or a slice
+            with unit step for each axis. By default, the whole array.
+
+        Returns
+        -------
+        list of tuple of int or slice
+            The intersection of the region with each chunk that contains the
+            label, as indices into the array.
+        """
+        shape = self.data.shape
+        if region is None:
+            region = (slice(None),) * len(shape)
+        bounds = []
+        for r, s in zip(region, shape):
+            if isinstance(r, slice):
+                start, stop, _ = r.indices(s)
+                bounds.append((start, stop))
+            else:
+                bounds.append((int(r), int(r) + 1))
+        bounds = np.array(bounds, dtype=np.intp).reshape(-1, 2)
+        keys = self.chunks(label)
+        origins = keys * self.chunk_shape
+        starts = np.maximum(origins, bounds[:, 0])
+        stops = np.minimum(origins + self.chunk_shape, bounds[:, 1])
+        in_region = np.all(starts < stops, axis=1)
+        return [
+            tuple(
+                slice(start, stop) if isinstance(r, slice) else int(r)
+                for r, start, stop in zip(region, s0.tolist(), s1.tolist())
+            )
+            for s0, s1 in zip(starts[in_region], stops[in_region])
+        ]
+
+    def bounding_box(self, label: int) -> Optional[np.ndarray]:
+        """Return the bounding box of a label.
+
+        Only the chunks that contain the label are read.
+
+        Parameters
+        ----------
+        label : int
+            The label.
+
+        Returns
+        -------
+        np.ndarray or None
+            The (2, ndim) start (inclusive) and stop (exclusive) indices of
+            the voxels of the label, or None if the array does not contain
+            the label.
+        """
+        label = int(label)
+        if label not in self._bounding_boxes:
+            bounds = []
+            for slices in self.chunk_slices(label):
+                nonzero = np.nonzero(np.asarray(self.data[slices]) == label)
+                starts = np.array([s.start for s in slices])
+                bounds.append(
+                    [
+                        [i.min() for i in nonzero] + starts,
+                        [i.max() + 1 for i in nonzero] + starts,
+                    ]
+                )
+            if not bounds:
+                return None
+            bounds = np.array(bounds)
+            self._bounding_boxes[label] = np.stack(
+                [bounds[:, 0].min(axis=0), bounds[:, 1].max(axis=0)]
+            )
+        return self._bounding_boxes[label].copy()
+
+    def _chunk_ids(self, indices: tuple) -> np.ndarray:
+        arrays = [np.asarray(i, dtype=np.intp).ravel() for i in indices]
+        return np.ravel_multi_index(
+            tuple(a // c for a, c in zip(arrays, self.chunk_shape)),
+            self.grid_shape,
+        )
+
+    def _slices(self, chunk_id: int) -> tuple[slice, ...]:
+        key = np.unravel_index(chunk_id, self.grid_shape)
+        return tuple(
+            slice(int(k) * c, min((int(k) + 1) * c, s))
+            for k, c, s in zip(key, self.chunk_shape, self.data.shape)
+        )
+
+    def _scan(self, chunk_id: int) -> tuple[np.ndarray, np.ndarray]:
+        """Return the labels in a chunk and their voxel counts."""
+        chunk = np.asarray(self.data[self._slices(chunk_id)])
+        return np.unique(chunk, return_counts=True)
+
+    def _add(self, label: int, chunk_id: int, count: int) -> None:
+        chunks = self._chunks.setdefault(label, {})
+        chunk_count = chunks.get(chunk_id, 0) + count
+        if chunk_count:
+            chunks[chunk_id] = chunk_count
+        else:
+            del chunks[chunk_id]
+        total = self._counts.get(label, 0) + count
+        if total:
+            self._counts[label] = total
+        else:
+            del self._chunks[label]
+            del self._counts[label]
+        self._bounding_boxes.pop(label, None)
+
+    def _shutdown(self, cancel: bool = False) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=not cancel, cancel_futures=cancel)
+            self._executor = None
+
+
+def _count_pairs(
+    labels: np.ndarray, chunk_ids: np.ndarray
+) -> Iterator[tuple[int, int, int]]:
+    """Yield each (label, chunk id) pair with its number of occurrences."""
+    order = np.lexsort((labels, chunk_ids))
+    labels, chunk_ids = labels[order], chunk_ids[order]
+    change = (labels[1:] != labels[:-1]) | (chunk_ids[1:] != chunk_ids[:-1])
+    starts = np.concatenate([[0], np.flatnonzero(change) + 1])
+    counts = np.diff(np.append(starts, len(labels)))
+    return zip(
+        labels[starts].tolist(), chunk_ids[starts].tolist(), counts.tolist()
+    )
@@ -1,7 +1,6 @@
 from functools import lru_cache
 
 import numpy as np
-from scipy import ndimage as ndi
 
 
 def interpolate_coordinates(old_coord, new_coord, brush_size):
@@ -140,6 +139,50 @@ def get_dtype(layer):
     return layer_dtype
 
 
+def ray_voxels(start_point, end_point, shape):
+    """Voxels traversed by a ray segment, in order from its start.
+
+    This is a vectorized voxel traversal (like the DDA algorithm): every
+    voxel crossed by the segment is returned exactly once, instead of
+    sampling points along it. Voxel ``i`` spans ``[i, i + 1)`` along each
+    axis.
+
+    Parameters
+    ----------
+    start_point : array, shape (D,)
+        The start coordinate of the ray.
+    end_point : array, shape (D,)
+        The end coordinate of the ray.
+    shape : tuple of int
+        The shape of the volume, to which the voxels are clipped.
+
+    Returns
+    -------
+    voxels : array of int, shape (N, D)
+        The traversed voxels.
+    t_start, t_stop : array of float, shape (N,)
+        The parameters along the ray, from 0 at its start to 1 at its end,
+        where it enters and exits each voxel.
+    """
+    start_point = np.asarray(start_point, dtype=float)
+    direction = np.asarray(end_point, dtype=float) - start_point
+    crossings = [np.array([0.0, 1.0])]
+    for start, step in zip(start_point, direction):
+        if step != 0:
+            low, high = sorted((start, start + step))
+            boundaries = np.arange(np.floor(low) + 1, np.ceil(high))
+            crossings.append((boundaries - start) / step)
+    t = np.unique(np.clip(np.concatenate(crossings), 0, 1))
+    if len(t) == 1:
+        # zero-length ray, in a single voxel
+        t = np.zeros(2)
+    t_start, t_stop = t[:-1], t[1:]
+    middle = (t_start + t_stop) / 2
+    voxels = np.floor(start_point + middle[:, np.newaxis] * direction)
+    voxels = np.clip(voxels, 0, np.asarray(shape) - 1).astype(int)
+    return voxels, t_start, t_stop
+
+
 def first_nonzero_coordinate(data, start_point, end_point):
     """Coordinate of the first nonzero element between start and end points.
 
@@ -157,13 +200,12 @@ def first_nonzero_coordinate(data, start_point, end_point):
     coordinates : array of int, shape (D,)
         The coordinates of the first nonzero element along the ray, or None.
     """
-    shape = np.asarray(data.shape)
-    length = np.linalg.norm(end_point - start_point)
-    length_int = np.round(length).astype(int)
-    coords = np.linspace(start_point, end_point, length_int + 1, endpoint=True)
-    clipped_coords = np.clip(np.round(coords), 0, shape - 1).astype(int)
-    nonzero = np.flatnonzero(data[tuple(clipped_coords.T)])
-    return None if len(nonzero) == 0 else clipped_coords[nonzero[0]]
+    # elements are centered on integer coordinates
+    coords, _, _ = ray_voxels(
+        np.asarray(start_point) + 0.5, np.asarray(end_point) + 0.5, data.shape
+    )
+    nonzero = np.flatnonzero(data[tuple(coords.T)])
+    return None if len(nonzero) == 0 else coords[nonzero[0]]
 
 
 def mouse_event_to_labels_coordinate(layer, event):
@@ -221,6 +263,8 @@ def get_contours(labels: np.ndarray, thickness: int, background_label: int):
     -------
     A new label image in which only the boundaries of the input image are kept.
     """
+    from scipy import ndimage as ndi
+
     struct_elem = ndi.generate_binary_structure(labels.ndim, 1)
 
     thick_struct_elem = ndi.iterate_structure(struct_elem, thickness).astype(
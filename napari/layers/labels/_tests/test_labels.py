@@ -659,6 +659,66 @@ def test_data_setitem_multi_dim():
     )
 
 
+def test_paint_zarr_writes_behind():
+    """Edits to zarr data during a stroke are written when it ends."""
+    data = zarr.zeros((4, 20, 20), chunks=(1, 10, 10), dtype=np.uint32)
+    labels = Labels(data)
+    labels.brush_size = 3
+    with labels.block_history():
+        labels.paint((1, 5, 5), 2)
+        labels.paint((1, 5, 14), 2)
+        assert labels._edit_data[1, 5, 14] == 2
+    labels.flush()
+    assert data[1, 5, 5] == 2
+    assert data[1, 5, 14] == 2
+    assert np.count_nonzero(data[0]) == 0
+
+    labels.undo()
+    assert np.count_nonzero(data[:]) == 0
+
+    # edits outside of a stroke are written immediately
+    labels.data_setitem((np.array([3]), np.array([2]), np.array([2])), 5)
+    assert data[3, 2, 2] == 5
+
+
+@pytest.mark.parametrize('contiguous', [True, False])
+def test_fill_with_spatial_index(contiguous):
+    data = np.zeros((2, 40, 40), dtype=np.uint8)
+    data[:, 5:10, 5:10] = 1
+    data[:, 5:10, 30:35] = 1
+    data[:, 25:30, 5:10] = 2
+    expected = data.copy()
+    labels = Labels(data)
+    labels.contiguous = contiguous
+    assert labels.spatial_index.count(1) == 100
+
+    labels.fill((1, 6, 6), 3)
+    expected[1, 5:10, 5:10] = 3
+    if not contiguous:
+        expected[1, 5:10, 30:35] = 3
+    npt.assert_array_equal(labels.data, expected)
+    assert labels.spatial_index.count(1) == np.count_nonzero(expected == 1)
+    assert labels.spatial_index.count(3) == np.count_nonzero(expected == 3)
+
+    labels.fill((0, 0, 0), 4)
+    assert np.count_nonzero(labels.data == 4) == 40 * 40 - 75
+
+    labels.undo()
+    labels.undo()
+    npt.assert_array_equal(labels.data, data)
+    assert labels.spatial_index.count(3) == 0
+    npt.assert_array_equal(
+        labels.spatial_index.bounding_box(2), [[0, 25, 5], [2, 30, 10]]
+    )
+
+
+def test_show_selected_label_builds_spatial_index():
+    labels = Labels(np.zeros((10, 10), dtype=np.uint8))
+    assert labels._spatial_index is None
+    labels.show_selected_label = True
+    assert labels._spatial_index is not None
+
+
 def test_data_setitiem_transposed_axes():
     data = np.zeros((10, 100), dtype=np.uint32)
     labels = Labels(data)
@@ -1726,7 +1786,7 @@ class TestLabels:
     def test_events_defined(self, event_define_check, obj):
         event_define_check(
             obj,
-            {'seed', 'num_colors', 'color', 'seed_rng'},
+            {'seed', 'num_colors', 'color', 'seed_rng', 'spatial_index'},
         )
 
 
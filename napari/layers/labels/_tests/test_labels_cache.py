@@ -0,0 +1,49 @@
+import numpy as np
+import pytest
+import zarr
+
+from napari.layers.labels._labels_cache import ChunkCache, get_chunk_shape
+
+
+def test_get_chunk_shape():
+    assert get_chunk_shape(np.zeros((4, 4))) is None
+    data = zarr.zeros((8, 8), chunks=(4, 2))
+    assert get_chunk_shape(data) == (4, 2)
+
+
+@pytest.mark.parametrize('block', [True, False])
+def test_chunk_cache_get_set(block):
+    data = zarr.zeros((10, 10), chunks=(4, 4), dtype=np.uint8)
+    cache = ChunkCache(data, data.chunks)
+    rows, cols = np.array([0, 5, 9, 9]), np.array([0, 3, 9, 4])
+    cache[rows, cols] = [1, 2, 3, 4]
+    np.testing.assert_array_equal(cache[rows, cols], [1, 2, 3, 4])
+    assert cache[9, 9] == 3
+    assert cache.dirty
+    assert np.count_nonzero(data[:]) == 0
+
+    cache.flush(block=block)
+    cache[0, 0] = 7  # edits after a flush don't change the written chunk
+    cache._wait()
+    expected = np.zeros((10, 10), dtype=np.uint8)
+    expected[rows, cols] = [1, 2, 3, 4]
+    np.testing.assert_array_equal(data[:], expected)
+
+    cache.close()
+    assert not cache.dirty
+    assert data[0, 0] == 7
+
+
+def test_chunk_cache_evicts_dirty_chunks():
+    data = zarr.zeros((8, 8), chunks=(2, 2), dtype=np.uint8)
+    # room for two chunks of 4 bytes
+    cache = ChunkCache(data, data.chunks, max_bytes=8)
+    cache[np.arange(8), np.arange(8)] = 1
+    assert len(cache._chunks) == 2
+    # the evicted chunks are written without a flush
+    cache._wait()
+    assert np.count_nonzero(data[:]) == 4
+    # a reloaded chunk has its evicted edits
+    assert cache[0, 0] == 1
+    cache.flush()
+    np.testing.assert_array_equal(data[:], np.eye(8, dtype=np.uint8))
@@ -0,0 +1,98 @@
+import time
+from concurrent.futures import wait
+
+import numpy as np
+import numpy.testing as npt
+import zarr
+
+from napari.layers.labels._labels_index import LabelsSpatialIndex
+
+
+def _data():
+    data = np.zeros((20, 30), dtype=np.uint16)
+    data[2:5, 3:8] = 1
+    data[12:18, 25:27] = 1
+    data[10:15, 10:15] = 2
+    return data
+
+
+def test_spatial_index_build():
+    index = LabelsSpatialIndex(_data(), chunk_shape=(10, 10))
+    assert not index.ready
+    index.start()
+    npt.assert_array_equal(index.labels, [0, 1, 2])
+    assert index.ready
+    assert index.count(1) == 15 + 12
+    assert index.count(2) == 25
+    assert index.count(3) == 0
+    npt.assert_array_equal(index.chunks(1), [[0, 0], [1, 2]])
+    npt.assert_array_equal(index.chunks(2), [[1, 1]])
+    npt.assert_array_equal(index.bounding_box(1), [[2, 3], [18, 27]])
+    npt.assert_array_equal(index.bounding_box(2), [[10, 10], [15, 15]])
+    assert index.bounding_box(3) is None
+
+
+def test_spatial_index_zarr_chunks():
+    data = zarr.array(_data(), chunks=(5, 15))
+    index = LabelsSpatialIndex(data)
+    npt.assert_array_equal(index.chunk_shape, (5, 15))
+    npt.assert_array_equal(index.chunks(2), [[2, 0]])
+
+
+def test_spatial_index_chunk_slices():
+    index = LabelsSpatialIndex(_data(), chunk_shape=(10, 10))
+    assert index.chunk_slices(2) == [(slice(10, 20), slice(10, 20))]
+    assert index.chunk_slices(1, (slice(None), slice(0, 5))) == [
+        (slice(0, 10), slice(0, 5))
+    ]
+    assert index.chunk_slices(1, (3, slice(None))) == [(3, slice(0, 10))]
+    assert index.chunk_slices(1, (19, slice(None))) == [(19, slice(20, 30))]
+    assert index.chunk_slices(2, (3, slice(None))) == []
+
+
+def test_spatial_index_update():
+    data = _data()
+    index = LabelsSpatialIndex(data, chunk_shape=(10, 10))
+    index.wait()
+    assert index.bounding_box(2) is not None
+
+    indices = (np.array([0, 10, 19]), np.array([0, 10, 29]))
+    old_values = data[indices]
+    data[indices] = [3, 3, 2]
+    index.update(indices, old_values, [3, 3, 2])
+    assert index.count(2) == 25
+    assert index.count(3) == 2
+    npt.assert_array_equal(index.bounding_box(2), [[10, 10], [20, 30]])
+    npt.assert_array_equal(index.chunks(3), [[0, 0], [1, 1]])
+
+    data[data == 1] = 0
+    indices = np.nonzero(_data() == 1)
+    index.update(indices, 1, 0)
+    assert index.count(1) == 0
+    assert 1 not in index.labels
+    assert index.bounding_box(1) is None
+
+
+def test_spatial_index_update_while_building():
+    data = _data()
+    index = LabelsSpatialIndex(data, chunk_shape=(10, 10))
+    index.start()
+    indices = (np.array([0]), np.array([0]))
+    data[indices] = 4
+    index.update(indices, 0, 4)
+    assert index.count(4) == 1
+    assert index.count(0) == data.size - 15 - 12 - 25 - 1
+
+
+def test_spatial_index_ready_after_background_build():
+    index = LabelsSpatialIndex(_data(), chunk_shape=(10, 10))
+    index.start()
+    wait(list(index._pending.values()))
+    # the scans are merged without any blocking query, once the done
+    # callbacks, which run right after the futures finish, have counted them
+    for _ in range(100):
+        if index.ready:
+            break
+        time.sleep(0.01)
+    assert index.ready
+    assert index.count(2) == 25
@@ -100,6 +100,30 @@ def test_3D_multiscale_labels_in_3D():
     )
 
 
+def test_3D_multiscale_labels_picking_full_resolution():
+    """Test that 3D picking is exact at full resolution."""
+    data = np.zeros((32, 32, 32), dtype=np.uint8)
+    data[10, 10, 10] = 7
+    data[11, 11, 11] = 9
+    # the lowest resolution level only has the largest label of each block
+    coarse = data.reshape(8, 4, 8, 4, 8, 4).max(axis=(1, 3, 5))
+    layer = Labels([data, data[::2, ::2, ::2], coarse])
+    layer._slice_dims(Dims(ndim=3, ndisplay=3))
+    assert layer._slice.image.raw[2, 2, 2] == 9
+
+    def pick(position, view_direction):
+        return layer.get_value(
+            position, view_direction=view_direction, dims_displayed=[0, 1, 2]
+        )
+
+    assert pick([0, 10, 10], [1, 0, 0]) == 7
+    assert pick([0, 11, 11], [1, 0, 0]) == 9
+    assert pick([31, 10, 10], [-1, 0, 0]) == 7
+    assert pick([10, 0, 10], [0, 1, 0]) == 7
+    # the ray crosses the coarse voxel but misses both labels
+    assert pick([0, 9, 9], [1, 0, 0]) == 0
+
+
 def instantiate_3D_multiscale_labels():
     lowest_res_scale = np.arange(8).reshape(2, 2, 2)
     middle_res_scale = (
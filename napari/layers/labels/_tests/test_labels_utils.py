@@ -7,6 +7,7 @@ from napari.layers.labels._labels_utils import (
     get_dtype,
     interpolate_coordinates,
     mouse_event_to_labels_coordinate,
+    ray_voxels,
 )
 from napari.utils._proxies import ReadOnlyWrapper
 
@@ -85,6 +86,22 @@ def test_first_nonzero_coordinate():
     )
 
 
+def test_ray_voxels():
+    voxels, t_start, t_stop = ray_voxels([0.5, 0.5], [2.5, 1.5], (3, 3))
+    np.testing.assert_array_equal(voxels, [[0, 0], [1, 0], [1, 1], [2, 1]])
+    np.testing.assert_allclose(t_start, [0, 0.25, 0.5, 0.75])
+    np.testing.assert_allclose(t_stop, [0.25, 0.5, 0.75, 1])
+
+    # every voxel crossed by a long diagonal ray is visited once, in order
+    voxels, _, _ = ray_voxels([0, 0.2, 0.7], [100, 37.9, 3.1], (100, 38, 4))
+    steps = np.abs(np.diff(voxels, axis=0)).sum(axis=1)
+    assert np.all(steps == 1)
+    np.testing.assert_array_equal(voxels[[0, -1]], [[0, 0, 0], [99, 37, 3]])
+
+    voxels, _, _ = ray_voxels([1.5, 1.5], [1.5, 1.5], (3, 3))
+    np.testing.assert_array_equal(voxels, [[1, 1]])
+
+
 def test_mouse_event_to_labels_coordinate_2d(MouseEvent):
     data = np.zeros((11, 11), dtype=int)
     data[4:7, 4:7] = 1
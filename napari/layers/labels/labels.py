@@ -13,8 +13,6 @@ from typing import (
 import numpy as np
 import numpy.typing as npt
 import pandas as pd
-from scipy import ndimage as ndi
-from skimage.draw import polygon2mask
 
 from napari.layers._data_protocols import LayerDataProtocol
 from napari.layers._multiscale_data import MultiScaleData
@@ -25,12 +23,17 @@ from napari.layers.base._base_mouse_bindings import (
     transform_with_box,
 )
 from napari.layers.image._image_utils import guess_multiscale
-from napari.layers.image._slice import _ImageSliceResponse
+from napari.layers.image._slice import (
+    _ImageSliceRequest,
+    _ImageSliceResponse,
+)
+from napari.layers.labels._labels_cache import ChunkCache, get_chunk_shape
 from napari.layers.labels._labels_constants import (
     LabelColorMode,
     LabelsRendering,
     Mode,
 )
+from napari.layers.labels._labels_index import LabelsSpatialIndex
 from napari.layers.labels._labels_mouse_bindings import (
     BrushSizeOnMouseMove,
     draw,
@@ -41,6 +44,7 @@ from napari.layers.labels._labels_utils import (
     get_contours,
     indices_in_shape,
     interpolate_coordinates,
+    ray_voxels,
     sphere_indices,
 )
 from napari.layers.utils.layer_utils import _FeatureTable
@@ -57,7 +61,6 @@ from napari.utils.colormaps.colormap import (
 from napari.utils.colormaps.colormap_utils import shuffle_and_extend_colormap
 from napari.utils.events import EmitterGroup, Event
 from napari.utils.events.custom_types import Array
-from napari.utils.geometry import clamp_point_to_bounding_box
 from napari.utils.misc import StringEnum, _is_array_type
 from napari.utils.naming import magic_name
 from napari.utils.status_messages import generate_layer_coords_status
@@ -316,6 +319,8 @@ class Labels(ScalarFieldBase):
         self._color_mode = LabelColorMode.AUTO
         self._show_selected_label = False
         self._contour = 0
+        self._edit_cache: Optional[ChunkCache] = None
+        self._spatial_index: Optional[LabelsSpatialIndex] = None
 
         data = self._ensure_int_labels(data)
 
@@ -522,12 +527,65 @@ class Labels(ScalarFieldBase):
     @data.setter
     def data(self, data: Union[LayerDataProtocol, MultiScaleData]):
         data = self._ensure_int_labels(data)
+        if self._edit_cache is not None:
+            self._edit_cache.close()
+            self._edit_cache = None
         self._data = data
+        if self._spatial_index is not None:
+            self._spatial_index.close()
+            self._spatial_index = self._make_spatial_index()
         self._ndim = len(self._data.shape)
         self._update_dims()
         self.events.data(value=self.data)
         self._reset_editable()
 
+    @property
+    def _edit_data(self) -> Union[LayerDataProtocol, ChunkCache]:
+        """The data to read and write edits, cached for on-disk data."""
+        if self._edit_cache is None and not self.multiscale:
+            chunk_shape = get_chunk_shape(self._data)
+            if chunk_shape is not None:
+                self._edit_cache = ChunkCache(self._data, chunk_shape)
+        return self.data if self._edit_cache is None else self._edit_cache
+
+    def flush(self) -> None:
+        """Write all the pending edits to the data.
+
+        Edits to chunked on-disk data, like zarr or tensorstore arrays, are
+        applied to chunks cached in memory and written to the data in the
+        background when a paint stroke ends. Call this before reading the
+        data from outside of the layer to make sure all edits are written.
+        """
+        if self._edit_cache is not None:
+            self._edit_cache.flush()
+
+    @property
+    def spatial_index(self) -> LabelsSpatialIndex:
+        """Spatial index of the labels in the data.
+
+        The index holds the number of voxels of each label in each chunk of
+        the data (the highest resolution level of multiscale data), so that
+        finding where a label is only reads the chunks that contain it. It
+        is built in the background when first accessed, and kept up to date
+        with the edits made with the layer. Once it is built, filling a
+        label also only reads the chunks that contain it.
+        """
+        if self._spatial_index is None:
+            self._spatial_index = self._make_spatial_index()
+        # the index reads the data, which must have all the edits
+        self.flush()
+        return self._spatial_index
+
+    def _make_spatial_index(self) -> LabelsSpatialIndex:
+        data = self._data[0] if self.multiscale else self._data
+        index = LabelsSpatialIndex(data)
+        index.start()
+        return index
+
+    def _update_spatial_index(self, indices, old_values, new_values) -> None:
+        if self._spatial_index is not None:
+            self._spatial_index.update(indices, old_values, new_values)
+
     @property
     def features(self):
         """Dataframe-like features table.
@@ -690,6 +748,10 @@ class Labels(ScalarFieldBase):
         self._show_selected_label = show_selected
         self.colormap.use_selection = show_selected
         self.colormap.selection = self.selected_label
+        if show_selected:
+            # build the index in the background, to find the selected label
+            # without scanning the data, e.g. to jump to it
+            self.spatial_index  # noqa: B018
         self.events.show_selected_label(show_selected_label=show_selected)
         self.refresh()
 
@@ -770,6 +832,11 @@ class Labels(ScalarFieldBase):
         """
         return vispy_texture_dtype(data)
 
+    def _make_slice_request_internal(self, **kwargs) -> _ImageSliceRequest:
+        # Slicing reads the data directly, so write the pending edits first.
+        self.flush()
+        return super()._make_slice_request_internal(**kwargs)
+
     def _update_slice_response(self, response: _ImageSliceResponse) -> None:
         """Override to convert raw slice data to displayed label colors."""
         response = response.to_displayed(self._raw_to_displayed)
@@ -897,6 +964,8 @@ class Labels(ScalarFieldBase):
         like adjusting gamma or changing the data based on the contrast
         limits.
         """
+        from scipy import ndimage as ndi
+
         if not self.loaded:
             # ASYNC_TODO: Do not compute the thumbnail until we are loaded.
             # Is there a nicer way to prevent this from getting called?
@@ -944,6 +1013,10 @@ class Labels(ScalarFieldBase):
     ) -> Optional[int]:
         """Get the first non-background value encountered along a ray.
 
+        For multiscale data, the non-background voxels of the displayed
+        (lowest resolution) level along the ray are candidates, which are
+        checked in order at full resolution, reading only their region.
+
         Parameters
         ----------
         start_point : np.ndarray
@@ -961,49 +1034,73 @@ class Labels(ScalarFieldBase):
         """
         if start_point is None or end_point is None:
             return None
-        if len(dims_displayed) == 3:
+        if len(dims_displayed) != 3:
             # only use get_value_ray on 3D for now
-            # we use dims_displayed because the image slice
-            # has its dimensions  in th same order as the vispy
-            # Volume
-            # Account for downsampling in the case of multiscale
-            # -1 means lowest resolution here.
-            start_point = (
-                start_point[dims_displayed]
-                / self.downsample_factors[-1][dims_displayed]
+            return None
+        # we use dims_displayed because the image slice has its dimensions
+        # in the same order as the vispy Volume
+        start_point = cast(np.ndarray, start_point[dims_displayed])
+        end_point = cast(np.ndarray, end_point[dims_displayed])
+        # In 3D, the slice is at the lowest resolution level (-1). Traverse
+        # it to find the voxels along the ray that are not background.
+        coarse_factors = self.downsample_factors[-1][dims_displayed]
+        im_slice = self._slice.image.raw
+        voxels, t_starts, t_stops = ray_voxels(
+            start_point / coarse_factors,
+            end_point / coarse_factors,
+            im_slice.shape,
+        )
+        values = im_slice[tuple(voxels.T)]
+        candidates = np.flatnonzero(values)
+        if len(candidates) == 0:
+            return None
+        if not self.multiscale:
+            # if a nonzero value was found, return the first one
+            return values[candidates[0]]
+
+        # Refine the candidates at full resolution, only reading the region
+        # of each candidate voxel, until a nonzero value is found.
+        data = self.data[0]
+        full_shape = np.asarray(data.shape)[dims_displayed]
+        ray = end_point - start_point
+        pt_not_disp = self._get_pt_not_disp()
+        # the region has its axes in increasing order of dimension
+        axes_order = np.argsort(dims_displayed)
+        for i in candidates:
+            region_start = np.floor(voxels[i] * coarse_factors).astype(int)
+            region_stop = np.minimum(
+                np.ceil((voxels[i] + 1) * coarse_factors).astype(int),
+                full_shape,
+            )
+            region_slices = dict(
+                zip(
+                    dims_displayed,
+                    (
+                        slice(*bounds)
+                        for bounds in zip(region_start, region_stop)
+                    ),
+                )
             )
-            end_point = (
-                end_point[dims_displayed]
-                / self.downsample_factors[-1][dims_displayed]
+            region = np.asarray(
+                data[
+                    tuple(
+                        region_slices.get(d, pt_not_disp.get(d))
+                        for d in range(self.ndim)
+                    )
+                ]
             )
-            start_point = cast(np.ndarray, start_point)
-            end_point = cast(np.ndarray, end_point)
-            sample_ray = end_point - start_point
-            length_sample_vector = np.linalg.norm(sample_ray)
-            n_points = int(2 * length_sample_vector)
-            sample_points = np.linspace(
-                start_point, end_point, n_points, endpoint=True
+            full_voxels, _, _ = ray_voxels(
+                start_point + t_starts[i] * ray,
+                start_point + t_stops[i] * ray,
+                full_shape,
             )
-            im_slice = self._slice.image.raw
-            # ensure the bounding box is for the proper multiscale level
-            bounding_box = self._display_bounding_box_at_level(
-                dims_displayed, self.data_level
+            local = np.clip(
+                full_voxels - region_start, 0, region_stop - region_start - 1
             )
-            # the display bounding box is returned as a closed interval
-            # (i.e. the endpoint is included) by the method, but we need
-            # open intervals in the code that follows, so we add 1.
-            bounding_box[:, 1] += 1
-
-            clamped = clamp_point_to_bounding_box(
-                sample_points,
-                bounding_box,
-            ).astype(int)
-            values = im_slice[tuple(clamped.T)]
-            nonzero_indices = np.flatnonzero(values)
-            if len(nonzero_indices > 0):
-                # if a nonzer0 value was found, return the first one
-                return values[nonzero_indices[0]]
-
+            full_values = region[tuple(local[:, axes_order].T)]
+            nonzero = np.flatnonzero(full_values)
+            if len(nonzero) > 0:
+                return full_values[nonzero[0]]
         return None
 
     def _get_value_3d(
@@ -1060,6 +1157,8 @@ class Labels(ScalarFieldBase):
             self._commit_staged_history()
         finally:
             self._block_history = prev
+            if not prev and self._edit_cache is not None:
+                self._edit_cache.flush(block=False)
 
     def _commit_staged_history(self):
         """Save staged history to undo history and clear it."""
@@ -1128,10 +1227,17 @@ class Labels(ScalarFieldBase):
 
         history_item = before.pop()
         after.append(list(reversed(history_item)))
+        data = self._edit_data
         for prev_indices, prev_values, next_values in reversed(history_item):
             values = prev_values if undoing else next_values
-            self.data[prev_indices] = values
+            data[prev_indices] = values
+            self._update_spatial_index(
+                prev_indices,
+                next_values if undoing else prev_values,
+                values,
+            )
 
+        self.flush()
         self.refresh()
 
     def undo(self):
@@ -1160,6 +1266,8 @@ class Labels(ScalarFieldBase):
             Whether to refresh view slice or not. Set to False to batch paint
             calls.
         """
+        from scipy import ndimage as ndi
+
         int_coord = tuple(np.round(coord).astype(int))
         # If requested fill location is outside data shape then return
         if np.any(np.less(int_coord, 0)) or np.any(
@@ -1168,7 +1276,7 @@ class Labels(ScalarFieldBase):
             return
 
         # If requested new label doesn't change old label then return
-        old_label = np.asarray(self.data[int_coord]).item()
+        old_label = np.asarray(self._edit_data[int_coord]).item()
         if old_label == new_label or (
             self.preserve_labels
             and old_label != self.colormap.background_value
@@ -1182,32 +1290,63 @@ class Labels(ScalarFieldBase):
         for dim in dims_to_fill:
             data_slice_list[dim] = slice(None)
         data_slice = tuple(data_slice_list)
-        labels = np.asarray(self.data[data_slice])
-        slice_coord = tuple(int_coord[d] for d in dims_to_fill)
-
-        matches = labels == old_label
-        if self.contiguous:
-            # if contiguous replace only selected connected component
-            labeled_matches, num_features = ndi.label(matches)
-            if num_features != 1:
-                match_label = labeled_matches[slice_coord]
-                matches = np.logical_and(
-                    matches, labeled_matches == match_label
+        self.flush()
+
+        index = self._spatial_index
+        if index is not None and index.ready:
+            # only read the chunks that contain the label
+            regions = index.chunk_slices(old_label, data_slice)
+            if self.contiguous:
+                # the connected component is within the chunks of the label
+                regions = [
+                    tuple(
+                        slice(
+                            min(r[d].start for r in regions),
+                            max(r[d].stop for r in regions),
+                        )
+                        if isinstance(s, slice)
+                        else s
+                        for d, s in enumerate(data_slice)
+                    )
+                ]
+        else:
+            regions = [
+                tuple(
+                    slice(0, size) if isinstance(s, slice) else s
+                    for s, size in zip(data_slice, self.data.shape)
                 )
+            ]
 
-        match_indices_local = np.nonzero(matches)
-        if self.ndim not in {2, self.n_edit_dimensions}:
-            n_idx = len(match_indices_local[0])
-            match_indices = []
-            j = 0
-            for d in data_slice:
-                if isinstance(d, slice):
-                    match_indices.append(match_indices_local[j])
-                    j += 1
-                else:
-                    match_indices.append(np.full(n_idx, d, dtype=np.intp))
-        else:
-            match_indices = match_indices_local
+        match_indices_list = []
+        for region in regions:
+            labels = np.asarray(self.data[region])
+            matches = labels == old_label
+            if self.contiguous:
+                # if contiguous replace only selected connected component
+                slice_coord = tuple(
+                    int_coord[d] - region[d].start for d in dims_to_fill
+                )
+                labeled_matches, num_features = ndi.label(matches)
+                if num_features != 1:
+                    match_label = labeled_matches[slice_coord]
+                    matches = np.logical_and(
+                        matches, labeled_matches == match_label
+                    )
+
+            match_indices_local = iter(np.nonzero(matches))
+            n_idx = np.count_nonzero(matches)
+            match_indices_list.append(
+                [
+                    next(match_indices_local) + r.start
+                    if isinstance(r, slice)
+                    else np.full(n_idx, r, dtype=np.intp)
+                    for r in region
+                ]
+            )
+        match_indices = [
+            np.concatenate(axis_indices)
+            for axis_indices in zip(*match_indices_list)
+        ]
 
         match_indices = _coerce_indices_for_vectorization(
             self.data, match_indices
@@ -1237,7 +1376,7 @@ class Labels(ScalarFieldBase):
         for c in interp_coord:
             if (
                 self._slice_input.ndisplay == 3
-                and self.data[tuple(np.round(c).astype(int))] == 0
+                and self._edit_data[tuple(np.round(c).astype(int))] == 0
             ):
                 continue
             if self._mode in [Mode.PAINT, Mode.ERASE]:
@@ -1295,6 +1434,8 @@ class Labels(ScalarFieldBase):
         new_label : int
             Value of the new label to be filled in.
         """
+        from skimage.draw import polygon2mask
+
         shape, dims_to_paint = self._get_shape_and_dims_to_paint()
 
         if len(dims_to_paint) != 2:
@@ -1368,11 +1509,12 @@ class Labels(ScalarFieldBase):
         # subset it if we want to only paint into background/only erase
         # current label
         if self.preserve_labels:
+            data = self._edit_data
             if new_label == self.colormap.background_value:
-                keep_coords = self.data[slice_coord] == self.selected_label
+                keep_coords = data[slice_coord] == self.selected_label
             else:
                 keep_coords = (
-                    self.data[slice_coord] == self.colormap.background_value
+                    data[slice_coord] == self.colormap.background_value
                 )
             slice_coord = tuple(sc[keep_coords] for sc in slice_coord)
 
@@ -1418,7 +1560,9 @@ class Labels(ScalarFieldBase):
         ----------
         .. [2] https://numpy.org/doc/stable/user/basics.indexing.html
         """
-        changed_indices = self.data[indices] != value
+        data = self._edit_data
+        old_values = np.asarray(data[indices])
+        changed_indices = old_values != value
         indices = tuple(x[changed_indices] for x in indices)
 
         if isinstance(value, Sequence):
@@ -1436,13 +1580,17 @@ class Labels(ScalarFieldBase):
         self._save_history(
             (
                 indices,
-                np.array(self.data[indices], copy=True),
+                old_values[changed_indices],
                 value,
             )
         )
 
-        # update the labels image
-        self.data[indices] = value
+        # update the labels image, and write it to on-disk data right away
+        # unless painting a stroke, which is written when the stroke ends
+        data[indices] = value
+        self._update_spatial_index(indices, old_values[changed_indices], value)
+        if not self._block_history:
+            self.flush()
 
         pt_not_disp = self._get_pt_not_disp()
         displayed_indices = index_in_slice(
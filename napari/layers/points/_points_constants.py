@@ -98,6 +98,12 @@ SYMBOL_DICT.update({str(x): x for x in Symbol})
 SYMBOL_DICT.update(SYMBOL_TRANSLATION_INVERTED)  # type: ignore[arg-type]
 SYMBOL_DICT.update(SYMBOL_ALIAS)  # type: ignore[arg-type]
 
+# Integer code of each symbol, its position in Symbol. Points store their
+# symbols as an array of codes.
+SYMBOL_CODES: dict[Union[str, Symbol], int] = {
+    key: list(Symbol).index(value) for key, value in SYMBOL_DICT.items()
+}
+
 
 class Shading(StringEnum):
     """Shading: Shading mode for the points.
@@ -6,6 +6,7 @@ import numpy.typing as npt
 
 from napari.layers.points._points_constants import (
     SYMBOL_ALIAS,
+    SYMBOL_CODES,
     SYMBOL_DICT,
     Symbol,
 )
@@ -257,6 +258,15 @@ def fix_data_points(
     return points, ndim
 
 
+def geometric_mean(values: npt.ArrayLike) -> float:
+    """Return the geometric mean of positive values.
+
+    Equivalent to ``scipy.stats.gmean`` for 1D input, without paying the
+    import cost of ``scipy.stats``.
+    """
+    return float(np.exp(np.mean(np.log(values))))
+
+
 def symbol_conversion(symbol: Union[str, Symbol]) -> Symbol:
     """
     Convert a string or Symbol to a Symbol instance.
@@ -303,3 +313,88 @@ def coerce_symbols(
         symbol = np.array(symbol)
 
     return fast_dict_get(symbol, SYMBOL_DICT)
+
+
+# Symbols indexed by their integer code, see SYMBOL_CODES
+SYMBOLS = np.array(list(Symbol), dtype=object)
+
+
+def coerce_symbol_codes(
+    symbol: Union[str, Symbol, Sequence[Union[str, Symbol]], np.ndarray],
+) -> np.ndarray:
+    """
+    Parse an array of symbols and convert it to integer symbol codes.
+    If single value is given, it is converted to a 0-d array.
+
+    Parameters
+    ----------
+    symbol : str or Symbol or Sequence of str or Symbol or array of int
+        data to be converted to symbol codes. Integer arrays are taken
+        to already contain symbol codes, see SYMBOL_CODES.
+
+    Returns
+    -------
+    codes : np.ndarray of np.int8
+        codes of the symbols, such that ``SYMBOLS[codes]`` are the Symbols.
+    """
+    if isinstance(symbol, (str, Symbol)):
+        return np.array(SYMBOL_CODES[symbol_conversion(symbol)], dtype=np.int8)
+
+    symbol = np.asarray(symbol)
+    if symbol.dtype.kind in 'iu':
+        if symbol.size and (symbol.min() < 0 or symbol.max() >= len(SYMBOLS)):
+            raise ValueError(
+                trans._(
+                    'symbol codes must be between 0 and {max_code}',
+                    deferred=True,
+                    max_code=len(SYMBOLS) - 1,
+                )
+            )
+        return symbol.astype(np.int8)
+    if symbol.dtype.kind in 'US':
+        # only look up the distinct strings
+        unique, inverse = np.unique(symbol, return_inverse=True)
+        codes = np.array([SYMBOL_CODES[str(x)] for x in unique], np.int8)
+        return codes[inverse].reshape(symbol.shape)
+    return fast_dict_get(symbol, SYMBOL_CODES).astype(np.int8)
+
+
+class _SymbolArray(np.ndarray):
+    """Object array of Symbols that writes assigned symbols to their codes.
+
+    Created with :meth:`from_codes`, the array keeps a reference to the codes
+    it was built from, so that ``symbol[i] = 'x'`` also updates the codes.
+    Views obtained by indexing also write back, but copies do not.
+    """
+
+    _codes: Optional[np.ndarray] = None
+
+    @classmethod
+    def from_codes(cls, codes: np.ndarray) -> '_SymbolArray':
+        symbol = SYMBOLS[codes].view(cls)
+        symbol._codes = codes
+        return symbol
+
+    def __array_finalize__(self, obj) -> None:
+        self._codes = None
+
+    def __getitem__(self, key):
+        item = super().__getitem__(key)
+        if (
+            isinstance(item, _SymbolArray)
+            and self._codes is not None
+            and np.may_share_memory(item, self)
+        ):
+            # a view, which writes to the matching view of the codes
+            item._codes = self._codes[key]
+        return item
+
+    def __setitem__(self, key, value) -> None:
+        if self.dtype != object:
+            # e.g. the result of a comparison
+            super().__setitem__(key, value)
+            return
+        codes = coerce_symbol_codes(value)
+        super().__setitem__(key, SYMBOLS[codes])
+        if self._codes is not None:
+            self._codes[key] = codes
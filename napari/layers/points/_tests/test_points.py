@@ -23,6 +23,7 @@ from napari.layers.utils._slice_input import _SliceInput, _ThickNDSlice
 from napari.layers.utils._text_constants import Anchor
 from napari.layers.utils.color_encoding import ConstantColorEncoding
 from napari.layers.utils.color_manager import ColorProperties
+from napari.layers.utils.style_encoding import _DerivedStyleEncoding
 from napari.utils._test_utils import (
     validate_all_params_in_docstring,
     validate_docstring_parent_class_consistency,
@@ -389,6 +390,29 @@ def test_adding_points():
     np.testing.assert_equal(layer.data, np.vstack((data, coord)))
 
 
+def test_adding_points_with_features():
+    """Test adding Points data with the features of the new points."""
+    data = 20 * np.random.random((10, 2))
+    features = pd.DataFrame({'value': np.arange(10.0)})
+    layer = Points(data, features=features, face_color='value')
+
+    layer.add([[10, 10], [15, 15]], features={'value': [20.0, 5.0]})
+    assert len(layer.data) == 12
+    np.testing.assert_array_equal(
+        layer.features['value'], np.append(np.arange(10.0), [20.0, 5.0])
+    )
+    # the colors are mapped from the added features, not the current ones
+    np.testing.assert_array_equal(layer.face_color[-1], layer.face_color[5])
+    assert not np.array_equal(layer.face_color[-2], layer.face_color[-1])
+
+    with pytest.raises(ValueError, match='Length'):
+        layer.add([[1, 1]], features={'value': [1.0, 2.0]})
+    # the values of a new column are unknown for the existing points
+    with pytest.raises(ValueError, match='not in the features table'):
+        layer.add([[1, 1]], features={'other': [1.0]})
+    assert len(layer.data) == 12
+
+
 def test_points_selection_with_setter():
     shape = (10, 2)
     np.random.seed(0)
@@ -684,6 +708,22 @@ def test_symbol():
     assert np.array_equiv(layer.symbol, 'star')
 
 
+def test_symbol_in_place():
+    """Test that symbols changed in place are written back to the codes."""
+    layer = Points(np.zeros((3, 2)))
+    symbol = layer.symbol
+    assert layer.symbol is symbol
+    layer.symbol[1] = 'x'
+    assert np.array_equal(layer.symbol, ['disc', 'x', 'disc'])
+    assert np.array_equal(layer._view_symbol, ['disc', 'x', 'disc'])
+    layer.symbol[1:][1] = 'star'
+    assert np.array_equal(layer._view_symbol, ['disc', 'x', 'star'])
+
+    layer.symbol = 'square'
+    assert layer.symbol is not symbol
+    assert np.array_equiv(layer.symbol, 'square')
+
+
 properties_array = {'point_type': _make_cycled_properties(['A', 'B'], 10)}
 properties_list = {'point_type': list(_make_cycled_properties(['A', 'B'], 10))}
 
@@ -2661,3 +2701,36 @@ def test_docstring():
     validate_all_params_in_docstring(Points)
     validate_kwargs_sorted(Points)
     validate_docstring_parent_class_consistency(Points)
+
+
+def test_view_colors_mapped_lazily(monkeypatch):
+    monkeypatch.setattr(_DerivedStyleEncoding, '_chunk_size', 4)
+    data = np.column_stack([np.arange(12) % 3, np.arange(12), np.arange(12)])
+    features = pd.DataFrame(
+        {'quantity': np.linspace(0, 1, 12), 'kind': list('abcd') * 3}
+    )
+    layer = Points(
+        data,
+        features=features,
+        face_color='quantity',
+        border_color='kind',
+        border_color_cycle=['red', 'blue'],
+    )
+    layer._slice_dims(Dims(ndim=3, point=(1, 0, 0)))
+    np.testing.assert_array_equal(layer._indices_view, [1, 4, 7, 10])
+    view_face_color = layer._view_face_color
+    view_border_color = layer._view_border_color
+    # only the points in view are mapped to colors
+    assert not isinstance(layer._face.__dict__['colors'], np.ndarray)
+    assert not isinstance(layer._border.__dict__['colors'], np.ndarray)
+
+    np.testing.assert_allclose(
+        view_face_color, layer.face_color[layer._indices_view]
+    )
+    np.testing.assert_allclose(
+        view_border_color,
+        transform_color(['blue', 'red', 'blue', 'red']),
+    )
+    np.testing.assert_allclose(
+        layer.border_color, transform_color(['red', 'blue'] * 6)
+    )
@@ -1,8 +1,12 @@
 import numpy as np
+import pytest
 
+from napari.layers.points._points_constants import Symbol
 from napari.layers.points._points_utils import (
+    SYMBOLS,
     _create_box_from_corners_3d,
     _points_in_box_3d,
+    coerce_symbol_codes,
 )
 
 
@@ -35,3 +39,27 @@ def test_points_in_box_3d():
     )
 
     assert set(inside) == {0, 2}
+
+
+@pytest.mark.parametrize(
+    'symbol',
+    [
+        ['o', 'square', '*', 'disc'],
+        np.array(['o', 'square', '*', 'disc']),
+        np.array([Symbol.DISC, 's', 'star', 'disc'], dtype=object),
+    ],
+)
+def test_coerce_symbol_codes(symbol):
+    codes = coerce_symbol_codes(symbol)
+    assert codes.dtype == np.int8
+    expected = [Symbol.DISC, Symbol.SQUARE, Symbol.STAR, Symbol.DISC]
+    np.testing.assert_array_equal(SYMBOLS[codes], expected)
+    np.testing.assert_array_equal(coerce_symbol_codes(codes), codes)
+
+
+def test_coerce_symbol_codes_single():
+    code = coerce_symbol_codes('+')
+    assert code.ndim == 0
+    assert SYMBOLS[code] == Symbol.CROSS
+    with pytest.raises(ValueError, match='symbol codes'):
+        coerce_symbol_codes(np.array([len(SYMBOLS)]))
@@ -17,7 +17,6 @@ import numpy as np
 import numpy.typing as npt
 import pandas as pd
 from psygnal.containers import Selection
-from scipy.stats import gmean
 
 from napari.layers.base import Layer, no_op
 from napari.layers.base._base_constants import ActionType
@@ -26,16 +25,21 @@ from napari.layers.base._base_mouse_bindings import (
     transform_with_box,
 )
 from napari.layers.points._points_constants import (
+    SYMBOL_CODES,
     Mode,
     PointsProjectionMode,
     Shading,
 )
 from napari.layers.points._points_mouse_bindings import add, highlight, select
 from napari.layers.points._points_utils import (
+    SYMBOLS,
     _create_box_from_corners_3d,
+    _SymbolArray,
+    coerce_symbol_codes,
     coerce_symbols,
     create_box,
     fix_data_points,
+    geometric_mean,
     points_to_squares,
 )
 from napari.layers.points._slice import _PointSliceRequest, _PointSliceResponse
@@ -50,6 +54,7 @@ from napari.layers.utils.layer_utils import (
     _features_to_properties,
     _FeatureTable,
     _unique_element,
+    _validate_features,
 )
 from napari.layers.utils.text_manager import TextManager
 from napari.utils.colormaps import Colormap, ValidColormapArg
@@ -303,11 +308,14 @@ class Points(Layer):
         Size of the point markers in the currently viewed slice.
     _view_symbol : array (M, )
         Symbols of the point markers in the currently viewed slice.
+    _view_symbol_codes : array (M, )
+        Integer codes of the symbols of the point markers in the currently
+        viewed slice.
     _view_border_width : array (M, )
         Border width of the point markers in the currently viewed slice.
     _indices_view : array (M, )
         Integer indices of the points in the currently viewed slice and are shown.
-    _selected_view :
+    _selected_view : array (K, )
         Integer indices of selected points in the currently viewed slice within
         the `_view_data` array.
     _selected_box : array (4, 2) or None
@@ -433,14 +441,18 @@ class Points(Layer):
         data, ndim = fix_data_points(data, ndim)
 
         # Indices of selected points
-        self._selected_data_stored = set()
+        self._selection_version = 0
+        self._selection_version_stored = None
         self._selected_data_history = set()
         # Indices of selected points within the currently viewed slice
-        self._selected_view = []
+        self._selected_view = np.empty(0, int)
         # Index of hovered point
         self._value = None
         self._value_stored = None
-        self._highlight_index = []
+        # Indices within the currently viewed slice of the highlighted
+        # selected points, and of the hovered point if it is not selected
+        self._highlight_selected = np.empty(0, int)
+        self._highlight_hover = None
         self._highlight_box = None
 
         self._drag_start = None
@@ -541,10 +553,13 @@ class Points(Layer):
 
         # Indices of selected points
         self._selected_data: Selection[int] = Selection()
-        self._selected_data_stored = set()
+        self._selected_data.events.items_changed.connect(
+            self._on_selected_data_change
+        )
+        self._selection_version_stored = None
         self._selected_data_history = set()
         # Indices of selected points within the currently viewed slice
-        self._selected_view = []
+        self._selected_view = np.empty(0, int)
 
         # The following point properties are for the new points that will
         # be added. For any given property, if a list is passed to the
@@ -594,6 +609,8 @@ class Points(Layer):
         # Save the point style params
         self.size = size
         self.shown = shown
+        # Symbols built from the codes, see the symbol property
+        self._symbol: Optional[_SymbolArray] = None
         self.symbol = symbol
         self.border_width = border_width
         self.border_width_is_relative = border_width_is_relative
@@ -670,8 +687,21 @@ class Points(Layer):
             kwargs['action'] = ActionType.REMOVED
         self.events.data(**kwargs)
 
-    def _set_data(self, data: Optional[np.ndarray]) -> None:
-        """Set the .data array attribute, without emitting an event."""
+    def _set_data(
+        self,
+        data: Optional[np.ndarray],
+        features: Optional[pd.DataFrame] = None,
+    ) -> None:
+        """Set the .data array attribute, without emitting an event.
+
+        Parameters
+        ----------
+        data : array (N, D)
+            The new point coordinates.
+        features : pd.DataFrame, optional
+            Features of the points appended at the end of data, if any. By
+            default, the appended points use the feature defaults.
+        """
         data, _ = fix_data_points(data, self.ndim)
         cur_npoints = len(self._data)
         self._data = data
@@ -682,23 +712,23 @@ class Points(Layer):
             self._border.events.blocker_all(),
             self._face.events.blocker_all(),
         ):
-            self._feature_table.resize(len(data))
+            self._feature_table.resize(len(data), features)
             self.text.apply(self.features)
             if len(data) < cur_npoints:
                 # If there are now fewer points, remove the size and colors of the
                 # extra ones
-                if len(self._border.colors) > len(data):
+                if self._border._n_colors() > len(data):
                     self._border._remove(
-                        np.arange(len(data), len(self._border.colors))
+                        np.arange(len(data), self._border._n_colors())
                     )
-                if len(self._face.colors) > len(data):
+                if self._face._n_colors() > len(data):
                     self._face._remove(
-                        np.arange(len(data), len(self._face.colors))
+                        np.arange(len(data), self._face._n_colors())
                     )
                 self._shown = self._shown[: len(data)]
                 self._size = self._size[: len(data)]
                 self._border_width = self._border_width[: len(data)]
-                self._symbol = self._symbol[: len(data)]
+                self._symbol_codes = self._symbol_codes[: len(data)]
 
             elif len(data) > cur_npoints:
                 # If there are now more points, add the size and colors of the
@@ -712,20 +742,33 @@ class Points(Layer):
                     new_border_width = self.current_border_width
                 border_width = np.repeat([new_border_width], adding, axis=0)
 
-                if len(self._symbol) > 0:
-                    new_symbol = copy(self._symbol[-1])
+                if len(self._symbol_codes) > 0:
+                    new_symbol = self._symbol_codes[-1]
                 else:
-                    new_symbol = self.current_symbol
-                symbol = np.repeat([new_symbol], adding, axis=0)
+                    new_symbol = SYMBOL_CODES[self.current_symbol]
+                symbol = np.full(adding, new_symbol, dtype=np.int8)
 
                 # Add new colors, updating the current property value before
                 # to handle any in-place modification of feature_defaults.
                 # Also see: https://github.com/napari/napari/issues/5634
                 current_properties = self._feature_table.currents()
-                self._border._update_current_properties(current_properties)
-                self._border._add(n_colors=adding)
-                self._face._update_current_properties(current_properties)
-                self._face._add(n_colors=adding)
+                new_properties = _features_to_properties(
+                    self._feature_table.values.iloc[cur_npoints:]
+                )
+                for color_manager in (self._border, self._face):
+                    if (
+                        features is None
+                        or color_manager.color_mode == ColorMode.DIRECT
+                    ):
+                        color_manager._update_current_properties(
+                            current_properties
+                        )
+                        color_manager._add(n_colors=adding)
+                    else:
+                        # colors are mapped from the given features
+                        color_manager._paste(
+                            colors=None, properties=new_properties
+                        )
 
                 shown = np.repeat([True], adding, axis=0)
                 self._shown = np.concatenate((self._shown, shown), axis=0)
@@ -734,19 +777,26 @@ class Points(Layer):
                 self.border_width = np.concatenate(
                     (self._border_width, border_width), axis=0
                 )
-                self.symbol = np.concatenate((self._symbol, symbol), axis=0)
+                self.symbol = np.concatenate(
+                    (self._symbol_codes, symbol), axis=0
+                )
 
         self._update_dims()
         self._reset_editable()
 
     def _on_selection(self, selected: bool) -> None:
         if selected:
-            self._set_highlight()
+            self._set_highlight(force=True)
         else:
             self._highlight_box = None
-            self._highlight_index = []
+            self._highlight_selected = np.empty(0, int)
+            self._highlight_hover = None
             self.events.highlight()
 
+    def _on_selected_data_change(self) -> None:
+        """Mark the highlight as stale when the selected points change."""
+        self._selection_version += 1
+
     @property
     def features(self) -> pd.DataFrame:
         """Dataframe-like features table.
@@ -936,17 +986,28 @@ class Points(Layer):
 
     @property
     def symbol(self) -> np.ndarray:
-        """str: symbol used for all point markers."""
+        """(N,) array of Symbol: symbol of each point marker.
+
+        The symbols can be set from symbol names, Symbols, or their integer
+        codes (see ``SYMBOL_CODES``), which is how they are stored. The
+        Symbols are built once per change of the codes, and symbols assigned
+        in place are written back to the codes.
+        """
+        if (
+            self._symbol is None
+            or self._symbol._codes is not self._symbol_codes
+        ):
+            self._symbol = _SymbolArray.from_codes(self._symbol_codes)
         return self._symbol
 
     @symbol.setter
     def symbol(self, symbol: Union[str, np.ndarray, list]) -> None:
-        coerced_symbols = coerce_symbols(symbol)
+        codes = coerce_symbol_codes(symbol)
         # If a single symbol has been converted, this will broadcast it to
         # the number of points in the data. If symbols is alread an array,
         # this will check that it is the correct length.
-        coerced_symbols = np.broadcast_to(coerced_symbols, self.data.shape[0])
-        self._symbol = coerced_symbols
+        codes = np.broadcast_to(codes, self.data.shape[0])
+        self._symbol_codes = np.array(codes, dtype=np.int8)
         self.events.symbol()
         self.events.highlight()
 
@@ -960,7 +1021,8 @@ class Points(Layer):
         symbol = coerce_symbols(np.array([symbol]))[0]
         self._current_symbol = symbol
         if self._update_properties and len(self.selected_data) > 0:
-            self.symbol[list(self.selected_data)] = symbol
+            self._symbol_codes[list(self.selected_data)] = SYMBOL_CODES[symbol]
+            self._symbol = None
             self.events.symbol()
         self.events.current_symbol()
 
@@ -1485,13 +1547,11 @@ class Points(Layer):
     def selected_data(self, selected_data: Sequence[int]) -> None:
         self._selected_data.clear()
         self._selected_data.update(set(selected_data))
-        self._selected_view = list(
-            np.intersect1d(
-                np.array(list(self._selected_data)),
-                self._indices_view,
-                return_indices=True,
-            )[2]
-        )
+        self._selected_view = np.intersect1d(
+            np.array(list(self._selected_data)),
+            self._indices_view,
+            return_indices=True,
+        )[2]
 
         # Update properties based on selected points
         if not len(self._selected_data):
@@ -1579,7 +1639,7 @@ class Points(Layer):
             self.selected_data = set()
             self.mouse_pan = True
         elif mode != Mode.SELECT or self._mode != Mode.SELECT:
-            self._selected_data_stored = set()
+            self._selection_version_stored = None
 
         self._set_highlight()
         return mode
@@ -1678,7 +1738,18 @@ class Points(Layer):
         symbol : (N,) np.ndarray
             Array of symbol strings for the N points in view
         """
-        return self.symbol[self._indices_view]
+        return SYMBOLS[self._view_symbol_codes]
+
+    @property
+    def _view_symbol_codes(self) -> np.ndarray:
+        """Get the symbol codes of the points in view
+
+        Returns
+        -------
+        symbol : (N,) np.ndarray of np.int8
+            Array of symbol codes for the N points in view, see SYMBOL_CODES
+        """
+        return self._symbol_codes[self._indices_view]
 
     @property
     def _view_border_width(self) -> np.ndarray:
@@ -1701,7 +1772,7 @@ class Points(Layer):
             RGBA color array for the face colors of the N points in view.
             If there are no points in view, returns array of length 0.
         """
-        return self.face_color[self._indices_view]
+        return self._face._take(self._indices_view)
 
     @property
     def _view_border_color(self) -> np.ndarray:
@@ -1713,7 +1784,7 @@ class Points(Layer):
             RGBA color array for the border colors of the N points in view.
             If there are no points in view, returns array of length 0.
         """
-        return self.border_color[self._indices_view]
+        return self._border._take(self._indices_view)
 
     def _reset_editable(self) -> None:
         """Set editable mode based on layer properties."""
@@ -1730,11 +1801,22 @@ class Points(Layer):
         self, scale_factor, corner_pixels_displayed, shape_threshold
     ):
         prev_scale = self.scale_factor
+        prev_corners = self.corner_pixels
         super()._update_draw(
             scale_factor, corner_pixels_displayed, shape_threshold
         )
         # update highlight only if scale has changed, otherwise causes a cycle
         self._set_highlight(force=(prev_scale != self.scale_factor))
+        # the text is culled to the canvas when there are too many elements
+        if (
+            self.text.visible
+            and len(self._indices_view) > self.text._max_view_count
+            and (
+                prev_scale != self.scale_factor
+                or not np.array_equal(prev_corners, self.corner_pixels)
+            )
+        ):
+            self.text.events(Event(type_name='refresh'))
 
     def _get_value(self, position) -> Optional[int]:
         """Index of the point at a given 2D position in data coordinates.
@@ -1955,13 +2037,11 @@ class Points(Layer):
 
         self._indices_view = np.array(indices, dtype=int)
         # get the selected points that are in view
-        self._selected_view = list(
-            np.intersect1d(
-                np.array(list(self._selected_data)),
-                self._indices_view,
-                return_indices=True,
-            )[2]
-        )
+        self._selected_view = np.intersect1d(
+            np.array(list(self._selected_data)),
+            self._indices_view,
+            return_indices=True,
+        )[2]
         with self.events.highlight.blocker():
             self._set_highlight(force=True)
 
@@ -1975,45 +2055,33 @@ class Points(Layer):
         force : bool
             Bool that forces a redraw to occur when `True`
         """
-        # Check if any point ids have changed since last call
+        # Check if any point ids have changed since last call. The selection
+        # is only compared by version, so hovering does not scale with the
+        # number of selected points.
         if (
-            self.selected_data == self._selected_data_stored
+            self._selection_version == self._selection_version_stored
             and self._value == self._value_stored
             and np.array_equal(self._drag_box, self._drag_box_stored)
         ) and not force:
             return
-        self._selected_data_stored = Selection(self.selected_data)
+        self._selection_version_stored = self._selection_version
         self._value_stored = copy(self._value)
         self._drag_box_stored = copy(self._drag_box)
 
-        if self._value is not None or len(self._selected_view) > 0:
-            if len(self._selected_view) > 0:
-                index = copy(self._selected_view)
-                # highlight the hovered point if not in adding mode
-                if (
-                    self._value in self._indices_view
-                    and self._mode == Mode.SELECT
-                    and not self._is_selecting
-                ):
-                    hover_point = list(self._indices_view).index(self._value)
-                    if hover_point not in index:
-                        index.append(hover_point)
-                index.sort()
-            else:
-                # only highlight hovered points in select mode
-                if (
-                    self._value in self._indices_view
-                    and self._mode == Mode.SELECT
-                    and not self._is_selecting
-                ):
-                    hover_point = list(self._indices_view).index(self._value)
-                    index = [hover_point]
-                else:
-                    index = []
-
-            self._highlight_index = index
-        else:
-            self._highlight_index = []
+        # the selected points are highlighted as a whole, and the hovered
+        # point separately so that hovering only updates a single marker
+        self._highlight_selected = self._selected_view
+        self._highlight_hover = None
+        # only highlight hovered points in select mode
+        if (
+            self._value is not None
+            and self._mode == Mode.SELECT
+            and not self._is_selecting
+            and self._value not in self._selected_data
+        ):
+            hover_point = np.flatnonzero(self._indices_view == self._value)
+            if len(hover_point) > 0:
+                self._highlight_hover = int(hover_point[0])
 
         # only display dragging selection box in 2D
         if self._is_selecting:
@@ -2070,20 +2138,33 @@ class Points(Layer):
             # Draw single pixel points in the colormapped thumbnail.
             colormapped = np.zeros((*thumbnail_shape, 4))
             colormapped[..., 3] = 1
-            colors = self._face.colors[thumbnail_indices]
+            colors = self._face._take(thumbnail_indices)
             colormapped[coords[:, 0], coords[:, 1]] = colors
 
         colormapped[..., 3] *= self.opacity
         self.thumbnail = colormapped
 
-    def add(self, coords):
+    def add(
+        self,
+        coords,
+        *,
+        features: Optional[Union[dict[str, Array], pd.DataFrame]] = None,
+    ):
         """Adds points at coordinates.
 
         Parameters
         ----------
         coords : array
             Point or points to add to the layer data.
+        features : dict or DataFrame, optional
+            Features of the added points, with one row per point. Colors
+            mapped from features use these values. By default, the added
+            points use the feature defaults.
         """
+        coords = np.atleast_2d(coords)
+        if features is not None:
+            features = _validate_features(features, num_data=len(coords))
+            self._feature_table.check_columns(features)
         cur_points = len(self.data)
         self.events.data(
             value=self.data,
@@ -2091,7 +2172,7 @@ class Points(Layer):
             data_indices=(-1,),
             vertex_indices=((),),
         )
-        self._set_data(np.append(self.data, np.atleast_2d(coords), axis=0))
+        self._set_data(np.append(self.data, coords, axis=0), features)
         self.events.data(
             value=self.data,
             action=ActionType.ADDED,
@@ -2115,7 +2196,7 @@ class Points(Layer):
             )
             self._shown = np.delete(self._shown, index, axis=0)
             self._size = np.delete(self._size, index, axis=0)
-            self._symbol = np.delete(self._symbol, index, axis=0)
+            self._symbol_codes = np.delete(self._symbol_codes, index, axis=0)
             self._border_width = np.delete(self._border_width, index, axis=0)
             with self._border.events.blocker_all():
                 self._border._remove(indices_to_remove=index)
@@ -2224,8 +2305,8 @@ class Points(Layer):
             self._size = np.append(
                 self.size, deepcopy(self._clipboard['size']), axis=0
             )
-            self._symbol = np.append(
-                self.symbol, deepcopy(self._clipboard['symbol']), axis=0
+            self._symbol_codes = np.append(
+                self._symbol_codes, self._clipboard['symbol'], axis=0
             )
 
             self._feature_table.append(self._clipboard['features'])
@@ -2250,8 +2331,8 @@ class Points(Layer):
                 ),
             )
 
-            self._selected_view = list(
-                range(npoints, npoints + len(self._clipboard['data']))
+            self._selected_view = np.arange(
+                npoints, npoints + len(self._clipboard['data'])
             )
             self._selected_data.update(
                 set(range(totpoints, totpoints + len(self._clipboard['data'])))
@@ -2268,7 +2349,7 @@ class Points(Layer):
                 'face_color': deepcopy(self.face_color[index]),
                 'shown': deepcopy(self.shown[index]),
                 'size': deepcopy(self.size[index]),
-                'symbol': deepcopy(self.symbol[index]),
+                'symbol': self._symbol_codes[index],
                 'border_width': deepcopy(self.border_width[index]),
                 'features': deepcopy(self.features.iloc[index]),
                 'indices': self._data_slice,
@@ -2323,9 +2404,11 @@ class Points(Layer):
         # keep the balls isotropic when visualized in world coordinates.
         # The geometric means are used instead of the arithmetic mean
         # to maintain the volume scaling factor of the transforms.
-        point_data_to_world_scale = gmean(np.abs(self._data_to_world.scale))
+        point_data_to_world_scale = geometric_mean(
+            np.abs(self._data_to_world.scale)
+        )
         mask_world_to_data_scale = (
-            gmean(np.abs(mask_world_to_data.scale))
+            geometric_mean(np.abs(mask_world_to_data.scale))
             if isotropic_output
             else np.abs(mask_world_to_data.scale)
         )
@@ -110,6 +110,9 @@ class ShapeList:
         # Counter of number of time _update_displayed has been requested
         self.__update_displayed_called = 0
 
+        # selected shapes and their outlines, see `cached_outlines`
+        self._outline_cache = None
+
         for d in data:
             self.add(d)
 
@@ -266,6 +269,7 @@ class ShapeList:
         assert (
             self.__batched_level >= 1
         ), 'call _update_displayed from within self.batched_updates context manager'
+        self._outline_cache = None
         if not self.__batch_force_call:
             self.__update_displayed_called += 1
             return
@@ -333,6 +337,7 @@ class ShapeList:
             When adding a batch of shapes, set to false  and then call
             ShapesList._update_z_order() once at the end.
         """
+        self._outline_cache = None
         # single shape mode
         if issubclass(type(shape), Shape):
             self._add_single_shape(
@@ -682,6 +687,7 @@ class ShapeList:
             expectation is that this shape is being immediately added back to the
             list using `add_shape`.
         """
+        self._outline_cache = None
         indices = self._index != index
         self._vertices = self._vertices[indices]
         self._index = self._index[indices]
@@ -1058,34 +1064,50 @@ class ShapeList:
         triangles : np.ndarray
             Mx3 array of any indices of vertices for triangles of outline
         """
-        indices_set = set(indices)
-        meshes = self._mesh.triangles_index
-        triangle_indices = [
-            i
-            for i, x in enumerate(meshes)
-            if x[0] in indices_set and x[1] == 1
-        ]
-        meshes = self._mesh.vertices_index
-        vertices_indices = [
-            i
-            for i, x in enumerate(meshes)
-            if x[0] in indices_set and x[1] == 1
-        ]
-
-        offsets = self._mesh.vertices_offsets[vertices_indices]
-        centers = self._mesh.vertices_centers[vertices_indices]
-        triangles = self._mesh.triangles[triangle_indices]
+        indices = np.asarray(indices, dtype=int)
+        triangles_index = self._mesh.triangles_index
+        vertices_index = self._mesh.vertices_index
+        triangles_mask = np.isin(triangles_index[:, 0], indices) & (
+            triangles_index[:, 1] == 1
+        )
+        vertices_mask = np.isin(vertices_index[:, 0], indices) & (
+            vertices_index[:, 1] == 1
+        )
 
-        t_ind = self._mesh.triangles_index[triangle_indices][:, 0]
-        inds = self._mesh.vertices_index[vertices_indices][:, 0]
-        starts = np.unique(inds, return_index=True)[1]
-        for i, ind in enumerate(indices):
-            inds = t_ind == ind
-            adjust_index = starts[i] - vertices_indices[starts[i]]
-            triangles[inds] = triangles[inds] + adjust_index
+        offsets = self._mesh.vertices_offsets[vertices_mask]
+        centers = self._mesh.vertices_centers[vertices_mask]
+        # renumber the triangles vertices to index the outline vertices
+        renumbered = np.cumsum(vertices_mask) - 1
+        triangles = renumbered[self._mesh.triangles[triangles_mask]]
 
         return centers, offsets, triangles
 
+    def cached_outlines(self, indices: set[int]):
+        """Finds outlines of shapes in indices, reusing the last outlines.
+
+        The outlines are cached until the selected shapes or any shapes
+        change, so that e.g. hovering over shapes does not compute the
+        outlines of a large selection again.
+
+        Parameters
+        ----------
+        indices : set of int
+            Location in list of the shapes to be outline.
+
+        Returns
+        -------
+        centers : np.ndarray
+            Nx2 array of centers of outline
+        offsets : np.ndarray
+            Nx2 array of offsets of outline
+        triangles : np.ndarray
+            Mx3 array of any indices of vertices for triangles of outline
+        """
+        if self._outline_cache is None or self._outline_cache[0] != indices:
+            outlines = self.outlines(np.fromiter(indices, dtype=int))
+            self._outline_cache = (set(indices), *outlines)
+        return self._outline_cache[1:]
+
     def shapes_in_box(self, corners):
         """Determines which shapes, if any, are inside an axis aligned box.
 
@@ -1,5 +1,4 @@
 import numpy as np
-from scipy.interpolate import splev, splprep
 
 from napari.layers.shapes._shapes_models.shape import Shape
 from napari.layers.shapes._shapes_utils import create_box
@@ -98,6 +97,8 @@ class PolygonBase(Shape):
             self.interpolation_order > 1
             and len(data_spline) > self.interpolation_order
         ):
+            from scipy.interpolate import splev, splprep
+
             data = data_spline.copy()
             if self._closed:
                 data = np.append(data, data[:1], axis=0)
@@ -3,7 +3,6 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 import numpy as np
-from skimage.draw import line, polygon2mask
 from vispy.geometry import PolygonData
 from vispy.visuals.tube import _frenet_frames
 
@@ -898,6 +897,8 @@ def path_to_mask(
     duplicates = np.concatenate(([False], duplicates))
     vertices = vertices[~duplicates]
 
+    from skimage.draw import line
+
     iis, jjs = [], []
     for v1, v2 in zip(vertices, vertices[1:]):
         ii, jj = line(*v1, *v2)
@@ -928,6 +929,8 @@ def poly_to_mask(
     mask : np.ndarray
         Boolean array with `True` for points inside the polygon
     """
+    from skimage.draw import polygon2mask
+
     return polygon2mask(mask_shape, vertices)
 
 
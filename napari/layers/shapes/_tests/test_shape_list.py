@@ -57,6 +57,46 @@ def test_shape_list_outline():
         assert np.array_equal(value_by_idx, value_by_idx_np)
 
 
+def test_shape_list_outlines():
+    """Test the outlines of several shapes are those of each shape."""
+    np.random.seed(0)
+    shape_list = ShapeList()
+    for _ in range(4):
+        shape_list.add(Polygon(20 * np.random.random((5, 2))))
+    # edit a shape, which moves its mesh to the end of the mesh arrays
+    shape_list.edit(1, 20 * np.random.random((6, 2)))
+
+    centers, offsets, triangles = shape_list.outlines([1, 3])
+    expected = [shape_list.outline(i) for i in [3, 1]]
+    np.testing.assert_array_equal(
+        centers, np.concatenate([e[0] for e in expected])
+    )
+    np.testing.assert_array_equal(
+        offsets, np.concatenate([e[1] for e in expected])
+    )
+    np.testing.assert_array_equal(
+        centers[triangles],
+        np.concatenate([e[0][e[2]] for e in expected]),
+    )
+
+
+def test_shape_list_cached_outlines():
+    """Test the cached outlines are reused until the shapes change."""
+    np.random.seed(0)
+    shape_list = ShapeList()
+    for _ in range(3):
+        shape_list.add(Rectangle(20 * np.random.random((4, 2))))
+
+    outlines = shape_list.cached_outlines({0, 2})
+    assert shape_list.cached_outlines({0, 2})[0] is outlines[0]
+
+    shape_list.shift(0, np.array([1, 1]))
+    shifted = shape_list.cached_outlines({0, 2})
+    assert shifted[0] is not outlines[0]
+    np.testing.assert_allclose(shifted[0], shape_list.outlines([0, 2])[0])
+    assert len(shape_list.cached_outlines({0})[0]) < len(shifted[0])
+
+
 def test_nD_shapes():
     """Test adding shapes to ShapeList."""
     np.random.seed(0)
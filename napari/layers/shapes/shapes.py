@@ -2443,29 +2443,29 @@ class Shapes(Layer):
             Mx3 array of any indices of vertices for triangles of outline or
             None
         """
-        if self._value is not None and (
-            self._value[0] is not None or len(self.selected_data) > 0
+        if self._value is None or (
+            self._value[0] is None and len(self.selected_data) == 0
         ):
-            if len(self.selected_data) > 0:
-                index = list(self.selected_data)
-                if self._value[0] is not None:
-                    if self._value[0] in index:
-                        pass
-                    else:
-                        index.append(self._value[0])
-                index.sort()
-            else:
-                index = self._value[0]
+            return None, None
 
-            centers, offsets, triangles = self._data_view.outline(index)
-            vertices = centers + (
-                self._normalized_scale_factor * self._highlight_width * offsets
+        centers, offsets, triangles = self._data_view.cached_outlines(
+            self.selected_data
+        )
+        hovered = self._value[0]
+        if hovered is not None and hovered not in self.selected_data:
+            hover_centers, hover_offsets, hover_triangles = (
+                self._data_view.outline(hovered)
             )
-            vertices = vertices[:, ::-1]
-        else:
-            vertices = None
-            triangles = None
+            triangles = np.concatenate(
+                [triangles, hover_triangles + len(centers)]
+            )
+            centers = np.concatenate([centers, hover_centers])
+            offsets = np.concatenate([offsets, hover_offsets])
 
+        vertices = centers + (
+            self._normalized_scale_factor * self._highlight_width * offsets
+        )
+        vertices = vertices[:, ::-1]
         return vertices, triangles
 
     def _compute_vertices_and_box(self):
@@ -2767,11 +2767,22 @@ class Shapes(Layer):
         self, scale_factor, corner_pixels_displayed, shape_threshold
     ):
         prev_scale = self.scale_factor
+        prev_corners = self.corner_pixels
         super()._update_draw(
             scale_factor, corner_pixels_displayed, shape_threshold
         )
         # update highlight only if scale has changed, otherwise causes a cycle
         self._set_highlight(force=(prev_scale != self.scale_factor))
+        # the text is culled to the canvas when there are too many elements
+        if (
+            self.text.visible
+            and len(self._indices_view) > self.text._max_view_count
+            and (
+                prev_scale != self.scale_factor
+                or not np.array_equal(prev_corners, self.corner_pixels)
+            )
+        ):
+            self.text.events(Event(type_name='refresh'))
 
     def _get_value(self, position):
         """Value of the data at a position in data coordinates.
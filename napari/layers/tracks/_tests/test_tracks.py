@@ -2,6 +2,7 @@ import numpy as np
 import pandas as pd
 import pytest
 
+from napari.components.dims import Dims
 from napari.layers import Tracks
 from napari.layers.tracks._track_utils import TrackManager
 from napari.utils._test_utils import (
@@ -296,6 +297,182 @@ def test_track_connex_validity() -> None:
     assert np.sum(~layer._manager.track_connex) == n_tracks
 
 
+def test_track_window() -> None:
+    """Test the time window of track vertices and their connections."""
+    # track 1 spans t=0..9, track 2 spans t=5..6
+    data = np.array(
+        [[1, t, t, t] for t in range(10)] + [[2, t, 0, t] for t in (5, 6)]
+    )
+    manager = Tracks(data)._manager
+
+    window = manager.track_window(3, 5)
+    # t=3..5 of track 1, its neighbours at t=2 and t=6, and track 2
+    np.testing.assert_array_equal(window, [2, 3, 4, 5, 6, 10, 11])
+    np.testing.assert_array_equal(
+        manager.track_window_connex(window),
+        [True, True, True, True, False, True, False],
+    )
+    assert len(manager.track_window(20, 30)) == 0
+
+
+def test_track_window_large_data() -> None:
+    """Test only large datasets are windowed, and only when fading."""
+    data = np.array([[1, t, t, t] for t in range(10)])
+    layer = Tracks(data, tail_length=2)
+    assert layer._track_window is None
+
+    layer._max_vertices_unwindowed = 5
+    layer._slice_dims(Dims(ndim=3, range=((0, 10, 1),) * 3, point=(4, 0, 0)))
+    np.testing.assert_array_equal(layer._track_window, [1, 2, 3, 4, 5])
+
+
+def test_track_graph_vertices() -> None:
+    """Test the graph joins the start of a track to the end of its parents."""
+    data = np.array(
+        [
+            [1, 0, 0, 0],
+            [1, 1, 1, 1],
+            [3, 2, 5, 5],
+            [3, 3, 6, 6],
+            [2, 2, 2, 2],
+            [2, 3, 3, 3],
+            [4, 4, 7, 7],
+        ]
+    )
+    layer = Tracks(data, graph={2: 1, 3: [1], 4: [2, 3]})
+
+    np.testing.assert_array_equal(
+        layer._manager.graph_vertices,
+        [
+            [2, 2, 2],
+            [1, 1, 1],
+            [2, 5, 5],
+            [1, 1, 1],
+            [4, 7, 7],
+            [3, 3, 3],
+            [4, 7, 7],
+            [3, 6, 6],
+        ],
+    )
+    np.testing.assert_array_equal(
+        layer._manager.graph_connex, [True, False] * 4
+    )
+
+    layer.graph = {1: []}
+    assert layer._manager.graph_vertices is None
+
+
+def test_track_get_value() -> None:
+    """Test the nearest track at the current time point is picked."""
+    data = np.array(
+        [
+            [1, 0, 0, 0],
+            [1, 1, 0, 0],
+            [2, 0, 10, 10],
+            [2, 1, 10, 10],
+            [3, 2, 5, 5],
+        ]
+    )
+    layer = Tracks(data)
+    assert layer.get_value((0, 1, 1)) == 1
+    assert layer.get_value((1, 9, 8)) == 2
+    # track 3 is the only one at time 2, even if far away
+    assert layer.get_value((2, 0, 0)) == 3
+    assert layer.get_value((5, 0, 0)) is None
+
+
+def test_track_append() -> None:
+    """Test appending points gives the same tracks as setting all data."""
+    rng = np.random.default_rng(0)
+    data = np.column_stack(
+        [
+            rng.integers(0, 5, 50),
+            rng.integers(0, 10, 50),
+            rng.random((50, 2)),
+        ]
+    )
+    data = np.unique(data, axis=0)
+    features = pd.DataFrame({'value': np.arange(len(data), dtype=float)})
+    expected = Tracks(data, features=features)
+
+    layer = Tracks(data[:30], features=features[:30])
+    layer.append(data[30:], features=features[30:])
+    np.testing.assert_array_equal(layer.data, expected.data)
+    np.testing.assert_array_equal(
+        layer._manager.track_vertices, expected._manager.track_vertices
+    )
+    np.testing.assert_array_equal(
+        layer._manager.track_connex, expected._manager.track_connex
+    )
+    np.testing.assert_array_equal(
+        layer._manager._id_starts, expected._manager._id_starts
+    )
+    assert layer._manager._points_lookup == expected._manager._points_lookup
+    np.testing.assert_allclose(layer.track_colors, expected.track_colors)
+    np.testing.assert_array_equal(
+        layer._manager.graph_vertices, expected._manager.graph_vertices
+    )
+    pd.testing.assert_frame_equal(layer.features, expected.features)
+    points = layer._manager._points
+    assert np.all(np.diff(points[:, 0]) >= 0)
+    np.testing.assert_array_equal(
+        points, layer.data[layer._manager._ordered_points_idx, 1:]
+    )
+    for t in range(10):
+        labels, _ = layer._manager.track_labels(t)
+        expected_labels, _ = expected._manager.track_labels(t)
+        assert sorted(labels) == sorted(expected_labels)
+        assert layer.get_value((t, 0.5, 0.5)) == expected.get_value(
+            (t, 0.5, 0.5)
+        )
+
+
+def test_track_append_frames() -> None:
+    """Test appending the points of each frame as they are tracked."""
+    rng = np.random.default_rng(1)
+    frames = [
+        np.column_stack([np.arange(4), np.full(4, t), rng.random((4, 2))])
+        for t in range(6)
+    ]
+    expected = Tracks(np.concatenate(frames))
+
+    layer = Tracks(frames[0])
+    for frame in frames[1:]:
+        layer.append(frame)
+
+    np.testing.assert_array_equal(layer.data, expected.data)
+    np.testing.assert_array_equal(
+        layer._manager.track_connex, expected._manager.track_connex
+    )
+    assert layer._manager._points_lookup == expected._manager._points_lookup
+    np.testing.assert_allclose(layer.track_colors, expected.track_colors)
+    np.testing.assert_array_equal(
+        layer._manager._vertex_indices_from_id(2), [12, 13, 14, 15, 16, 17]
+    )
+
+
+def test_track_append_keeps_graph() -> None:
+    """Test appending points to tracks keeps the graph."""
+    data = np.array([[1, 0, 0, 0], [1, 1, 0, 0], [2, 2, 0, 0]])
+    layer = Tracks(data, graph={2: [1]})
+    layer.append([[3, 2, 1, 1], [1, 2, 1, 1]])
+    assert layer.graph == {2: [1]}
+    assert layer.data.shape == (5, 4)
+    np.testing.assert_array_equal(layer.features['track_id'], [1, 1, 1, 2, 3])
+
+    with pytest.raises(ValueError, match='4-dimensional'):
+        layer.append([[1, 3, 0, 0, 0]])
+
+
 def test_docstring():
     validate_all_params_in_docstring(Tracks)
     validate_kwargs_sorted(Tracks)
+
+
+def test_track_append_extent():
+    """Test that appending points extends the cached extent."""
+    layer = Tracks(np.array([[0, 0, 1, 1], [0, 1, 2, 2]]))
+    assert np.array_equal(layer.extent.data, [[0, 1, 1], [1, 2, 2]])
+    layer.append(np.array([[1, 2, -3, 5]]))
+    assert np.array_equal(layer.extent.data, [[0, -3, 1], [2, 2, 5]])
+    assert np.array_equal(layer._extent_data, Tracks(layer.data)._extent_data)
@@ -2,8 +2,6 @@ from typing import TYPE_CHECKING, Optional, Union
 
 import numpy as np
 import pandas as pd
-from scipy.sparse import coo_matrix
-from scipy.spatial import cKDTree
 
 from napari.layers.utils.layer_utils import _FeatureTable
 from napari.utils.events.custom_types import Array
@@ -11,6 +9,7 @@ from napari.utils.translations import trans
 
 if TYPE_CHECKING:
     import numpy.typing as npt
+    from scipy.spatial import cKDTree
 
 
 class TrackManager:
@@ -69,7 +68,7 @@ class TrackManager:
 
         self._data: npt.NDArray
         self._order: list[int]
-        self._kdtree: cKDTree
+        self._kdtrees: dict[int, 'cKDTree']
         self._points: npt.NDArray
         self._points_id: npt.NDArray
         self._points_lookup: dict[int, slice]
@@ -107,7 +106,6 @@ class TrackManager:
     @data.setter
     def data(self, data: Union[list, np.ndarray]):
         """set the vertex data and build the vispy arrays for display"""
-
         # convert data to a numpy array if it is not already one
         data = np.asarray(data)
 
@@ -122,9 +120,14 @@ class TrackManager:
         self._ordered_points_idx = np.argsort(self._data[:, 1])
         self._points = self._data[self._ordered_points_idx, 1:]
 
-        # build a tree of the track data to allow fast lookup of nearest track
-        self._kdtree = cKDTree(self._points)
+        # trees of the points at each time point, to lookup the nearest
+        # track, built on demand
+        self._kdtrees = {}
+
+        self._build_lookups()
 
+    def _build_lookups(self) -> None:
+        """build the lookup tables from the sorted data and points"""
         # make the lookup table
         # NOTE(arl): it's important to convert the time index to an integer
         # here to make sure that we align with the napari dims index which
@@ -133,14 +136,139 @@ class TrackManager:
         time = np.round(self._points[:, 0]).astype(np.uint)
         self._points_lookup = self._fast_points_lookup(time)
 
-        # make a second lookup table using a sparse matrix to convert track id
-        # to the vertex indices
-        self._id2idxs = coo_matrix(
-            (
-                np.broadcast_to(1, self.track_ids.size),  # just dummy ones
-                (self.track_ids, np.arange(self.track_ids.size)),
+        # make a second lookup table to convert track id to the vertex
+        # indices: the data is sorted by track id, so the vertices of track
+        # `i` are the range `_id_starts[i]:_id_starts[i + 1]`
+        self._id_starts = np.concatenate(
+            [[0], np.cumsum(np.bincount(self.track_ids))]
+        )
+
+    def _update_lookups(self, data: np.ndarray, first: int) -> None:
+        """update the lookup tables for new points, sorted by time
+
+        Only the entries from the first time point with new points onwards
+        are rebuilt, from the index `first` of the first new point in the
+        points sorted by time.
+        """
+        # the time points before the new points keep their slices
+        first_time = np.round(data[0, 1]).astype(np.uint)
+        if first_time in self._points_lookup:
+            first = self._points_lookup[first_time].start
+        time = np.round(self._points[first:, 0]).astype(np.uint)
+        self._points_lookup.update(
+            {
+                t: slice(s.start + first, s.stop + first)
+                for t, s in self._fast_points_lookup(time).items()
+            }
+        )
+
+        # shift the vertex ranges of the tracks by the new points before them
+        counts = np.bincount(data[:, 0].astype(np.uint32))
+        n_ids = max(len(self._id_starts) - 1, len(counts))
+        id_starts = np.pad(
+            self._id_starts, (0, n_ids + 1 - len(self._id_starts)), mode='edge'
+        )
+        id_starts[1:] += np.cumsum(np.pad(counts, (0, n_ids - len(counts))))
+        self._id_starts = id_starts
+
+    def append(
+        self,
+        data: Union[list, np.ndarray],
+        features: Optional[pd.DataFrame] = None,
+    ) -> np.ndarray:
+        """merge new points into the sorted data and lookup tables
+
+        The new points are inserted into the data sorted by ID then time,
+        and into the points sorted by time, without sorting the existing
+        points again. The lookup tables and the track vertices are only
+        updated for the new points and the time points after them, e.g.
+        only for the last time point when tracking live, but the arrays of
+        all the points are still copied to insert the new ones.
+
+        Parameters
+        ----------
+        data : array (M, D+1)
+            Coordinates of the new points. ID,T,(Z),Y,X.
+        features : pd.DataFrame, optional
+            Features of the new points. By default, the new points use the
+            feature defaults.
+
+        Returns
+        -------
+        indices : array (M,)
+            Indices of the new points in the sorted data, in increasing
+            order.
+        """
+        data = self._validate_track_data(np.atleast_2d(np.asarray(data)))
+        if data.shape[1] != self._data.shape[1]:
+            raise ValueError(
+                trans._(
+                    'track vertices should be {ndim}-dimensional',
+                    deferred=True,
+                    ndim=self._data.shape[1],
+                )
+            )
+        n_points = len(self._data)
+        n_new = len(data)
+        order = np.lexsort((data[:, 1], data[:, 0]))
+        data = data[order]
+
+        # insert the new points after the points with the same ID and time
+        positions = np.searchsorted(
+            _id_time_keys(self._data), _id_time_keys(data), side='right'
+        )
+        new_idxs = positions + np.arange(n_new)
+        old_idxs = np.delete(np.arange(n_points + n_new), new_idxs)
+        self._data = np.insert(self._data, positions, data, axis=0)
+        self._order = np.insert(self._order, positions, n_points + order)
+
+        time_order = np.argsort(data[:, 1], kind='stable')
+        time_positions = np.searchsorted(
+            self._points[:, 0], data[time_order, 1], side='right'
+        )
+        self._ordered_points_idx = np.insert(
+            old_idxs[self._ordered_points_idx],
+            time_positions,
+            new_idxs[time_order],
+        )
+        self._points = np.insert(
+            self._points, time_positions, data[time_order, 1:], axis=0
+        )
+
+        # only the kd-trees of the time points with new points are outdated
+        for time in np.unique(np.round(data[:, 1]).astype(np.uint)):
+            self._kdtrees.pop(int(time), None)
+        self._update_lookups(data[time_order], time_positions[0])
+
+        if self._track_vertices is not None:
+            self._points_id = np.insert(
+                self._points_id, time_positions, data[time_order, 0]
+            )
+            self._track_vertices = self._data[:, 1:]
+            # only the new vertices and the ones before them can change
+            # their connection to the next vertex
+            connex = np.insert(self._track_connex, positions, False)
+            changed = np.union1d(new_idxs, new_idxs[new_idxs > 0] - 1)
+            changed = changed[changed + 1 < len(self._data)]
+            connex[changed] = (
+                self._data[changed, 0] == self._data[changed + 1, 0]
+            )
+            self._track_connex = connex
+
+        features = (
+            pd.DataFrame(index=range(n_new))
+            if features is None
+            else features.iloc[order].reset_index(drop=True)
+        )
+        if 'track_id' not in features:
+            features['track_id'] = self.track_ids[new_idxs]
+        self._feature_table.resize(n_points + n_new, features)
+        self._feature_table.reorder(
+            np.insert(
+                np.arange(n_points), positions, np.arange(n_new) + n_points
             )
-        ).tocsr()
+        )
+        return new_idxs
 
     @property
     def features(self):
@@ -206,7 +334,9 @@ class TrackManager:
 
     def _vertex_indices_from_id(self, track_id: int):
         """return the vertices corresponding to a track id"""
-        return self._id2idxs[track_id].nonzero()[1]
+        return np.arange(
+            self._id_starts[track_id], self._id_starts[track_id + 1]
+        )
 
     def _validate_track_data(self, data: np.ndarray) -> np.ndarray:
         """validate the coordinate data"""
@@ -295,31 +425,61 @@ class TrackManager:
 
     def build_graph(self):
         """build the track graph"""
+        graph = self.graph or {}
+        parents = list(graph.values())
+        nodes = np.repeat(
+            np.fromiter(graph, dtype=np.intp, count=len(graph)),
+            [len(parents_idx) for parents_idx in parents],
+        )
+
+        # if there is no edge in the graph, clear the vertex arrays
+        if len(nodes) == 0:
+            self._graph_vertices = None
+            self._graph_connex = None
+            return
 
-        graph_vertices = []
-        graph_connex = []
+        parents = np.concatenate(parents).astype(np.intp)
 
-        for node_idx, parents_idx in self.graph.items():
-            # we join from the first observation of the node, to the last
-            # observation of the parent
-            node_start = self._vertex_indices_from_id(node_idx)[0]
-            node = self.data[node_start, 1:]
+        # the data is sorted by track id, so the vertices of a track are
+        # contiguous and their range is given by the id lookup table. We join
+        # from the first observation of the node, to the last observation of
+        # the parent
+        id_starts = self._id_starts
+        node_starts = id_starts[nodes]
+        parent_stops = id_starts[parents + 1] - 1
 
-            for parent_idx in parents_idx:
-                parent_stop = self._vertex_indices_from_id(parent_idx)[-1]
-                parent = self.data[parent_stop, 1:]
+        graph_vertices = np.empty((2 * len(nodes), self.data.shape[1] - 1))
+        graph_vertices[0::2] = self.data[node_starts, 1:]
+        graph_vertices[1::2] = self.data[parent_stops, 1:]
 
-                graph_vertices.append([node, parent])
-                graph_connex.append([True, False])
+        self._graph_vertices = graph_vertices
+        self._graph_connex = np.tile([True, False], len(nodes))
 
-        # if there is a graph, store the vertices and connection arrays,
-        # otherwise, clear the vertex arrays
-        if graph_vertices:
-            self._graph_vertices = np.concatenate(graph_vertices, axis=0)
-            self._graph_connex = np.concatenate(graph_connex, axis=0)
-        else:
-            self._graph_vertices = None
-            self._graph_connex = None
+    def track_window(self, start: float, stop: float) -> np.ndarray:
+        """return the indices of the track vertices in a time window
+
+        The vertices are indexed as in `track_vertices`, and include the
+        vertices with a time in [start, stop] and the vertices connected to
+        them, so that the segments crossing the edges of the window are
+        drawn as well.
+        """
+        times = self._points[:, 0]
+        first = np.searchsorted(times, start, side='left')
+        last = np.searchsorted(times, stop, side='right')
+        indices = self._ordered_points_idx[first:last]
+
+        connex = self._track_connex
+        previous = indices[indices > 0] - 1
+        previous = previous[connex[previous]]
+        following = indices[connex[indices]] + 1
+        return np.union1d(indices, np.concatenate([previous, following]))
+
+    def track_window_connex(self, indices: np.ndarray) -> np.ndarray:
+        """vertex connections for drawing the track vertices at indices"""
+        connex = self._track_connex[indices]
+        connex[:-1] &= np.diff(indices) == 1
+        connex[-1:] = False
+        return connex
 
     def vertex_properties(self, color_by: str) -> np.ndarray:
         """return the properties of tracks by vertex"""
@@ -335,22 +495,30 @@ class TrackManager:
 
         return self.properties[color_by]
 
+    def _time_kdtree(self, time: int) -> 'cKDTree':
+        """return a kd-tree of the points at a time point"""
+        from scipy.spatial import cKDTree
+
+        if time not in self._kdtrees:
+            lookup = self._points_lookup[time]
+            self._kdtrees[time] = cKDTree(self._points[lookup, 1:])
+        return self._kdtrees[time]
+
     def get_value(self, coords):
-        """use a kd-tree to lookup the ID of the nearest tree"""
-        if self._kdtree is None:
+        """use a kd-tree to lookup the ID of the nearest track
+
+        Only the points at the time point of the coordinates are searched,
+        using a kd-tree of the points at that time point.
+        """
+        if self._points_id is None:
             return None
 
-        # query can return indices to points that do not exist, trim that here
-        # then prune to only those in the current frame/time
-        # NOTE(arl): I don't like this!!!
-        d, idx = self._kdtree.query(coords, k=10)
-        idx = [i for i in idx if i >= 0 and i < self._points.shape[0]]
-        pruned = [i for i in idx if self._points[i, 0] == coords[0]]
+        time = int(np.round(coords[0]))
+        if time not in self._points_lookup:
+            return None
 
-        # if we have found a point, return it
-        if pruned and self._points_id is not None:
-            return self._points_id[pruned[0]]
-        return None  # return the track ID
+        _, idx = self._time_kdtree(time).query(coords[1:])
+        return self._points_id[self._points_lookup[time].start + idx]
 
     @property
     def ndim(self) -> int:
@@ -414,3 +582,11 @@ class TrackManager:
             lbl = [f'ID:{i}' for i in self._points_id[lookup]]
 
         return lbl, pos
+
+
+def _id_time_keys(data: np.ndarray) -> np.ndarray:
+    """return (ID, T) keys of track data, which sort like the sorted data"""
+    keys = np.empty(len(data), dtype=[('id', np.float64), ('t', np.float64)])
+    keys['id'] = data[:, 0]
+    keys['t'] = data[:, 1]
+    return keys
@@ -10,6 +10,7 @@ import pandas as pd
 
 from napari.layers.base import Layer
 from napari.layers.tracks._track_utils import TrackManager
+from napari.layers.utils.layer_utils import _validate_features
 from napari.utils.colormaps import AVAILABLE_COLORMAPS, Colormap
 from napari.utils.events import Event
 from napari.utils.translations import trans
@@ -99,6 +100,9 @@ class Tracks(Layer):
     # The max number of tracks that will ever be used to render the thumbnail
     # If more tracks are present then they are randomly subsampled
     _max_tracks_thumbnail = 1024
+    # If more track vertices are present then only those within the tail and
+    # head lengths of the current time are sent to the GPU
+    _max_vertices_unwindowed = 2**20
 
     def __init__(
         self,
@@ -170,6 +174,10 @@ class Tracks(Layer):
         self._manager = TrackManager(data)
 
         self._track_colors: Optional[np.ndarray] = None
+        # the extrema of the data, extended when appending points
+        self._data_extrema: Optional[np.ndarray] = None
+        # the range of the property scaled to color the tracks, if any
+        self._track_color_range: Optional[tuple[float, float]] = None
         self._colormaps_dict = colormaps_dict or {}  # additional colormaps
         self._color_by = color_by  # default color by ID
         self._colormap = colormap
@@ -213,13 +221,14 @@ class Tracks(Layer):
         -------
         extent_data : array, shape (2, D)
         """
-        if len(self.data) == 0:
-            extrema = np.full((2, self.ndim), np.nan)
-        else:
-            maxs = np.max(self.data, axis=0)
-            mins = np.min(self.data, axis=0)
-            extrema = np.vstack([mins, maxs])
-        return extrema[:, 1:]
+        if self._data_extrema is None:
+            if len(self.data) == 0:
+                self._data_extrema = np.full((2, self.ndim), np.nan)
+            else:
+                maxs = np.max(self.data, axis=0)
+                mins = np.min(self.data, axis=0)
+                self._data_extrema = np.vstack([mins, maxs])
+        return self._data_extrema[:, 1:].copy()
 
     def _get_ndim(self) -> int:
         """Determine number of dimensions of the layer."""
@@ -286,7 +295,8 @@ class Tracks(Layer):
         colormapped = np.zeros(self._thumbnail_shape)
         colormapped[..., 3] = 1
 
-        if self._view_data is not None and self.track_colors is not None:
+        track_vertices = self._manager.track_vertices
+        if track_vertices is not None and self.track_colors is not None:
             de = self._extent_data
             min_vals = [de[0, i] for i in self._slice_input.displayed]
             shape = np.ceil(
@@ -295,14 +305,17 @@ class Tracks(Layer):
             zoom_factor = np.divide(
                 self._thumbnail_shape[:2], shape[-2:]
             ).min()
-            if len(self._view_data) > self._max_tracks_thumbnail:
+            if len(track_vertices) > self._max_tracks_thumbnail:
                 thumbnail_indices = np.random.randint(
-                    0, len(self._view_data), self._max_tracks_thumbnail
+                    0, len(track_vertices), self._max_tracks_thumbnail
+                )
+                # only pad the subsampled vertices
+                points = self._pad_display_data(
+                    track_vertices[thumbnail_indices]
                 )
-                points = self._view_data[thumbnail_indices]
             else:
                 points = self._view_data
-                thumbnail_indices = range(len(self._view_data))
+                thumbnail_indices = range(len(track_vertices))
 
             # get the track coords here
             coords = np.floor(
@@ -330,6 +343,26 @@ class Tracks(Layer):
         """return a view of the data"""
         return self._pad_display_data(self._manager.track_vertices)
 
+    @property
+    def _track_window(self) -> Optional[np.ndarray]:
+        """Indices of the track vertices to draw at the current time.
+
+        For large datasets, only the track vertices within the tail and head
+        lengths of the current time are drawn. None means that all the track
+        vertices are drawn, and the shader hides those out of the window.
+        """
+        if (
+            self._manager.track_vertices is None
+            or len(self._manager.track_vertices)
+            <= self._max_vertices_unwindowed
+            or not self.use_fade
+        ):
+            return None
+        current_time = self.current_time
+        return self._manager.track_window(
+            current_time - self.tail_length, current_time + self.head_length
+        )
+
     @property
     def _view_graph(self):
         """return a view of the graph"""
@@ -378,6 +411,7 @@ class Tracks(Layer):
         """set the data and build the vispy arrays for display"""
         # set the data and build the tracks
         self._manager.data = data
+        self._data_extrema = None
         self._manager.build_tracks()
 
         # reset the properties and recolor the tracks
@@ -395,6 +429,53 @@ class Tracks(Layer):
         self.events.data(value=self.data)
         self._reset_editable()
 
+    def append(
+        self,
+        data,
+        features: Optional[Union[dict[str, np.ndarray], pd.DataFrame]] = None,
+    ) -> None:
+        """Append points to the tracks, e.g. when tracking live.
+
+        Unlike setting `data`, the features and graph are kept, and the new
+        points are merged into the tracks already sorted by ID and time
+        instead of sorting all the points again. The lookup tables, track
+        vertices and colors are only updated for the new points when
+        possible, but the arrays of all the points are still copied to
+        insert the new ones.
+
+        Parameters
+        ----------
+        data : array (M, D+1)
+            Coordinates for M new points in D+1 dimensions. ID,T,(Z),Y,X.
+            The points can extend existing tracks or start new tracks.
+        features : dict or DataFrame, optional
+            Features of the new points, with one row per point. By default,
+            the new points use the feature defaults.
+        """
+        if features is not None:
+            features = _validate_features(features, num_data=len(data))
+            self._manager._feature_table.check_columns(features)
+        indices = self._manager.append(data, features=features)
+        if len(indices) == len(self.data):
+            self._data_extrema = None
+        elif self._data_extrema is not None:
+            new_data = self.data[indices]
+            self._data_extrema = np.vstack(
+                [
+                    np.fmin(self._data_extrema[0], np.min(new_data, axis=0)),
+                    np.fmax(self._data_extrema[1], np.max(new_data, axis=0)),
+                ]
+            )
+        self._recolor_new_tracks(indices)
+        self._manager.build_graph()
+
+        # fire events to update shaders
+        self._update_dims()
+        self.events.rebuild_tracks()
+        self.events.rebuild_graph()
+        self.events.data(value=self.data)
+        self._reset_editable()
+
     @property
     def features(self):
         """Dataframe-like features table.
@@ -582,14 +663,51 @@ class Tracks(Layer):
 
         if self.color_by in self.colormaps_dict:
             colormap = self.colormaps_dict[self.color_by]
+            self._track_color_range = None
         else:
             # if we don't have a colormap, get one and scale the properties
             colormap = AVAILABLE_COLORMAPS[self.colormap]
+            self._track_color_range = (
+                np.min(vertex_properties),
+                np.max(vertex_properties),
+            )
             vertex_properties = _norm(vertex_properties)
 
         # actually set the vertex colors
         self._track_colors = colormap.map(vertex_properties)
 
+    def _recolor_new_tracks(self, indices: np.ndarray) -> None:
+        """color the new track vertices at the given indices
+
+        The other vertices keep their colors, unless the new vertices extend
+        the range of the property to color by.
+        """
+        if (
+            self._track_colors is None
+            or self.color_by not in self.properties_to_color_by
+        ):
+            self._recolor_tracks()
+            return
+        values = self._manager.vertex_properties(self.color_by)[indices]
+        if self.color_by in self.colormaps_dict:
+            colormap = self.colormaps_dict[self.color_by]
+        elif self._track_color_range is not None and (
+            self._track_color_range[0] <= np.min(values)
+            and np.max(values) <= self._track_color_range[1]
+        ):
+            colormap = AVAILABLE_COLORMAPS[self.colormap]
+            low, high = self._track_color_range
+            values = (values - low) / np.max([1e-10, high - low])
+        else:
+            self._recolor_tracks()
+            return
+        self._track_colors = np.insert(
+            self._track_colors,
+            indices - np.arange(len(indices)),
+            colormap.map(values),
+            axis=0,
+        )
+
     @property
     def track_connex(self) -> Optional[np.ndarray]:
         """vertex connections for drawing track lines"""
@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -10,6 +11,7 @@ from napari.layers.utils.color_encoding import (
     NominalColorEncoding,
     QuantitativeColorEncoding,
 )
+from napari.layers.utils.style_encoding import _get_style_values
 
 
 def make_features_with_no_columns(*, num_rows) -> pd.DataFrame:
@@ -176,6 +178,21 @@ def test_quantitative_with_missing_feature(features):
         encoding(features)
 
 
+def test_quantitative_lazy_matches_eager(monkeypatch):
+    monkeypatch.setattr(QuantitativeColorEncoding, '_chunk_size', 8)
+    features = pd.DataFrame({'v': np.linspace(0, 1, 50)})
+    encoding = QuantitativeColorEncoding(feature='v', colormap='viridis')
+    expected = encoding(features)
+
+    encoding._apply(features)
+    assert encoding._lazy_features is not None
+
+    # the contrast limits come from all the rows, not the requested ones
+    rows = [25, 26]
+    assert_colors_equal(_get_style_values(encoding, rows), expected[rows])
+    assert_colors_equal(encoding._values, expected)
+
+
 def test_validate_from_named_color():
     argument = 'red'
     expected = ConstantColorEncoding(constant=argument)
@@ -6,6 +6,8 @@ import pytest
 
 from napari._pydantic_compat import ValidationError
 from napari.layers.utils.color_manager import ColorManager, ColorProperties
+from napari.layers.utils.color_manager_utils import _LazyColors
+from napari.layers.utils.style_encoding import _DerivedStyleEncoding
 from napari.utils.colormaps.categorical_colormap import CategoricalColormap
 from napari.utils.colormaps.standardize_color import transform_color
 
@@ -664,3 +666,63 @@ def test_refresh_colors():
         [0.5, 0.5, 0.5, 1],
     ]
     np.testing.assert_allclose(cm.colors, refreshed_colors)
+
+
+@pytest.mark.parametrize(
+    ('color_mode', 'values', 'cmap_kwargs'),
+    [
+        ('colormap', np.linspace(-1, 3, 10), {'continuous_colormap': 'gray'}),
+        (
+            'cycle',
+            np.array(list('cbcaddbeac')),
+            {'categorical_colormap': ['red', 'green', 'blue']},
+        ),
+    ],
+)
+def test_lazy_mapped_colors(monkeypatch, color_mode, values, cmap_kwargs):
+    def make_color_manager():
+        return ColorManager(
+            color_properties={'name': 'prop', 'values': values},
+            color_mode=color_mode,
+            **cmap_kwargs,
+        )
+
+    expected = make_color_manager()
+    assert isinstance(expected.colors, np.ndarray)
+
+    monkeypatch.setattr(_DerivedStyleEncoding, '_chunk_size', 4)
+    cm = make_color_manager()
+    assert isinstance(cm.__dict__['colors'], _LazyColors)
+    assert cm._n_colors() == len(values)
+    np.testing.assert_allclose(cm._take([8, 1]), expected.colors[[8, 1]])
+    np.testing.assert_allclose(cm.current_color, expected.current_color)
+    assert cm.contrast_limits == expected.contrast_limits
+    assert list(cm.categorical_colormap.colormap) == list(
+        expected.categorical_colormap.colormap
+    )
+    assert isinstance(cm.__dict__['colors'], _LazyColors)
+
+    np.testing.assert_allclose(cm.colors, expected.colors)
+    assert isinstance(cm.__dict__['colors'], np.ndarray)
+    assert cm == expected
+
+
+def test_lazy_mapped_colors_to_direct(monkeypatch):
+    monkeypatch.setattr(_DerivedStyleEncoding, '_chunk_size', 4)
+    values = np.linspace(0, 1, 10)
+    cm = ColorManager(
+        color_properties={'name': 'prop', 'values': values},
+        color_mode='colormap',
+        continuous_colormap='gray',
+    )
+    cm._remove([0])
+    assert isinstance(cm.__dict__['colors'], _LazyColors)
+    np.testing.assert_allclose(cm._take([0]), [[1 / 9, 1 / 9, 1 / 9, 1]])
+
+    cm._update_current_color('red', update_indices=[1])
+    assert cm.color_mode == 'direct'
+    expected = np.repeat(values[1:, np.newaxis], 4, axis=1)
+    expected[:, 3] = 1
+    expected[1] = [1, 0, 0, 1]
+    np.testing.assert_allclose(cm.colors, expected)
+    np.testing.assert_allclose(cm.dict()['colors'], expected)
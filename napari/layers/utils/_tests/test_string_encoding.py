@@ -133,6 +133,37 @@ def test_format_with_mixed_feature_numeric_types(numeric_features):
     np.testing.assert_array_equal(values, ['1: 0.50', '2: 1.00', '3: 0.25'])
 
 
+@pytest.mark.parametrize(
+    'format_string',
+    [
+        '{class}: {confidence:.2f}',
+        '{index:>3d}|{class!r}|{flag}',
+        '{{class}} {count:+05d} {confidence:e}',
+        '{category}{missing:.1f}{mixed}',
+        '{count:{count}}',
+        '{class[0]}',
+    ],
+)
+def test_format_matches_formatting_each_row(format_string):
+    features = pd.DataFrame(
+        {
+            'class': ['a', 'b', 'a', 'c'],
+            'confidence': [0.5, -0.0, 0.25, 1],
+            'count': [1, 2, 1, 3],
+            'flag': [True, False, True, True],
+            'category': pd.Series(['x', None, 'y', 'x'], dtype='category'),
+            'missing': [np.nan, 1, 2, np.nan],
+            'mixed': [1, True, 'a', None],
+        }
+    )
+    encoding = FormatStringEncoding(format=format_string)
+    expected = [
+        format_string.format(index=index, **row)
+        for index, row in features.iterrows()
+    ]
+    np.testing.assert_array_equal(encoding(features), expected)
+
+
 def test_validate_from_format_string():
     argument = '{class}: {score:.2f}'
     expected = FormatStringEncoding(format=argument)
@@ -18,6 +18,7 @@ from napari._pydantic_compat import Field
 from napari.layers.utils.style_encoding import (
     _ConstantStyleEncoding,
     _DerivedStyleEncoding,
+    _get_style_values,
     _ManualStyleEncoding,
 )
 from napari.utils.events.custom_types import Array
@@ -159,6 +160,64 @@ def test_scalar_derived_encoding_clear():
     np.testing.assert_array_equal(encoding._values, [])
 
 
+class CountingScalarDirectEncoding(ScalarDirectEncoding):
+    _chunk_size = 4
+    _n_calls: int = 0
+
+    def __call__(self, features: Any) -> ScalarArray:
+        self._n_calls += 1
+        return super().__call__(features)
+
+
+@pytest.fixture()
+def lazy_features() -> pd.DataFrame:
+    return pd.DataFrame({'scalar': np.arange(10, 20)})
+
+
+def test_scalar_derived_encoding_apply_lazily(lazy_features):
+    encoding = CountingScalarDirectEncoding(feature='scalar')
+
+    encoding._apply(lazy_features)
+    assert encoding._n_calls == 0
+
+    # only the requested rows are derived, once
+    np.testing.assert_array_equal(
+        _get_style_values(encoding, [9, 1, 8]), [19, 11, 18]
+    )
+    assert encoding._n_calls == 1
+    np.testing.assert_array_equal(
+        _get_style_values(encoding, [8, 1]), [18, 11]
+    )
+    assert encoding._n_calls == 1
+    assert encoding._lazy_chunks.keys() == {0, 2}
+
+    np.testing.assert_array_equal(encoding._values, lazy_features['scalar'])
+    assert encoding._n_calls == 2
+
+
+def test_scalar_derived_encoding_delete_lazily(lazy_features):
+    encoding = CountingScalarDirectEncoding(feature='scalar')
+    encoding._apply(lazy_features.iloc[:2])
+    encoding._apply(lazy_features)
+    np.testing.assert_array_equal(
+        _get_style_values(encoding, [2, 9]), [12, 19]
+    )
+
+    encoding._delete([0, 7])
+    features = lazy_features.drop(index=[0, 7]).reset_index(drop=True)
+    encoding._apply(features)
+    np.testing.assert_array_equal(
+        _get_style_values(encoding, range(8)), features['scalar']
+    )
+
+    # shrinking and growing the features keeps the lazy rows
+    n_calls = encoding._n_calls
+    encoding._apply(features.iloc[:6])
+    encoding._apply(features)
+    np.testing.assert_array_equal(encoding._values, features['scalar'])
+    assert encoding._n_calls == n_calls + 1
+
+
 Vector = Array[int, (2,)]
 VectorArray = Array[int, (-1, 2)]
 
@@ -12,6 +12,7 @@ from napari.layers.utils.string_encoding import (
     FormatStringEncoding,
     ManualStringEncoding,
 )
+from napari.layers.utils.style_encoding import _DerivedStyleEncoding
 from napari.layers.utils.text_manager import TextManager
 
 
@@ -776,3 +777,50 @@ def test_compute_text_coords_with_3D_data_2D_display(order):
 
     expected_coords = coords + translation[slice_input.displayed]
     np.testing.assert_equal(text_coords, expected_coords)
+
+
+def test_cull_view(monkeypatch):
+    monkeypatch.setattr(TextManager, '_max_view_count', 16)
+    text_manager = TextManager(features=pd.DataFrame(index=range(100)))
+    coords = np.stack(np.meshgrid(range(10), range(10)), axis=-1).reshape(
+        -1, 2
+    )
+
+    # not too many text elements to display
+    assert text_manager._cull_view(coords[:16]) is None
+
+    # only the text elements near the displayed region are kept
+    bbox = np.array([[0, 0], [2, 2]])
+    np.testing.assert_array_equal(
+        text_manager._cull_view(coords, bbox),
+        np.flatnonzero(np.all(coords <= 2, axis=1)),
+    )
+
+    # too many text elements are decimated to about the maximum count
+    indices = text_manager._cull_view(coords)
+    assert 0 < len(indices) <= 16
+    np.testing.assert_array_equal(indices, np.unique(indices))
+    # and do not change when panning
+    bbox = np.array([[0, 0], [9, 9]])
+    shifted = text_manager._cull_view(coords, bbox + 0.5)
+    np.testing.assert_array_equal(
+        text_manager._cull_view(coords, bbox), shifted
+    )
+
+
+def test_view_text_derives_only_requested_strings(monkeypatch):
+    monkeypatch.setattr(_DerivedStyleEncoding, '_chunk_size', 2)
+    features = pd.DataFrame({'word': ['a', 'bb', 'ccc', 'dddd', 'eeeee']})
+    text_manager = TextManager(string='{word}!', features=features)
+    assert len(text_manager.string._cached) == 0
+
+    np.testing.assert_array_equal(
+        text_manager.view_text(np.array([3, 0])), ['dddd!', 'a!']
+    )
+    np.testing.assert_array_equal(
+        text_manager.view_text(np.array([4, 3, 1])),
+        ['eeeee!', 'dddd!', 'bb!'],
+    )
+    np.testing.assert_array_equal(
+        text_manager.values, ['a!', 'bb!', 'ccc!', 'dddd!', 'eeeee!']
+    )
@@ -1,5 +1,7 @@
+from functools import partial
 from typing import (
     Any,
+    Callable,
     Literal,
     Optional,
     Protocol,
@@ -195,10 +197,29 @@ class QuantitativeColorEncoding(_DerivedStyleEncoding[ColorValue, ColorArray]):
     fallback: ColorValue = Field(default_factory=lambda: DEFAULT_COLOR)
 
     def __call__(self, features: Any) -> ColorArray:
-        values = features[self.feature]
-        contrast_limits = self.contrast_limits or _calculate_contrast_limits(
-            values
+        return self._map(features, self.contrast_limits)
+
+    def _bind_lazy_rows(self, features: Any) -> Callable[[Any], ColorArray]:
+        if self.contrast_limits is not None:
+            return self
+        # The limits are calculated from all the lazy rows, and not from the
+        # chunks of rows that are derived.
+        try:
+            values = np.asarray(features[self.feature])
+        except KeyError:
+            return self
+        return partial(
+            self._map, contrast_limits=_calculate_contrast_limits(values)
         )
+
+    def _map(
+        self,
+        features: Any,
+        contrast_limits: Optional[tuple[float, float]],
+    ) -> ColorArray:
+        values = features[self.feature]
+        if contrast_limits is None:
+            contrast_limits = _calculate_contrast_limits(values)
         if contrast_limits is not None:
             values = np.interp(values, contrast_limits, (0, 1))
         return self.colormap.map(values)
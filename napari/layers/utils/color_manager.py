@@ -7,6 +7,7 @@ import numpy as np
 from napari._pydantic_compat import Field, root_validator, validator
 from napari.layers.utils._color_manager_constants import ColorMode
 from napari.layers.utils.color_manager_utils import (
+    _LazyColors,
     _validate_colormap_mode,
     _validate_cycle_mode,
     guess_continuous,
@@ -185,6 +186,8 @@ class ColorManager(EventedModel):
             colors, values = _validate_colormap_mode(values)
         else:  # color_mode == ColorMode.DIRECT:
             colors = values['colors']
+            if isinstance(colors, _LazyColors):
+                colors = colors._materialize()
 
         # set the current color to the last color/property value
         # if it wasn't already set
@@ -198,6 +201,37 @@ class ColorManager(EventedModel):
         values['colors'] = colors
         return values
 
+    def _get_colors(self) -> np.ndarray:
+        colors = self.__dict__['colors']
+        if isinstance(colors, _LazyColors):
+            colors = colors._materialize()
+            self.__dict__['colors'] = colors
+        return colors
+
+    def _take(self, indices: Union[list, np.ndarray]) -> np.ndarray:
+        """Return the colors at the given indices, mapping only those.
+
+        Parameters
+        ----------
+        indices : list, np.ndarray
+            The indices of the colors.
+
+        Returns
+        -------
+        colors : np.ndarray
+            The (Nx4) color array of the colors at the given indices.
+        """
+        return self.__dict__['colors'][indices]
+
+    def _n_colors(self) -> int:
+        """Return the number of colors without mapping them."""
+        return len(self.__dict__['colors'])
+
+    def _iter(self, *args, **kwargs):
+        # serialize the colors rather than the lazily mapped ones
+        self._get_colors()
+        return super()._iter(*args, **kwargs)
+
     def _set_color(
         self,
         color: ColorType,
@@ -575,3 +609,10 @@ class ColorManager(EventedModel):
             )
 
         return cls(**color_kwargs)
+
+
+# In colormap and cycle modes, many colors are only mapped from the color
+# properties when first read (see _LazyColors). Reading the colors field
+# through this data descriptor maps all of them, while ColorManager._take
+# only maps the requested ones. Assigning the field is unchanged.
+ColorManager.colors = property(ColorManager._get_colors)  # type: ignore[assignment]
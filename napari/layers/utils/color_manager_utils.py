@@ -1,11 +1,59 @@
 from typing import Any, Union
 
 import numpy as np
+import pandas as pd
 
+from napari.layers.utils.color_encoding import (
+    NominalColorEncoding,
+    QuantitativeColorEncoding,
+)
+from napari.layers.utils.style_encoding import _DerivedStyleEncoding
 from napari.utils.colormaps import Colormap
 from napari.utils.translations import trans
 
 
+class _LazyColors:
+    """Colors mapped from many property values on demand.
+
+    The values are mapped by a derived color encoding, in chunks of rows
+    that are memoized when first requested by index, e.g. for the elements
+    in view. ColorManager stores this as its colors until they are read.
+
+    Parameters
+    ----------
+    encoding : _DerivedStyleEncoding
+        The encoding mapping the property values to colors.
+    name : str
+        The name of the property.
+    values : np.ndarray
+        The property values.
+    """
+
+    def __init__(
+        self, encoding: _DerivedStyleEncoding, name: str, values: np.ndarray
+    ) -> None:
+        self._encoding = encoding
+        self._encoding._apply(pd.DataFrame({name: values}, copy=False))
+        self._n_colors = len(values)
+
+    def __len__(self) -> int:
+        return self._n_colors
+
+    def __getitem__(self, key: Any) -> np.ndarray:
+        indices = np.arange(self._n_colors)[key]
+        colors = self._encoding._take(np.ravel(indices))
+        return colors.reshape((*np.shape(indices), 4))
+
+    def _materialize(self) -> np.ndarray:
+        """Maps all the property values to colors."""
+        return np.asarray(self._encoding._values)
+
+
+def _is_lazy(values: np.ndarray) -> bool:
+    """Whether to map these property values to colors on demand."""
+    return len(values) > _DerivedStyleEncoding._chunk_size
+
+
 def guess_continuous(color_map: np.ndarray) -> bool:
     """Guess if the property is continuous (return True) or categorical (return False)
 
@@ -22,9 +70,10 @@ def guess_continuous(color_map: np.ndarray) -> bool:
         True of the property is guessed to be continuous, False if not.
     """
     # if the property is a floating type, guess continuous
+    # check the dtype first, as counting the unique values sorts them
     return issubclass(color_map.dtype.type, np.floating) or (
-        len(np.unique(color_map)) > 16
-        and isinstance(color_map.dtype.type, np.integer)
+        isinstance(color_map.dtype.type, np.integer)
+        and len(np.unique(color_map)) > 16
     )
 
 
@@ -86,13 +135,33 @@ def _validate_colormap_mode(
 
     Returns
     -------
-    colors : np.ndarray
-        The (Nx4) color array to set as ColorManager.colors
+    colors : np.ndarray or _LazyColors
+        The (Nx4) color array to set as ColorManager.colors, mapped on
+        demand for many property values.
     values : dict
     """
     color_properties = values['color_properties'].values
     cmap = values['continuous_colormap']
-    if len(color_properties) > 0:
+    contrast_limits = values['contrast_limits']
+    if _is_lazy(color_properties):
+        if contrast_limits is None:
+            contrast_limits = (color_properties.min(), color_properties.max())
+            values['contrast_limits'] = contrast_limits
+        # the encoding requires strictly increasing limits
+        lazy = contrast_limits[0] < contrast_limits[1]
+    else:
+        lazy = False
+    if lazy:
+        colors = _LazyColors(
+            QuantitativeColorEncoding(
+                feature=values['color_properties'].name,
+                colormap=cmap,
+                contrast_limits=contrast_limits,
+            ),
+            values['color_properties'].name,
+            color_properties,
+        )
+    elif len(color_properties) > 0:
         if values['contrast_limits'] is None:
             colors, contrast_limits = map_property(
                 prop=color_properties,
@@ -130,8 +199,9 @@ def _validate_cycle_mode(
 
     Returns
     -------
-    colors : np.ndarray
-        The (Nx4) color array to set as ColorManager.colors
+    colors : np.ndarray or _LazyColors
+        The (Nx4) color array to set as ColorManager.colors, mapped on
+        demand for many property values.
     values : dict
     """
     color_properties = values['color_properties'].values
@@ -141,6 +211,17 @@ def _validate_cycle_mode(
         current_prop_value = values['color_properties'].current_value
         if current_prop_value is not None:
             values['current_color'] = cmap.map(current_prop_value)[0]
+    elif _is_lazy(color_properties):
+        # add the new property values to the colormap in the order they
+        # first appear, as mapping all of them at once would
+        cmap.map(np.asarray(pd.unique(color_properties)))
+        colors = _LazyColors(
+            NominalColorEncoding(
+                feature=values['color_properties'].name, colormap=cmap
+            ),
+            values['color_properties'].name,
+            color_properties,
+        )
     else:
         colors = cmap.map(color_properties)
     values['categorical_colormap'] = cmap
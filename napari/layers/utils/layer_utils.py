@@ -863,6 +863,7 @@ class _FeatureTable:
     def resize(
         self,
         size: int,
+        features: Optional[pd.DataFrame] = None,
     ) -> None:
         """Resize this padding with default values if required.
 
@@ -870,14 +871,50 @@ class _FeatureTable:
         ----------
         size : int
             The new size (number of rows) of the features table.
+        features : Optional[pd.DataFrame]
+            The feature values of the appended rows, if any, which are used
+            instead of the default values. Its columns must be columns of
+            this table.
         """
+        if features is not None:
+            self.check_columns(features)
         current_size = self._values.shape[0]
         if size < current_size:
             self.remove(range(size, current_size))
         elif size > current_size:
             to_append = self._defaults.iloc[np.zeros(size - current_size)]
+            if features is not None:
+                to_append = to_append.reset_index(drop=True)
+                for name, values in features.reset_index(drop=True).items():
+                    if name in to_append:
+                        values = values.astype(to_append[name].dtype)
+                    to_append[name] = values
             self.append(to_append)
 
+    def check_columns(self, features: pd.DataFrame) -> None:
+        """Check that the columns of the given features are in this table.
+
+        Parameters
+        ----------
+        features : pd.DataFrame
+            The feature values of rows to add to this table.
+
+        Raises
+        ------
+        ValueError
+            If the features have columns that are not in this table, whose
+            values for the existing rows are unknown.
+        """
+        extra_columns = set(features.columns) - set(self._values.columns)
+        if extra_columns:
+            raise ValueError(
+                trans._(
+                    'Features of new rows contain some columns not in the features table: {extra_columns}',
+                    deferred=True,
+                    extra_columns=extra_columns,
+                )
+            )
+
     def append(self, to_append: pd.DataFrame) -> None:
         """Append new feature rows to this.
 
@@ -1,8 +1,10 @@
 from collections.abc import Sequence
+from functools import lru_cache
 from string import Formatter
-from typing import Any, Literal, Protocol, Union, runtime_checkable
+from typing import Any, Literal, Optional, Protocol, Union, runtime_checkable
 
 import numpy as np
+import pandas as pd
 
 from napari._pydantic_compat import parse_obj_as
 from napari.layers.utils.style_encoding import (
@@ -166,6 +168,30 @@ class FormatStringEncoding(_DerivedStyleEncoding[StringValue, StringArray]):
     encoding_type: Literal['FormatStringEncoding'] = 'FormatStringEncoding'
 
     def __call__(self, features: Any) -> StringArray:
+        fields = _parse_format_string(self.format)
+        if fields is None:
+            return self._format_rows(features)
+        n_rows = features.shape[0]
+        # Format each field over a whole column, then join the columns.
+        columns = []
+        for literal, field, spec, conversion in fields:
+            if literal:
+                columns.append([literal] * n_rows)
+            if field is None:
+                continue
+            # Expose the dataframe index to the format string keys unless a
+            # column exists with the name "index", which takes precedence.
+            if field == 'index' and 'index' not in features.columns:
+                values = features.index
+            else:
+                values = features[field]
+            columns.append(_format_column(values, spec, conversion))
+        if not columns:
+            return np.full(n_rows, '', dtype=str)
+        return np.array(list(map(''.join, zip(*columns))), dtype=str)
+
+    def _format_rows(self, features: Any) -> StringArray:
+        """Formats each row of features, which supports any format string."""
         feature_names = features.columns.to_list()
         # Expose the dataframe index to the format string keys
         # unless a column exists with the name "index", which takes precedence.
@@ -180,6 +206,65 @@ class FormatStringEncoding(_DerivedStyleEncoding[StringValue, StringArray]):
         return np.array(values, dtype=str)
 
 
+@lru_cache(maxsize=64)
+def _parse_format_string(
+    string: str,
+) -> Optional[tuple[tuple[str, Optional[str], str, Optional[str]], ...]]:
+    """Parses a format string into literal text and feature fields.
+
+    Returns None if the format string is invalid, or if it has fields that
+    cannot be formatted one feature column at a time, like positional fields,
+    attribute or item access, or nested replacement fields in format specs.
+    """
+    try:
+        fields = tuple(Formatter().parse(string))
+    except ValueError:
+        return None
+    for _, field, spec, conversion in fields:
+        if field is None:
+            continue
+        if (
+            not field
+            or field.isdigit()
+            or '.' in field
+            or '[' in field
+            or '{' in spec
+            or conversion not in _CONVERSIONS
+        ):
+            return None
+    return fields
+
+
+_CONVERSIONS = {None: lambda value: value, 's': str, 'r': repr, 'a': ascii}
+
+
+def _format_column(values: Any, spec: str, conversion: Optional[str]) -> list:
+    """Formats the values of a feature column or index into strings."""
+    convert = _CONVERSIONS[conversion]
+    # Values like labels or classes are often repeated, so only format each
+    # unique value once. Floats are excluded because distinct values compare
+    # equal (e.g. -0.0 and 0.0) and are rarely repeated.
+    if (
+        isinstance(values.dtype, pd.CategoricalDtype)
+        or values.dtype.kind in 'iub'
+        or (
+            values.dtype.kind == 'O'
+            and pd.api.types.infer_dtype(values, skipna=False) == 'string'
+        )
+    ):
+        codes, uniques = pd.factorize(values)
+    else:
+        return [format(convert(value), spec) for value in values.tolist()]
+    if np.any(codes < 0):
+        # Missing values are not assigned to a unique value.
+        return [format(convert(value), spec) for value in values.tolist()]
+    formatted = np.array(
+        [format(convert(value), spec) for value in uniques.tolist()],
+        dtype=object,
+    )
+    return formatted[codes].tolist()
+
+
 def _is_format_string(string: str) -> bool:
     """Returns True if a string is a valid format string with at least one field, False otherwise."""
     try:
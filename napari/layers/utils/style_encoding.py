@@ -2,7 +2,10 @@ import warnings
 from abc import ABC, abstractmethod
 from typing import (
     Any,
+    Callable,
+    ClassVar,
     Generic,
+    Optional,
     Protocol,
     TypeVar,
     Union,
@@ -219,6 +222,11 @@ class _DerivedStyleEncoding(
 ):
     """Encodes style values by deriving them from feature values.
 
+    When many rows are applied at once, their values are derived lazily
+    when first requested by index (e.g. for the elements in view), and
+    memoized in chunks of rows. All the values are only derived when
+    reading ``_values``.
+
     Attributes
     ----------
     fallback : StyleValue
@@ -227,10 +235,21 @@ class _DerivedStyleEncoding(
 
     fallback: StyleValue
     _cached: StyleArray
+    # The features of the rows after the cached values, which are derived
+    # on demand, and the chunks of those rows with their derived values and
+    # which of these have been derived so far.
+    _lazy_features: Any
+    _lazy_chunks: dict[int, tuple[StyleArray, np.ndarray]]
+    # Derives the values of some of the lazy rows, see _bind_lazy_rows.
+    _lazy_encode: Optional[Callable[[Any], StyleArray]]
+    _chunk_size: ClassVar[int] = 2**16
 
     def __init__(self, **kwargs) -> None:
         super().__init__(**kwargs)
         self._cached = _empty_array_like(self.fallback)
+        self._lazy_features = None
+        self._lazy_chunks = {}
+        self._lazy_encode = None
 
     @abstractmethod
     def __call__(self, features: Any) -> Union[StyleValue, StyleArray]:
@@ -238,21 +257,51 @@ class _DerivedStyleEncoding(
 
     @property
     def _values(self) -> Union[StyleValue, StyleArray]:
+        self._materialize()
         return self._cached
 
     def _apply(self, features: Any) -> None:
         n_cached = self._cached.shape[0]
         n_rows = features.shape[0]
-        if n_cached < n_rows:
+        n_lazy = 0 if self._lazy_features is None else len(self._lazy_features)
+        if n_rows <= n_cached:
+            self._cached = self._cached[:n_rows]
+            self._lazy_features = None
+            self._lazy_chunks = {}
+            self._lazy_encode = None
+        elif n_lazy > 0 or n_rows - n_cached > self._chunk_size:
+            if n_cached + n_lazy != n_rows:
+                # Only the chunks of the rows that are kept are unchanged.
+                n_kept = min(n_lazy, n_rows - n_cached)
+                self._lazy_features = features.iloc[n_cached:n_rows]
+                self._lazy_encode = self._bind_lazy_rows(self._lazy_features)
+                if self._lazy_encode is not self:
+                    # The values of all the rows may depend on the new ones.
+                    n_kept = 0
+                self._drop_lazy_chunks(n_kept // self._chunk_size)
+        else:
             tail_array = self._call_safely(features.iloc[n_cached:n_rows])
             self._append(tail_array)
-        elif n_cached > n_rows:
-            self._cached = self._cached[:n_rows]
 
-    def _call_safely(self, features: Any) -> StyleArray:
+    def _bind_lazy_rows(self, features: Any) -> Callable[[Any], StyleArray]:
+        """Returns the function deriving the values of some of the lazy rows.
+
+        The lazy rows are derived in chunks, so that this encoding is called
+        with a subset of the given features. By default, this returns the
+        encoding itself, as the value of a row only depends on that row.
+        Encodings whose values depend on whole columns, e.g. on the range
+        of a feature, compute those from all the lazy rows here.
+        """
+        return self
+
+    def _call_safely(
+        self,
+        features: Any,
+        encode: Optional[Callable[[Any], StyleArray]] = None,
+    ) -> StyleArray:
         """Calls this without raising encoding errors, warning instead."""
         try:
-            array = self(features)
+            array = (encode or self)(features)
         except (KeyError, ValueError):
             warnings.warn(
                 trans._(
@@ -265,14 +314,120 @@ class _DerivedStyleEncoding(
             array = np.broadcast_to(self.fallback, shape)
         return array
 
+    def _derive_lazy(self, indices: np.ndarray) -> None:
+        """Derives the values of the given lazy rows that are not derived yet."""
+        chunks = indices // self._chunk_size
+        missing = [np.empty(0, dtype=np.intp)]
+        for chunk in np.unique(chunks).tolist():
+            if chunk not in self._lazy_chunks:
+                start = chunk * self._chunk_size
+                size = min(self._chunk_size, len(self._lazy_features) - start)
+                # zeros rather than empty, as these may be cast to the
+                # dtype of the derived values
+                self._lazy_chunks[chunk] = (
+                    np.zeros(
+                        (size, *self.fallback.shape), self.fallback.dtype
+                    ),
+                    np.zeros(size, dtype=bool),
+                )
+            rows = indices[chunks == chunk]
+            derived = self._lazy_chunks[chunk][1]
+            missing.append(rows[~derived[rows - chunk * self._chunk_size]])
+        missing = np.unique(np.concatenate(missing))
+        if len(missing) == 0:
+            return
+
+        values = self._call_safely(
+            self._lazy_features.iloc[missing], self._lazy_encode
+        )
+        missing_chunks = missing // self._chunk_size
+        for chunk in np.unique(missing_chunks).tolist():
+            in_chunk = missing_chunks == chunk
+            chunk_values, derived = self._lazy_chunks[chunk]
+            # Strings may be longer than the ones derived so far.
+            dtype = np.result_type(chunk_values, values)
+            if dtype != chunk_values.dtype:
+                chunk_values = chunk_values.astype(dtype)
+                self._lazy_chunks[chunk] = (chunk_values, derived)
+            rows = missing[in_chunk] - chunk * self._chunk_size
+            chunk_values[rows] = values[in_chunk]
+            derived[rows] = True
+
+    def _drop_lazy_chunks(self, first_chunk: int) -> None:
+        """Drops the derived chunks from the given one onwards."""
+        self._lazy_chunks = {
+            chunk: values
+            for chunk, values in self._lazy_chunks.items()
+            if chunk < first_chunk
+        }
+
+    def _materialize(self) -> None:
+        """Derives all the values of the lazy rows."""
+        if self._lazy_features is None:
+            return
+        n_lazy = len(self._lazy_features)
+        self._derive_lazy(np.arange(n_lazy))
+        n_chunks = -(-n_lazy // self._chunk_size)
+        self._cached = np.concatenate(
+            [self._cached]
+            + [self._lazy_chunks[chunk][0] for chunk in range(n_chunks)],
+            axis=0,
+        )
+        self._lazy_features = None
+        self._lazy_chunks = {}
+        self._lazy_encode = None
+
+    def _take(self, indices: IndicesType) -> StyleArray:
+        """Returns the values at the given indices, deriving only those."""
+        if self._lazy_features is None:
+            return self._cached[indices]
+        indices = np.asarray(indices, dtype=np.intp)
+        n_cached = self._cached.shape[0]
+        is_lazy = indices >= n_cached
+        lazy_positions = np.flatnonzero(is_lazy)
+        lazy_indices = indices[is_lazy] - n_cached
+        self._derive_lazy(lazy_indices)
+
+        chunks = lazy_indices // self._chunk_size
+        unique_chunks = np.unique(chunks).tolist()
+        dtype = np.result_type(
+            self._cached,
+            *(self._lazy_chunks[chunk][0] for chunk in unique_chunks),
+        )
+        values = np.empty((len(indices), *self.fallback.shape), dtype=dtype)
+        values[~is_lazy] = self._cached[indices[~is_lazy]]
+        for chunk in unique_chunks:
+            in_chunk = chunks == chunk
+            values[lazy_positions[in_chunk]] = self._lazy_chunks[chunk][0][
+                lazy_indices[in_chunk] - chunk * self._chunk_size
+            ]
+        return values
+
     def _append(self, array: StyleArray) -> None:
+        self._materialize()
         self._cached = np.append(self._cached, array, axis=0)
 
     def _delete(self, indices: IndicesType) -> None:
+        if self._lazy_features is not None:
+            indices = np.asarray(indices, dtype=np.intp)
+            n_cached = self._cached.shape[0]
+            lazy_indices = indices[indices >= n_cached] - n_cached
+            indices = indices[indices < n_cached]
+            if len(lazy_indices) > 0:
+                keep = np.ones(len(self._lazy_features), dtype=bool)
+                keep[lazy_indices] = False
+                self._lazy_features = self._lazy_features.iloc[keep]
+                # Only the chunks before the first deleted row are unchanged.
+                self._drop_lazy_chunks(
+                    np.min(lazy_indices) // self._chunk_size
+                )
         self._cached = np.delete(self._cached, indices, axis=0)
 
     def _clear(self) -> None:
         self._cached = _empty_array_like(self.fallback)
+        self._lazy_features = None
+        self._lazy_chunks = {}
+        self._lazy_encode = None
 
     def _json_encode(self) -> dict:
         return self.dict()
@@ -284,6 +439,8 @@ def _get_style_values(
     value_ndim: int = 0,
 ):
     """Returns a scalar style value or indexes non-scalar style values."""
+    if isinstance(encoding, _DerivedStyleEncoding):
+        return encoding._take(indices)
     values = encoding._values
     return values if values.ndim == value_ndim else values[indices]
 
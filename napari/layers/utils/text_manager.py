@@ -1,7 +1,7 @@
 import warnings
 from collections.abc import Sequence
 from copy import deepcopy
-from typing import Any, Optional, Union
+from typing import Any, ClassVar, Optional, Union
 
 import numpy as np
 import pandas as pd
@@ -91,6 +91,10 @@ class TextManager(EventedModel):
     translation: Array[float] = 0
     rotation: float = 0
 
+    # Maximum number of text elements to display, beyond which the text is
+    # culled to the canvas and decimated.
+    _max_view_count: ClassVar[int] = 4096
+
     def __init__(
         self, text=None, properties=None, n_text=None, features=None, **kwargs
     ) -> None:
@@ -291,6 +295,62 @@ class TextManager(EventedModel):
             else values
         )
 
+    def _cull_view(
+        self, coords: np.ndarray, bbox: Optional[np.ndarray] = None
+    ) -> Optional[np.ndarray]:
+        """Get the text elements to display when there are too many in view.
+
+        When more than ``_max_view_count`` text elements are in view, only
+        the ones inside the displayed bounding box are kept, and these are
+        decimated to the first one in each cell of a grid whose cells get
+        larger when zooming out. The grid is anchored to the data origin so
+        that the displayed text elements do not change when panning.
+
+        Parameters
+        ----------
+        coords : (N, D) np.ndarray
+            The coordinates of the text elements in view.
+        bbox : (2, D) np.ndarray, optional
+            The minimum and maximum coordinates of the displayed region. If
+            None, the text elements are decimated over their bounding box.
+
+        Returns
+        -------
+        indices : np.ndarray or None
+            Sorted indices of the text elements to display, or None if all
+            of them should be displayed.
+        """
+        if len(coords) <= self._max_view_count:
+            return None
+        indices = np.arange(len(coords))
+        if bbox is not None and np.all(bbox[1] > bbox[0]):
+            size = bbox[1] - bbox[0]
+            # Keep the text anchored just outside of the canvas that may
+            # still be partially visible.
+            margin = 0.1 * size + np.max(np.abs(self.translation))
+            in_view = np.all(
+                (coords >= bbox[0] - margin) & (coords <= bbox[1] + margin),
+                axis=1,
+            )
+            indices = indices[in_view]
+            size = size + 2 * margin
+        else:
+            size = np.ptp(coords, axis=0)
+        if len(indices) <= self._max_view_count:
+            return indices
+
+        # The grid is not aligned with the region, which can then overlap
+        # one more cell along each axis.
+        n_cells = max(
+            int(self._max_view_count ** (1 / coords.shape[1])) - 1, 1
+        )
+        cell_size = np.where(size > 0, size / n_cells, 1)
+        cells = np.floor(coords[indices] / cell_size).astype(np.int64)
+        cells -= cells.min(axis=0)
+        keys = np.ravel_multi_index(cells.T, cells.max(axis=0) + 1)
+        _, first = np.unique(keys, return_index=True)
+        return indices[np.sort(first)]
+
     def _view_color(self, indices_view: np.ndarray) -> np.ndarray:
         """Get the colors of the text elements at the given indices."""
         return _get_style_values(self.color, indices_view, value_ndim=1)
@@ -1,12 +1,73 @@
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from typing import Any, Union
+from typing import Any, Callable, Optional, Union
 
 import numpy as np
 import numpy.typing as npt
 
 from napari.layers.base._slice import _next_request_id
 from napari.layers.utils._slice_input import _SliceInput, _ThickNDSlice
-from napari.layers.vectors._vectors_constants import VectorsProjectionMode
+from napari.layers.vectors._vector_utils import (
+    generate_vector_meshes,
+    is_lazy_vector_field,
+)
+from napari.layers.vectors._vectors_constants import (
+    VectorsProjectionMode,
+    VectorStyle,
+)
+
+
+class _VectorSliceCache:
+    """Least recently used cache of sliced vectors and their meshes.
+
+    The cache is shared by the slice requests of a layer, which may run on
+    different threads.
+
+    Parameters
+    ----------
+    max_bytes : int
+        Maximum total size of the cached arrays, in bytes.
+    """
+
+    def __init__(self, max_bytes: int = 256 * 2**20) -> None:
+        self.max_bytes = max_bytes
+        self._items: OrderedDict[tuple, tuple] = OrderedDict()
+        self._nbytes = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _sizeof(value: tuple) -> int:
+        return sum(getattr(v, 'nbytes', 0) for v in value)
+
+    def get(self, key: tuple) -> Optional[tuple]:
+        with self._lock:
+            value = self._items.get(key)
+            if value is not None:
+                self._items.move_to_end(key)
+            return value
+
+    def put(self, key: tuple, value: tuple) -> None:
+        nbytes = self._sizeof(value)
+        if nbytes > self.max_bytes:
+            return
+        with self._lock:
+            old = self._items.pop(key, None)
+            if old is not None:
+                self._nbytes -= self._sizeof(old)
+            self._items[key] = value
+            self._nbytes += nbytes
+            while self._nbytes > self.max_bytes:
+                _, old = self._items.popitem(last=False)
+                self._nbytes -= self._sizeof(old)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+            self._nbytes = 0
+
+    def __len__(self) -> int:
+        return len(self._items)
 
 
 @dataclass(frozen=True)
@@ -20,6 +81,13 @@ class _VectorSliceResponse:
     alphas : array like or scalar
         Used to change the opacity of the sliced vectors for visualization.
         Should be broadcastable to indices.
+    data : (M, 2, ndisplay) array
+        The start points and projections of the sliced vectors in the
+        displayed dimensions.
+    vertices : (V, ndisplay) array
+        Vertices of the mesh of the sliced vectors.
+    faces : (F, 3) array
+        Vertex indices of the triangles of the mesh of the sliced vectors.
     slice_input : _SliceInput
         Describes the slicing plane or bounding box in the layer's dimensions.
     request_id : int
@@ -28,6 +96,9 @@ class _VectorSliceResponse:
 
     indices: np.ndarray = field(repr=False)
     alphas: Union[np.ndarray, float] = field(repr=False)
+    data: np.ndarray = field(repr=False)
+    vertices: np.ndarray = field(repr=False)
+    faces: np.ndarray = field(repr=False)
     slice_input: _SliceInput
     request_id: int
 
@@ -51,6 +122,15 @@ class _VectorSliceRequest:
         The layer's data field, which is the main input to slicing.
     data_slice : _ThickNDSlice
         The slicing coordinates and margins in data space.
+    field_stride : int
+        Only used for image-like vector fields: every field_stride-th vector
+        is displayed along each displayed dimension.
+    field_corners : (2, D) array or None
+        Only used for image-like vector fields: the inclusive ranges of the
+        displayed dimensions to slice. If None, the whole field is sliced.
+    cache : _VectorSliceCache or None
+        Cache of the sliced vectors and meshes of previous requests, which is
+        used and updated by this request.
     others
         See the corresponding attributes in `Layer` and `Vectors`.
     """
@@ -61,42 +141,99 @@ class _VectorSliceRequest:
     projection_mode: VectorsProjectionMode
     length: float = field(repr=False)
     out_of_slice_display: bool = field(repr=False)
+    edge_width: float = field(default=1, repr=False)
+    vector_style: VectorStyle = field(default=VectorStyle.TRIANGLE)
+    field_stride: int = field(default=1, repr=False)
+    field_corners: Optional[np.ndarray] = field(default=None, repr=False)
+    cache: Optional[_VectorSliceCache] = field(default=None, repr=False)
     id: int = field(default_factory=_next_request_id)
 
     def __call__(self) -> _VectorSliceResponse:
+        slice_key = self._cache_key()
+        sliced = self._cached(slice_key, self._slice)
+        indices, alphas, data = sliced
+        # the meshes also depend on the style, unlike the sliced vectors
+        mesh_key = (
+            *slice_key,
+            self.length,
+            self.edge_width,
+            str(self.vector_style),
+        )
+        vertices, faces = self._cached(
+            mesh_key,
+            lambda: generate_vector_meshes(
+                data, self.edge_width, self.length, self.vector_style
+            ),
+        )
+
+        return _VectorSliceResponse(
+            indices=indices,
+            alphas=alphas,
+            data=data,
+            vertices=vertices,
+            faces=faces,
+            slice_input=self.slice_input,
+            request_id=self.id,
+        )
+
+    def _cached(self, key: tuple, compute: Callable[[], tuple]) -> tuple:
+        """Return the cached value for key, computing and caching it if needed."""
+        value = None if self.cache is None else self.cache.get(key)
+        if value is None:
+            value = compute()
+            if self.cache is not None:
+                self.cache.put(key, value)
+        return value
+
+    def _cache_key(self) -> tuple:
+        """Key of the cached sliced vectors of equivalent requests."""
+        point, m_left, m_right = self.data_slice.as_array()
+        corners = self.field_corners
+        return (
+            tuple(self.slice_input.order),
+            self.slice_input.ndisplay,
+            point.tobytes(),
+            m_left.tobytes(),
+            m_right.tobytes(),
+            str(self.projection_mode),
+            self.out_of_slice_display,
+            self.field_stride,
+            None if corners is None else corners.tobytes(),
+        )
+
+    def _slice(
+        self,
+    ) -> tuple[npt.NDArray, Union[npt.NDArray, float], npt.NDArray]:
+        """Indices, alphas and displayed data of the sliced vectors."""
+        disp = list(self.slice_input.displayed)
+        if is_lazy_vector_field(self.data):
+            view_data = self._get_field_slice_data()
+            # all the vectors of a field share the same color
+            return np.zeros(len(view_data), dtype=int), 1, view_data
+
         # Return early if no data
         if len(self.data) == 0:
-            return _VectorSliceResponse(
-                indices=np.empty(0, dtype=int),
-                alphas=np.empty(0),
-                slice_input=self.slice_input,
-                request_id=self.id,
+            return (
+                np.empty(0, dtype=int),
+                np.empty(0),
+                np.empty((0, 2, len(disp))),
             )
 
         not_disp = list(self.slice_input.not_displayed)
         if not not_disp:
             # If we want to display everything, then use all indices.
             # alpha is only impacted by not displayed data, therefore 1
-            return _VectorSliceResponse(
-                indices=np.arange(len(self.data), dtype=int),
-                alphas=1,
-                slice_input=self.slice_input,
-                request_id=self.id,
-            )
+            indices = np.arange(len(self.data), dtype=int)
+            return indices, 1, self.data[:, :, disp]
 
         slice_indices, alphas = self._get_slice_data(not_disp)
+        view_data = self.data[np.ix_(slice_indices, [0, 1], disp)]
+        return slice_indices, alphas, view_data
 
-        return _VectorSliceResponse(
-            indices=slice_indices,
-            alphas=alphas,
-            slice_input=self.slice_input,
-            request_id=self.id,
-        )
-
-    def _get_slice_data(self, not_disp: list[int]) -> tuple[npt.NDArray, int]:
-        data = self.data[:, 0, not_disp]
-        alphas = 1
-
+    def _get_slice_bounds(
+        self, not_disp: list[int]
+    ) -> tuple[npt.NDArray, npt.NDArray]:
+        """Lower and upper bounds of the slice in the not displayed dims."""
         point, m_left, m_right = self.data_slice[not_disp].as_array()
 
         if self.projection_mode == 'none':
@@ -111,6 +248,59 @@ class _VectorSliceRequest:
         too_thin_slice = np.isclose(high, low)
         low[too_thin_slice] -= 0.5
         high[too_thin_slice] += 0.5
+        return low, high
+
+    def _get_field_slice_data(self) -> npt.NDArray:
+        """Read the sliced vectors of an image-like vector field.
+
+        Vectors start at integer pixel positions, so the slice is a strided
+        block of the field that is read at once, and only the coordinates of
+        the vectors in that block are computed. Vectors outside of the slice
+        are never displayed, whatever out_of_slice_display.
+        """
+        shape = np.array(self.data.shape[:-1])
+        disp = list(self.slice_input.displayed)
+        not_disp = list(self.slice_input.not_displayed)
+
+        start = np.zeros(len(shape), dtype=int)
+        stop = shape.copy()
+        step = np.ones(len(shape), dtype=int)
+        if not_disp:
+            low, high = self._get_slice_bounds(not_disp)
+            start[not_disp] = np.maximum(np.ceil(low), 0)
+            stop[not_disp] = np.minimum(np.floor(high) + 1, shape[not_disp])
+        if self.field_corners is not None:
+            start[disp] = np.maximum(self.field_corners[0, disp], 0)
+            stop[disp] = np.minimum(
+                self.field_corners[1, disp] + 1, shape[disp]
+            )
+        # align the displayed grid on the stride so that it doesn't depend on
+        # the position of the field of view
+        start[disp] -= start[disp] % self.field_stride
+        step[disp] = self.field_stride
+
+        if np.any(stop <= start):
+            return np.empty((0, 2, len(disp)), dtype=np.float32)
+
+        slices = tuple(map(slice, start, stop, step))
+        projections = np.asarray(self.data[slices], dtype=np.float32)
+        grid = np.meshgrid(
+            *(np.arange(*s.indices(n)) for s, n in zip(slices, shape)),
+            indexing='ij',
+        )
+        vectors = np.empty(
+            (projections[..., 0].size, 2, len(disp)), np.float32
+        )
+        for i, d in enumerate(disp):
+            vectors[:, 0, i] = grid[d].ravel()
+            vectors[:, 1, i] = projections[..., d].ravel()
+        return vectors
+
+    def _get_slice_data(self, not_disp: list[int]) -> tuple[npt.NDArray, int]:
+        data = self.data[:, 0, not_disp]
+        alphas = 1
+
+        low, high = self._get_slice_bounds(not_disp)
 
         inside_slice = np.all((data >= low) & (data <= high), axis=1)
         slice_indices = np.where(inside_slice)[0].astype(int)
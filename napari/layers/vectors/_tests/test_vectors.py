@@ -43,6 +43,102 @@ def test_random_vectors_image():
     assert layer._view_data.shape[2] == 2
 
 
+def test_vectors_image_positions():
+    """Test that image-like data places each vector at its own pixel."""
+    data = np.zeros((2, 3, 2))
+    data[0, 2] = [5, 7]
+    layer = Vectors(data)
+    index = np.flatnonzero(np.any(layer.data[:, 1] != 0, axis=1))
+    np.testing.assert_array_equal(layer.data[index], [[[0, 2], [5, 7]]])
+
+
+def test_lazy_vectors_image():
+    """Test that non-numpy image-like data is sliced lazily."""
+    da = pytest.importorskip('dask.array')
+    np.random.seed(0)
+    data = np.random.random((12, 20, 10, 3)).astype(np.float32)
+    layer = Vectors(da.from_array(data, chunks=(4, 10, 10, 3)))
+    assert isinstance(layer.data, da.Array)
+    assert layer.ndim == 3
+    np.testing.assert_array_equal(layer.extent.data, [[0, 0, 0], [11, 19, 9]])
+
+    # the slice matches the one of the equivalent coordinate-like data
+    expected = Vectors(data)._view_data
+    assert layer._view_data.shape == expected.shape == (200, 2, 2)
+    order = np.lexsort(layer._view_data[:, 0].T)
+    expected_order = np.lexsort(expected[:, 0].T)
+    np.testing.assert_allclose(
+        layer._view_data[order], expected[expected_order]
+    )
+    assert len(layer._view_face_color) == 200
+
+
+def test_lazy_vectors_image_stride():
+    """Test that the display stride of lazy vector fields follows the view."""
+    da = pytest.importorskip('dask.array')
+    data = da.zeros((64, 64, 2), chunks=16)
+    layer = Vectors(data)
+    assert layer._view_data.shape[0] == 64 * 64
+    layer._max_field_vectors = 256
+    layer.refresh()
+    assert layer._view_data.shape[0] == 256
+
+    # zoomed out, every 4th vector is displayed
+    layer._update_draw(1, np.array([[0, 0], [63, 63]]), (100, 100))
+    assert layer._field_stride == 4
+    np.testing.assert_array_equal(
+        np.unique(layer._view_data[:, 0, 0]), np.arange(0, 64, 4)
+    )
+
+    # zoomed in, all the vectors in and around the view are displayed
+    layer._update_draw(1, np.array([[8, 8], [15, 15]]), (100, 100))
+    assert layer._field_stride == 1
+    np.testing.assert_array_equal(
+        np.unique(layer._view_data[:, 0, 0]), np.arange(4, 20)
+    )
+
+
+def test_vectors_slice_meshes_cached():
+    """Test that the meshes of revisited slices are not generated again."""
+    np.random.seed(0)
+    data = 10 * np.random.random((100, 2, 3))
+    layer = Vectors(data)
+    dims = Dims(ndim=3, ndisplay=2)
+
+    dims.point = (2, 0, 0)
+    layer._slice_dims(dims)
+    vertices = layer._view_vertices
+    assert len(vertices) == 3 * len(layer._view_data)
+    assert len(layer._view_faces) == len(layer._view_data)
+
+    dims.point = (5, 0, 0)
+    layer._slice_dims(dims)
+    dims.point = (2, 0, 0)
+    layer._slice_dims(dims)
+    assert layer._view_vertices is vertices
+
+    # in place modifications of the data are picked up on refresh
+    layer.data[:, 0, 0] = 5
+    layer.refresh()
+    assert layer._view_vertices is not vertices
+    assert len(layer._view_data) == 0
+
+    layer.data = data
+    view_data = layer._view_data
+    layer.vector_style = 'arrow'
+    assert len(layer._view_vertices) == 7 * len(layer._view_data)
+    assert len(layer._view_faces) == 3 * len(layer._view_data)
+
+    # restyling reuses the sliced vectors and the meshes of previous styles
+    assert layer._view_data is view_data
+    vertices = layer._view_vertices
+    layer.edge_width = 3
+    assert layer._view_data is view_data
+    assert layer._view_vertices is not vertices
+    layer.edge_width = 1
+    assert layer._view_vertices is vertices
+
+
 def test_no_args_vectors():
     """Test instantiating Vectors layer with no arguments"""
     layer = Vectors()
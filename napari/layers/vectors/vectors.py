@@ -1,6 +1,6 @@
 import warnings
 from copy import copy
-from typing import Any, Union
+from typing import Any, Optional, Union
 
 import numpy as np
 import pandas as pd
@@ -12,10 +12,15 @@ from napari.layers.utils.color_manager import ColorManager
 from napari.layers.utils.color_transformations import ColorType
 from napari.layers.utils.layer_utils import _FeatureTable
 from napari.layers.vectors._slice import (
+    _VectorSliceCache,
     _VectorSliceRequest,
     _VectorSliceResponse,
 )
-from napari.layers.vectors._vector_utils import fix_data_vectors
+from napari.layers.vectors._vector_utils import (
+    field_stride,
+    fix_data_vectors,
+    is_lazy_vector_field,
+)
 from napari.layers.vectors._vectors_constants import (
     VectorsProjectionMode,
     VectorStyle,
@@ -37,7 +42,8 @@ class Vectors(Layer):
         list of N vectors with start point and projections of the vector in
         D dimensions. An (N1, N2, ..., ND, D) array is interpreted as
         "image-like" data where there is a length D vector of the
-        projections at each pixel.
+        projections at each pixel. Image-like data that is not a numpy array,
+        e.g. a dask or zarr array, is kept as is and sliced lazily, see Notes.
     affine : n-D array or napari.utils.transforms.Affine
         (N+1, N+1) affine transformation matrix in homogeneous coordinates.
         The first (N, N) entries correspond to a linear transform and
@@ -52,7 +58,8 @@ class Vectors(Layer):
         Whether slices of out-of-core datasets should be cached upon retrieval.
         Currently, this only applies to dask arrays.
     edge_color : str
-        Color of all of the vectors.
+        Color of all of the vectors. For lazy vector fields, a color derived
+        from features gives the same color to all the vectors.
     edge_color_cycle : np.ndarray, list
         Cycle of colors (provided as string name, RGB, or RGBA) to map to edge_color if a
         categorical attribute is used color the vectors.
@@ -73,7 +80,8 @@ class Vectors(Layer):
         The default value of each feature in a table with one row.
     features : dict[str, array-like] or DataFrame
         Features table where each row corresponds to a vector and each column
-        is a feature.
+        is a feature. Lazy vector fields have a single row, shared by all
+        their vectors, so per-vector features cannot be given for them.
     length : float
         Multiplicative factor on projections for length of all vectors.
     metadata : dict
@@ -93,7 +101,7 @@ class Vectors(Layer):
         be projected onto the viewed dimenions.
     properties : dict {str: array (N,)}, DataFrame
         Properties for each vector. Each property should be an array of length N,
-        where N is the number of vectors.
+        where N is the number of vectors, or 1 for lazy vector fields.
     property_choices : dict {str: array (N,)}
         possible values for each property.
     rotate : float, 3-tuple of float, or n-D array.
@@ -117,11 +125,12 @@ class Vectors(Layer):
 
     Attributes
     ----------
-    data : (N, 2, D) array
-        The start point and projections of N vectors in D dimensions.
+    data : (N, 2, D) or (N1, N2, ..., ND, D) array
+        The start point and projections of N vectors in D dimensions, or a
+        lazily sliced image-like vector field.
     features : Dataframe-like
         Features table where each row corresponds to a vector and each column
-        is a feature.
+        is a feature. It has a single row for lazy vector fields.
     feature_defaults : DataFrame-like
         Stores the default value of each feature in a table with one row.
     properties : dict {str: array (N,)}, DataFrame
@@ -158,6 +167,13 @@ class Vectors(Layer):
 
     Notes
     -----
+    Lazy vector fields are never loaded as a whole: only the vectors of the
+    current slice and field of view are read, and the vectors are displayed
+    with a stride that depends on the zoom level, so that at most
+    ``_max_field_vectors`` vectors are displayed at once. All the vectors of
+    a field share a single row of features and a single edge color, and
+    out_of_slice_display has no effect on them.
+
     _view_data : (M, 2, 2) array
         The start point and projections of N vectors in 2D for vectors whose
         start point is in the currently viewed slice.
@@ -167,12 +183,19 @@ class Vectors(Layer):
         indices for the M in view vectors
     _view_alphas : (M,) or float
         relative opacity for the M in view vectors
+    _view_vertices : (V, 2) or (V, 3) array
+        vertices of the mesh of the M in view vectors
+    _view_faces : (F, 3) array
+        vertex indices of the triangles of the mesh of the M in view vectors
     _property_choices : dict {str: array (N,)}
         Possible values for the properties in Vectors.properties.
     _max_vectors_thumbnail : int
         The maximum number of vectors that will ever be used to render the
         thumbnail. If more vectors are present then they are randomly
         subsampled.
+    _max_field_vectors : int
+        The maximum number of vectors of a lazy vector field that are
+        displayed at once.
     """
 
     _projectionclass = VectorsProjectionMode
@@ -180,6 +203,9 @@ class Vectors(Layer):
     # The max number of vectors that will ever be used to render the thumbnail
     # If more vectors are present then they are randomly subsampled
     _max_vectors_thumbnail = 1024
+    # The max number of vectors of a lazy vector field that are displayed
+    # If more vectors are in view then they are displayed with a stride
+    _max_field_vectors = 2**16
 
     def __init__(
         self,
@@ -256,24 +282,27 @@ class Vectors(Layer):
         self._length = float(length)
 
         self._data = data
+        # Display stride and sliced field of view of lazy vector fields
+        self._field_stride = 1
+        self._field_corners = None
 
         self._feature_table = _FeatureTable.from_layer(
             features=features,
             feature_defaults=feature_defaults,
             properties=properties,
             property_choices=property_choices,
-            num_data=len(self.data),
+            num_data=self._num_data,
         )
 
         self._edge = ColorManager._from_layer_kwargs(
-            n_colors=len(self.data),
+            n_colors=self._num_data,
             colors=edge_color,
             continuous_colormap=edge_colormap,
             contrast_limits=edge_contrast_limits,
             categorical_colormap=edge_color_cycle,
             properties=(
                 self.properties
-                if self._data.size > 0
+                if self._num_data > 0
                 else self._feature_table.currents()
             ),
         )
@@ -282,6 +311,11 @@ class Vectors(Layer):
         self._view_data = np.empty((0, 2, 2))
         self._view_indices = np.array([], dtype=int)
         self._view_alphas: Union[float, np.ndarray] = 1.0
+        # Mesh of the vectors in the currently viewed slice
+        self._view_vertices = np.empty((0, 2))
+        self._view_faces = np.empty((0, 3), dtype=np.uint32)
+        # Sliced vectors and meshes of recent slices
+        self._slice_cache = _VectorSliceCache()
 
         # now that everything is set up, make the layer visible (if set to visible)
         self.refresh()
@@ -289,15 +323,21 @@ class Vectors(Layer):
 
     @property
     def data(self) -> np.ndarray:
-        """(N, 2, D) array: start point and projections of vectors."""
+        """(N, 2, D) array: start point and projections of vectors.
+
+        Or an (N1, N2, ..., ND, D) array-like for lazy vector fields.
+        """
         return self._data
 
     @data.setter
     def data(self, vectors: np.ndarray):
-        previous_n_vectors = len(self.data)
+        previous_n_vectors = self._num_data
 
         self._data, _ = fix_data_vectors(vectors, self.ndim)
-        n_vectors = len(self.data)
+        self._slice_cache.clear()
+        self._field_stride = 1
+        self._field_corners = None
+        n_vectors = self._num_data
 
         # Adjust the props/color arrays when the number of vectors has changed
         with self.events.blocker_all(), self._edge.events.blocker_all():
@@ -305,9 +345,9 @@ class Vectors(Layer):
             if n_vectors < previous_n_vectors:
                 # If there are now fewer points, remove the size and colors of the
                 # extra ones
-                if len(self._edge.colors) > n_vectors:
+                if self._edge._n_colors() > n_vectors:
                     self._edge._remove(
-                        np.arange(n_vectors, len(self._edge.colors))
+                        np.arange(n_vectors, self._edge._n_colors())
                     )
 
             elif n_vectors > previous_n_vectors:
@@ -323,6 +363,19 @@ class Vectors(Layer):
         self.events.data(value=self.data)
         self._reset_editable()
 
+    @property
+    def _is_vector_field(self) -> bool:
+        """bool: whether the data is a lazily sliced image-like vector field."""
+        return is_lazy_vector_field(self._data)
+
+    @property
+    def _num_data(self) -> int:
+        """int: number of rows of features and edge colors.
+
+        All the vectors of a lazy vector field share a single row.
+        """
+        return 1 if self._is_vector_field else len(self._data)
+
     @property
     def features(self):
         """Dataframe-like features table.
@@ -346,7 +399,7 @@ class Vectors(Layer):
         self,
         features: Union[dict[str, np.ndarray], pd.DataFrame],
     ) -> None:
-        self._feature_table.set_values(features, num_data=len(self.data))
+        self._feature_table.set_values(features, num_data=self._num_data)
         if self._edge.color_properties is not None:
             if self._edge.color_properties.name not in self.features:
                 self._edge.color_mode = ColorMode.DIRECT
@@ -413,7 +466,7 @@ class Vectors(Layer):
                 'vector_style': self.vector_style,
                 'edge_color': (
                     self.edge_color
-                    if self.data.size
+                    if self._num_data
                     else [self._edge.current_color]
                 ),
                 'edge_color_cycle': self.edge_color_cycle,
@@ -432,7 +485,7 @@ class Vectors(Layer):
 
     def _get_ndim(self) -> int:
         """Determine number of dimensions of the layer."""
-        return self.data.shape[2]
+        return self.data.shape[-1]
 
     @property
     def _extent_data(self) -> np.ndarray:
@@ -442,7 +495,13 @@ class Vectors(Layer):
         -------
         extent_data : array, shape (2, D)
         """
-        if len(self.data) == 0:
+        if self._is_vector_field:
+            # the extent of the start points, reading the projections would
+            # require loading the whole field
+            extrema = np.array(
+                [np.zeros(self.ndim), np.subtract(self.data.shape[:-1], 1)]
+            )
+        elif len(self.data) == 0:
             extrema = np.full((2, self.ndim), np.nan)
         else:
             # Convert from projections to endpoints using the current length
@@ -462,7 +521,7 @@ class Vectors(Layer):
     def out_of_slice_display(self, out_of_slice_display: bool) -> None:
         self._out_of_slice_display = out_of_slice_display
         self.events.out_of_slice_display()
-        self.refresh()
+        self._refresh_view()
 
     @property
     def edge_width(self) -> float:
@@ -474,7 +533,7 @@ class Vectors(Layer):
         self._edge_width = edge_width
 
         self.events.edge_width()
-        self.refresh()
+        self._refresh_view()
 
     @property
     def vector_style(self) -> str:
@@ -495,7 +554,7 @@ class Vectors(Layer):
         self._vector_style = VectorStyle(vector_style)
         if self._vector_style != old_vector_style:
             self.events.vector_style()
-            self.refresh()
+            self._refresh_view()
 
     @property
     def length(self) -> float:
@@ -507,7 +566,7 @@ class Vectors(Layer):
         self._length = float(length)
 
         self.events.length()
-        self.refresh()
+        self._refresh_view()
 
     @property
     def edge_color(self) -> np.ndarray:
@@ -518,7 +577,7 @@ class Vectors(Layer):
     def edge_color(self, edge_color: ColorType):
         self._edge._set_color(
             color=edge_color,
-            n_colors=len(self.data),
+            n_colors=self._num_data,
             properties=self.properties,
             current_properties=self._feature_table.currents(),
         )
@@ -652,7 +711,7 @@ class Vectors(Layer):
         # Using fancy array indexing implicitly creates a new
         # array rather than creating a view of the original one
         # in ColorManager
-        face_color = self.edge_color[self._view_indices]
+        face_color = self._edge._take(self._view_indices)
         face_color[:, -1] *= self._view_alphas
 
         # Generally, several triangles are drawn for each vector,
@@ -702,6 +761,13 @@ class Vectors(Layer):
     def _make_slice_request_internal(
         self, slice_input: _SliceInput, data_slice: _ThickNDSlice
     ):
+        stride = self._field_stride
+        if self._is_vector_field and self._field_corners is None:
+            # nothing drawn yet, display the whole field
+            stride = field_stride(
+                np.take(self.data.shape, slice_input.displayed),
+                self._max_field_vectors,
+            )
         return _VectorSliceRequest(
             slice_input=slice_input,
             data=self.data,
@@ -709,6 +775,11 @@ class Vectors(Layer):
             projection_mode=self.projection_mode,
             out_of_slice_display=self.out_of_slice_display,
             length=self.length,
+            edge_width=self.edge_width,
+            vector_style=self._vector_style,
+            field_stride=stride,
+            field_corners=self._field_corners,
+            cache=self._slice_cache,
         )
 
     def _update_slice_response(self, response: _VectorSliceResponse):
@@ -717,11 +788,60 @@ class Vectors(Layer):
         indices = response.indices
         alphas = response.alphas
 
-        disp = self._slice_input.displayed
-
         self._view_indices = indices
         self._view_alphas = alphas
-        self._view_data = self.data[np.ix_(list(indices), [0, 1], disp)]
+        self._view_data = response.data
+        self._view_vertices = response.vertices
+        self._view_faces = response.faces
+
+    def refresh(self, event: Optional[Event] = None) -> None:
+        # The data may have been modified in place
+        self._slice_cache.clear()
+        super().refresh(event)
+
+    def _refresh_view(self) -> None:
+        """Refresh the view after a change of style, keeping cached slices.
+
+        The cache keys include the style, so the sliced vectors are reused
+        and only the meshes of a new style are generated.
+        """
+        super().refresh()
+
+    def _update_draw(
+        self, scale_factor, corner_pixels_displayed, shape_threshold
+    ):
+        super()._update_draw(
+            scale_factor, corner_pixels_displayed, shape_threshold
+        )
+        if not self._is_vector_field:
+            return
+        displayed = self._slice_input.displayed
+        corners = np.array(
+            [np.zeros(self.ndim), np.subtract(self.data.shape[:-1], 1)],
+            dtype=int,
+        )
+        # in 3D the whole field can be in view
+        if self._slice_input.ndisplay == 2:
+            corners[:, displayed] = self.corner_pixels[:, displayed]
+        view_shape = corners[1, displayed] - corners[0, displayed] + 1
+        stride = field_stride(view_shape, self._max_field_vectors)
+
+        sliced = self._field_corners
+        if (
+            stride == self._field_stride
+            and sliced is not None
+            and np.all(corners[0, displayed] >= sliced[0, displayed])
+            and np.all(corners[1, displayed] <= sliced[1, displayed])
+        ):
+            return
+        # Slice a margin around the field of view so that panning doesn't
+        # require slicing again right away
+        margin = view_shape // 2
+        corners[0, displayed] -= margin
+        corners[1, displayed] += margin
+        self._field_stride = stride
+        self._field_corners = corners
+        self._refresh_view()
 
     def _update_thumbnail(self):
         """Update thumbnail with current vectors and colors."""
@@ -762,7 +882,7 @@ class Vectors(Layer):
             downsampled = np.clip(
                 downsampled, 0, np.subtract(self._thumbnail_shape[:2], 1)
             )
-            edge_colors = self._edge.colors[thumbnail_color_indices]
+            edge_colors = self._edge._take(thumbnail_color_indices)
             for v, ec in zip(downsampled, edge_colors):
                 start = v[0]
                 stop = v[1]
@@ -0,0 +1,183 @@
+"""On-disk cache of the npe2 plugin manifests discovered in the environment.
+
+Discovering plugins means scanning the entry points of every installed
+distribution and parsing the manifest of each plugin, which takes a
+noticeable time at startup in environments with many packages. The parsed
+manifests are stored in the user cache directory, together with a
+fingerprint of the environment (the ``sys.path`` directories and their
+modification times, and the manifest files and their modification times).
+Installing, removing or editing a plugin changes the fingerprint, which
+triggers a full discovery and a rewrite of the cache.
+
+Only the manifests are cached: plugin modules are still imported only when
+one of their commands (e.g. a reader) is executed.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import sys
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Optional
+
+from npe2 import PluginManager, PluginManifest
+
+from napari.utils._appdirs import user_cache_dir
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+logger = logging.getLogger(__name__)
+
+#: Bump when the format of the cache file changes.
+CACHE_VERSION = 1
+CACHE_FILE_NAME = 'npe2_manifests.json'
+
+
+def cache_path() -> Path:
+    """Return the path of the manifest cache file."""
+    return Path(user_cache_dir()) / CACHE_FILE_NAME
+
+
+def _mtime_ns(path: str) -> Optional[int]:
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _environment_key() -> dict[str, Any]:
+    """Return a fingerprint of the installed distributions.
+
+    Installing or removing a distribution adds or removes its ``.dist-info``
+    directory (or a ``.pth`` file for editable installs), which changes the
+    modification time of the enclosing ``sys.path`` directory. The current
+    working directory (``''`` in ``sys.path``) is left out, as any file
+    written there would otherwise invalidate the cache.
+    """
+    import npe2
+
+    from napari import __version__
+
+    return {
+        'cache_version': CACHE_VERSION,
+        'napari': __version__,
+        'npe2': npe2.__version__,
+        'executable': sys.executable,
+        'sys_path': [[p, _mtime_ns(p)] for p in sys.path if p],
+    }
+
+
+def _manifest_key(manifest: PluginManifest) -> Optional[list]:
+    """Return the source file of a manifest and its modification time."""
+    source = manifest._source_file
+    if source is None:
+        return None
+    return [str(source), _mtime_ns(str(source))]
+
+
+def load_manifests() -> Optional[list[PluginManifest]]:
+    """Return the cached manifests, or None if the cache is missing or stale.
+
+    Returns
+    -------
+    list of PluginManifest or None
+        Manifests discovered last time, if the environment and all manifest
+        files are unchanged since then.
+    """
+    try:
+        with open(cache_path()) as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if cache.get('environment') != _environment_key():
+        return None
+
+    manifests = []
+    try:
+        for entry in cache['manifests']:
+            source, mtime = entry['source']
+            if _mtime_ns(source) != mtime:
+                return None
+            manifest = PluginManifest(**entry['manifest'])
+            manifest._source_file = Path(source)
+            manifests.append(manifest)
+    except Exception:  # noqa: BLE001
+        # corrupt cache or incompatible manifest schema, rediscover
+        logger.debug('Ignoring invalid plugin manifest cache', exc_info=True)
+        return None
+    return manifests
+
+
+def save_manifests(manifests: Iterable[PluginManifest]) -> None:
+    """Write ``manifests`` to the cache, keyed by the current environment.
+
+    Manifests without a source file (e.g. dynamic plugins) are not cached.
+    Failures to write the cache are logged and otherwise ignored.
+    """
+    entries = []
+    for manifest in manifests:
+        key = _manifest_key(manifest)
+        if key is None or key[1] is None:
+            continue
+        entries.append(
+            {'source': key, 'manifest': json.loads(manifest.json())}
+        )
+    cache = {'environment': _environment_key(), 'manifests': entries}
+
+    path = cache_path()
+    tmp_path = path.with_suffix(f'.{os.getpid()}.tmp')
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp_path, 'w') as f:
+            json.dump(cache, f)
+        os.replace(tmp_path, path)
+    except OSError:
+        logger.debug('Could not write plugin manifest cache', exc_info=True)
+        tmp_path.unlink(missing_ok=True)
+
+
+def discover(pm: PluginManager, include_npe1: bool = False) -> int:
+    """Discover plugins into ``pm``, using the manifest cache when valid.
+
+    This is a drop-in replacement for ``pm.discover(include_npe1=...)``.
+
+    Parameters
+    ----------
+    pm : PluginManager
+        The plugin manager to register discovered manifests with.
+    include_npe1 : bool
+        Whether to also detect npe1 plugins as npe1 adapters. npe1 adapters
+        are not cached, so this always performs a full discovery.
+
+    Returns
+    -------
+    int
+        Number of plugins registered.
+    """
+    if include_npe1 or type(pm).discover is not PluginManager.discover:
+        # npe1 adapters are built from the installed packages, and plugin
+        # managers that customize discovery (e.g. in tests) are respected.
+        return pm.discover(include_npe1=include_npe1)
+
+    registered = {mf.name for mf in pm.iter_manifests()}
+    manifests = load_manifests()
+    if manifests is None:
+        manifests = [
+            result.manifest
+            for result in PluginManifest.discover()
+            if result.manifest is not None
+            and type(result.manifest) is PluginManifest
+        ]
+        save_manifests(manifests)
+
+    count = 0
+    with pm.events.plugins_registered.paused(lambda a, b: (a[0] | b[0],)):
+        for manifest in manifests:
+            if manifest.name not in registered:
+                pm.register(manifest, warn_disabled=False)
+                registered.add(manifest.name)
+                count += 1
+    return count
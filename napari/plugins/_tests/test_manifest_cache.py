@@ -0,0 +1,114 @@
+import os
+import shutil
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+from npe2 import PluginManager, PluginManifest
+from npe2.manifest.schema import DiscoverResults
+
+from napari.plugins import _manifest_cache
+
+MANIFEST_PATH = Path(__file__).parent / '_sample_manifest.yaml'
+
+
+def _empty_pm() -> PluginManager:
+    """Return a new plugin manager with no registered plugins."""
+    with patch.object(PluginManager, 'discover'):
+        return PluginManager()
+
+
+@pytest.fixture()
+def manifest_file(tmp_path):
+    path = tmp_path / 'napari.yaml'
+    shutil.copy(MANIFEST_PATH, path)
+    return path
+
+
+@pytest.fixture()
+def mock_discover(tmp_path, manifest_file, monkeypatch):
+    """Use a temporary cache and discover only the sample manifest."""
+    monkeypatch.setattr(
+        _manifest_cache, 'cache_path', lambda: tmp_path / 'cache.json'
+    )
+    discover = MagicMock(
+        side_effect=lambda: iter(
+            [
+                DiscoverResults(
+                    PluginManifest.from_file(manifest_file), None, None
+                )
+            ]
+        )
+    )
+    monkeypatch.setattr(PluginManifest, 'discover', discover)
+    return discover
+
+
+def test_discover_uses_cache(mock_discover):
+    pm = _empty_pm()
+    assert _manifest_cache.discover(pm) == 1
+    assert mock_discover.call_count == 1
+    assert _manifest_cache.cache_path().exists()
+
+    # a fresh plugin manager is populated from the cache
+    pm2 = _empty_pm()
+    assert _manifest_cache.discover(pm2) == 1
+    assert mock_discover.call_count == 1
+    assert pm2.get_manifest('my-plugin') == pm.get_manifest('my-plugin')
+    assert list(pm2.iter_compatible_readers(['some.fzzy']))
+
+    # already registered plugins are not registered twice
+    assert _manifest_cache.discover(pm2) == 0
+
+
+def test_cache_invalidated_by_manifest_change(mock_discover, manifest_file):
+    _manifest_cache.discover(_empty_pm())
+    assert mock_discover.call_count == 1
+
+    mtime = manifest_file.stat().st_mtime_ns
+    os.utime(manifest_file, ns=(mtime + 10**9, mtime + 10**9))
+    assert _manifest_cache.load_manifests() is None
+    _manifest_cache.discover(_empty_pm())
+    assert mock_discover.call_count == 2
+
+
+def test_cache_invalidated_by_environment_change(mock_discover, monkeypatch):
+    _manifest_cache.discover(_empty_pm())
+    assert _manifest_cache.load_manifests() is not None
+
+    monkeypatch.setattr(
+        _manifest_cache,
+        '_environment_key',
+        lambda: {'cache_version': -1},
+    )
+    assert _manifest_cache.load_manifests() is None
+
+
+def test_corrupt_cache_is_ignored(mock_discover):
+    _manifest_cache.cache_path().write_text('{not json')
+    assert _manifest_cache.load_manifests() is None
+    assert _manifest_cache.discover(_empty_pm()) == 1
+
+
+def test_custom_discover_is_respected(npe2pm, mock_discover):
+    # e.g. the TestPluginManager blocks discovery
+    assert _manifest_cache.discover(npe2pm) == 0
+    mock_discover.assert_not_called()
+
+
+def test_npe1_shims_are_cached(mock_discover, manifest_file):
+    # registered by PluginManager.discover even without include_npe1
+    manifest_file.write_text(manifest_file.read_text() + '\nnpe1_shim: true\n')
+    assert _manifest_cache.discover(_empty_pm()) == 1
+
+    pm = _empty_pm()
+    assert _manifest_cache.discover(pm) == 1
+    assert mock_discover.call_count == 1
+    assert pm.get_manifest('my-plugin').npe1_shim
+
+
+def test_environment_key_ignores_working_directory(monkeypatch):
+    monkeypatch.setattr(sys, 'path', ['', *sys.path])
+    key = _manifest_cache._environment_key()
+    assert '' not in [p for p, _ in key['sys_path']]
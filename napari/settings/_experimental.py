@@ -15,6 +15,17 @@ class ExperimentalSettings(EventedSettings):
         env='napari_async',
         requires_restart=False,
     )
+    slicing_processes: int = Field(
+        0,
+        title=trans._('Number of processes for asynchronous slicing'),
+        description=trans._(
+            'When rendering images asynchronously, slice images whose data can be reopened (e.g. zarr arrays in directories, HDF5 datasets or memory maps) in this many worker processes, for readers that do not release the GIL while decoding. \n0 slices in a thread of the viewer process.'
+        ),
+        env='napari_slicing_processes',
+        type=int,
+        ge=0,
+        requires_restart=True,
+    )
     autoswap_buffers: bool = Field(
         False,
         title=trans._('Enable autoswapping rendering buffers.'),
@@ -2,11 +2,11 @@
 
 import collections.abc
 import contextlib
+import sys
 from collections.abc import Iterator
 from typing import Any, Callable, Optional
 
 import dask
-import dask.array as da
 from dask.cache import Cache
 
 #: dask.cache.Cache, optional : A dask cache for opportunistic caching
@@ -81,6 +81,11 @@ def resize_dask_cache(
 
 def _is_dask_data(data: Any) -> bool:
     """Return True if data is a dask array or a list/tuple of dask arrays."""
+    # dask.array (and the pandas/scipy it pulls in) is slow to import, and
+    # data cannot be a dask array before it has been imported
+    da = sys.modules.get('dask.array')
+    if da is None:
+        return False
     return isinstance(data, da.Array) or (
         isinstance(data, collections.abc.Sequence)
         and any(isinstance(i, da.Array) for i in data)
@@ -0,0 +1,88 @@
+"""Numpy arrays that use the memory of shared memory blocks."""
+
+import os
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+import numpy.typing as npt
+
+
+class _SharedMemoryOwner:
+    """Keeps a shared memory block mapped while arrays use its memory.
+
+    Numpy arrays created from the buffer of a shared memory block do not
+    keep it mapped, so this is the base of the arrays returned by
+    :func:`shared_memory_array` instead.
+    """
+
+    def __init__(
+        self,
+        shared_memory: SharedMemory,
+        shape: tuple[int, ...],
+        dtype: npt.DTypeLike,
+        offset: int,
+    ) -> None:
+        self.shared_memory = shared_memory
+        self.__array_interface__ = np.ndarray(
+            shape, dtype=dtype, buffer=shared_memory.buf, offset=offset
+        ).__array_interface__
+
+
+def shared_memory_array(
+    shared_memory: SharedMemory,
+    shape: tuple[int, ...],
+    dtype: npt.DTypeLike,
+    offset: int = 0,
+) -> np.ndarray:
+    """Return an array using the memory of a shared memory block.
+
+    The block stays mapped while the array, or any view of it, exists.
+
+    Parameters
+    ----------
+    shared_memory : SharedMemory
+        The shared memory block.
+    shape : tuple of int
+        The shape of the array.
+    dtype : dtype-like
+        The data type of the array.
+    offset : int
+        The offset of the array in the block, in bytes.
+
+    Returns
+    -------
+    np.ndarray
+        The array, which does not copy the memory of the block.
+    """
+    return np.asarray(_SharedMemoryOwner(shared_memory, shape, dtype, offset))
+
+
+def attach_shared_memory(name: str) -> SharedMemory:
+    """Attach to a shared memory block created by another process.
+
+    Unlike ``SharedMemory(name=name)``, the block is not unlinked when this
+    process exits, which is up to the process that created it.
+
+    Parameters
+    ----------
+    name : str
+        The name of the shared memory block.
+
+    Returns
+    -------
+    SharedMemory
+        The attached shared memory block.
+    """
+    try:
+        return SharedMemory(name=name, track=False)
+    except TypeError:
+        # Python < 3.13 always tracks attached blocks on POSIX
+        shared_memory = SharedMemory(name=name)
+        if os.name == 'posix':
+            from multiprocessing import resource_tracker
+
+            resource_tracker.unregister(
+                shared_memory._name,  # type: ignore[attr-defined]
+                'shared_memory',
+            )
+        return shared_memory
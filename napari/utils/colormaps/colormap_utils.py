@@ -6,7 +6,6 @@ from threading import Lock
 from typing import NamedTuple, Optional, Union
 
 import numpy as np
-import skimage.color as colorconv
 from vispy.color import (
     BaseColormap as VispyColormap,
     Color,
@@ -386,6 +385,8 @@ def _color_random(n, *, colorspace='lab', tolerance=0.0, seed=0.5):
     rgb : array of float, shape (n, 3)
         RGB colors chosen uniformly at random from given colorspace.
     """
+    import skimage.color as colorconv
+
     factor = 6  # about 1/5 of random LUV tuples are inside the space
     expand_factor = 2
     rgb = np.zeros((0, 3))
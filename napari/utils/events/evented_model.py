@@ -394,7 +394,8 @@ class EventedModel(BaseModel, metaclass=EventedMetaclass):
         # recreated arbitrarily during validation
         self.events.source = self
         for name in self.__fields__:
-            child = getattr(self, name)
+            # read the stored values, which may be computed on access
+            child = self.__dict__[name]
             if isinstance(child, EventedModel):
                 # TODO: this isinstance check should be EventedMutables in the future
                 child._reset_event_source()
@@ -27,8 +27,9 @@ class NotebookScreenshot:
 
     Parameters
     ----------
-    viewer : napari.Viewer
-        The napari viewer.
+    viewer : napari.Viewer or napari.components.ViewerModel
+        The napari viewer. The canvas of a viewer model without a window is
+        rendered in software, without OpenGL.
     canvas_only : bool, optional
         If True includes the napari viewer frame in the screenshot,
         otherwise just includes the canvas. By default, True.
@@ -108,12 +109,19 @@ class NotebookScreenshot:
         -------
         In memory binary stream containing PNG screenshot image.
         """
-        from napari._qt.qt_event_loop import get_app
-
-        get_app().processEvents()
-        self.image = self.viewer.screenshot(
-            canvas_only=self.canvas_only, flash=False
-        )
+        if hasattr(self.viewer, 'window'):
+            from napari._qt.qt_event_loop import get_app
+
+            get_app().processEvents()
+            self.image = self.viewer.screenshot(
+                canvas_only=self.canvas_only, flash=False
+            )
+        else:
+            # a ViewerModel without a window, e.g. on a machine without a
+            # display, is rendered in software
+            from napari.components._compositor import composite
+
+            self.image = composite(self.viewer)
         with BytesIO() as file_obj:
             imsave_png(file_obj, self.image)
             file_obj.seek(0)
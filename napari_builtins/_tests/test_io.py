@@ -1,5 +1,7 @@
 import csv
 import os
+import threading
+from concurrent.futures import wait
 from pathlib import Path
 from tempfile import TemporaryDirectory
 from typing import NamedTuple
@@ -13,12 +15,16 @@ import pytest
 import tifffile
 import zarr
 
+from napari_builtins.io import _read
 from napari_builtins.io._read import (
+    ImageStack,
+    _default_max_workers,
     _guess_layer_type_from_column_names,
     _guess_zarr_path,
     csv_to_layer_data,
     magic_imread,
     read_csv,
+    read_zarr_dataset,
 )
 from napari_builtins.io._write import write_csv
 
@@ -124,6 +130,41 @@ def test_zarr_multiscale():
             np.testing.assert_array_equal(images, images_in)
 
 
+def test_zarr_multiscale_metadata_order(tmp_path):
+    # dataset order comes from the multiscales metadata, not from sorting
+    names = ['full', 'half', 'quarter']
+    multiscale = [np.random.random((20 // 2**i,) * 2) for i in range(3)]
+    root = zarr.open_group(str(tmp_path / 'ome.zarr'), 'a')
+    for name, data in zip(names, multiscale):
+        root.create_dataset(name, data=data)
+    root.attrs['multiscales'] = [
+        {'version': '0.4', 'datasets': [{'path': n} for n in names]}
+    ]
+    multiscale_in = magic_imread([str(tmp_path / 'ome.zarr')])
+    assert [m.shape for m in multiscale_in] == [m.shape for m in multiscale]
+    for images, images_in in zip(multiscale, multiscale_in):
+        np.testing.assert_array_equal(images, images_in)
+
+
+def test_zarr_consolidated(tmp_path):
+    multiscale = [np.random.random((20 // 2**i,) * 2) for i in range(3)]
+    root = zarr.open_group(str(tmp_path / 'consolidated.zarr'), 'a')
+    for i, data in enumerate(multiscale):
+        root.create_dataset(str(i), data=data)
+    zarr.consolidate_metadata(root.store)
+    # arrays are opened from the consolidated metadata alone
+    for i in range(3):
+        (tmp_path / 'consolidated.zarr' / str(i) / '.zarray').unlink()
+
+    multiscale_in, shape = read_zarr_dataset(
+        str(tmp_path / 'consolidated.zarr'), use_dask=False
+    )
+    assert shape == multiscale[0].shape
+    assert all(isinstance(m, zarr.Array) for m in multiscale_in)
+    for images, images_in in zip(multiscale, multiscale_in):
+        np.testing.assert_array_equal(images, images_in)
+
+
 def test_write_csv(tmpdir):
     expected_filename = os.path.join(tmpdir, 'test.csv')
     column_names = ['column_1', 'column_2', 'column_3']
@@ -307,6 +348,84 @@ def test_irregular_images(write_spec, stack):
     assert all(img.shape == spec.shape for img, spec in zip(images, specs))
 
 
+def test_irregular_images_are_read_lazily(write_spec, monkeypatch):
+    specs = [PNG, PNG_RECT]
+    fnames = [str(write_spec(spec)) for spec in specs]
+    read = []
+    imread = _read.imread
+
+    def counting_imread(filename):
+        read.append(filename)
+        return imread(filename)
+
+    monkeypatch.setattr(_read, 'imread', counting_imread)
+    images = magic_imread(fnames, use_dask=True, stack=False)
+    # the shapes come from the png headers, no file is decoded
+    assert [img.shape for img in images] == [spec.shape for spec in specs]
+    assert not read
+
+    for image, fname in zip(images, fnames):
+        np.testing.assert_array_equal(image, imread(fname))
+    assert sorted(read) == sorted(fnames)
+
+
+def test_image_stack_is_lazy(write_spec):
+    fnames = [str(write_spec(TIFF_2D)) for _ in range(5)]
+    image_stack = ImageStack(fnames)
+    # shape and dtype come from the tiff header, no plane is decoded
+    assert image_stack.shape == (5, *TIFF_2D.shape)
+    assert image_stack.dtype == TIFF_2D.dtype
+    assert not image_stack._cache
+
+    expected = np.stack([tifffile.imread(f) for f in fnames])
+    np.testing.assert_array_equal(image_stack[2], expected[2])
+    assert list(image_stack._cache) == [2]
+    np.testing.assert_array_equal(image_stack[1:4, 3], expected[1:4, 3])
+    np.testing.assert_array_equal(image_stack[..., 0], expected[..., 0])
+    np.testing.assert_array_equal(np.asarray(image_stack), expected)
+
+    dask_stack = image_stack.to_dask()
+    assert dask_stack.chunksize == (1, *TIFF_2D.shape)
+    np.testing.assert_array_equal(dask_stack, expected)
+    image_stack.close()
+
+
+def test_image_stack_cache_is_bounded(write_spec):
+    fnames = [str(write_spec(TIFF_2D)) for _ in range(4)]
+    plane_nbytes = np.prod(TIFF_2D.shape)
+    image_stack = ImageStack(fnames, cache_bytes=2 * plane_nbytes)
+    image_stack[:]
+    assert len(image_stack._cache) == 2
+
+
+def test_image_stack_prefetch(write_spec):
+    fnames = [str(write_spec(TIFF_2D)) for _ in range(4)]
+    image_stack = ImageStack(fnames, prefetch=2)
+    image_stack[0]
+    wait(list(image_stack._pending.values()))
+    assert sorted(image_stack._cache) == [0, 1, 2]
+
+
+def test_image_stacks_share_reader_threads(write_spec):
+    fnames = [str(write_spec(TIFF_2D)) for _ in range(4)]
+    images = magic_imread(fnames, use_dask=True, stack=False)
+    for image in images:
+        image.compute()
+    images = magic_imread(fnames, use_dask=True, stack=True)
+    images.compute()
+    threads = [
+        t for t in threading.enumerate() if t.name.startswith('napari-imread')
+    ]
+    assert len(threads) <= _default_max_workers()
+
+
+def test_image_stack_shape_mismatch(write_spec):
+    fnames = [str(write_spec(TIFF_2D)), str(write_spec(TIFF_3D))]
+    image_stack = ImageStack(fnames)
+    with pytest.raises(ValueError, match='must have the same shape'):
+        image_stack[1]
+
+
 def test_add_zarr(write_spec):
     [out] = npe2.read([str(write_spec(ZARR1))], stack=False)
     assert out[0].shape == ZARR1.shape  # type: ignore
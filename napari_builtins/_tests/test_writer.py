@@ -1,11 +1,19 @@
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+import dask.array as da
 import npe2
 import numpy as np
 import pytest
+import tifffile
+import zarr
 
-from napari_builtins.io import napari_get_reader
+from napari_builtins.io import (
+    napari_get_reader,
+    napari_write_image,
+    napari_write_labels,
+)
+from napari_builtins.io._write import write_tiff_chunked
 
 if TYPE_CHECKING:
     from napari import layers
@@ -71,3 +79,36 @@ def test_get_writer_succeeds(
     assert set(written) == expected
     for expect in expected:
         assert Path(expect).is_file()
+
+
+@pytest.mark.parametrize('max_bytes', [10, 2**20])
+def test_write_tiff_chunked(tmp_path: Path, max_bytes: int):
+    data = da.random.randint(0, 100, (4, 6, 16, 16), chunks=(2, 3, 8, 16))
+    path = str(tmp_path / 'image.tif')
+    assert write_tiff_chunked(path, data, max_bytes=max_bytes) == path
+    np.testing.assert_array_equal(tifffile.imread(path), data.compute())
+
+
+def test_write_labels_lazy(tmp_path: Path):
+    # lazy labels are converted chunk by chunk instead of with np.asarray
+    data = da.random.randint(0, 100, (3, 16, 16), chunks=(1, 16, 16))
+    data = data.astype(np.uint8)
+    path = napari_write_labels(str(tmp_path / 'labels'), data, {})
+    assert path == str(tmp_path / 'labels.tif')
+    result = tifffile.imread(path)
+    assert result.dtype == np.uint32
+    np.testing.assert_array_equal(result, data.compute())
+
+
+@pytest.mark.parametrize('rgb', [True, False])
+def test_write_image_zarr(tmp_path: Path, rgb: bool):
+    shape = (5, 16, 16, 3) if rgb else (5, 16, 16)
+    data = zarr.array(
+        np.random.random(shape), chunks=(2, 16, 8, 3)[: len(shape)]
+    )
+    path = napari_write_image(str(tmp_path / 'image.zarr'), data, {'rgb': rgb})
+    assert path == str(tmp_path / 'image.zarr')
+    result = zarr.open_array(path, mode='r')
+    n_inner = 3 if rgb else 2
+    assert result.chunks[-n_inner:] == shape[-n_inner:]
+    np.testing.assert_array_equal(result[:], data[:])
@@ -1,9 +1,13 @@
 import csv
+import json
 import os
 import re
 import tempfile
+import threading
 import urllib.parse
+from collections import OrderedDict
 from collections.abc import Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
 from contextlib import contextmanager, suppress
 from glob import glob
 from pathlib import Path
@@ -14,6 +18,7 @@ import dask.array as da
 import imageio.v3 as iio
 import numpy as np
 from dask import delayed
+from dask.base import tokenize
 from imageio import formats
 
 from napari.utils.misc import abspath_or_url
@@ -98,19 +103,379 @@ def imread(filename: str) -> np.ndarray:
         return tifffile.imread(str(filename))
 
 
+def _imread_header(
+    filename: str,
+) -> Optional[tuple[tuple[int, ...], np.dtype]]:
+    """Return the shape and dtype of an image without decoding its pixels.
+
+    TIFF and ``.npy`` headers are read directly, other formats use the
+    image properties reported by imageio, which :func:`imread` reads with.
+
+    Parameters
+    ----------
+    filename : string
+        The path from which to read the image header.
+
+    Returns
+    -------
+    (shape, dtype) : tuple or None
+        Shape and dtype of the image, or None if they cannot be determined
+        without reading the full image.
+    """
+    filename = abspath_or_url(filename)
+    if _is_url(filename):
+        return None
+    ext = os.path.splitext(filename)[1].lower()
+    if ext == '.npy':
+        arr = np.load(filename, mmap_mode='r')
+        return arr.shape, arr.dtype
+    if ext in ('.tif', '.tiff', '.lsm'):
+        import tifffile
+
+        with tifffile.TiffFile(filename) as tif:
+            series = tif.series[0]
+            return tuple(series.shape), np.dtype(series.dtype)
+    try:
+        props = iio.improps(filename)
+    except (OSError, ValueError):
+        return None
+    return tuple(props.shape), np.dtype(props.dtype)
+
+
+def _default_max_workers() -> int:
+    """Default number of threads used to read image planes."""
+    return min(32, (os.cpu_count() or 1) + 4)
+
+
+_read_executor: Optional[ThreadPoolExecutor] = None
+_read_executor_lock = threading.Lock()
+
+
+def _get_read_executor() -> ThreadPoolExecutor:
+    """Return the thread pool shared by all image readers of this module.
+
+    The pool is created on first use, and its threads are reused for the
+    lifetime of the process rather than started for each stack.
+    """
+    global _read_executor
+    with _read_executor_lock:
+        if _read_executor is None:
+            _read_executor = ThreadPoolExecutor(
+                max_workers=_default_max_workers(),
+                thread_name_prefix='napari-imread',
+            )
+        return _read_executor
+
+
+class ImageStack:
+    """Lazy array over a sequence of same-shape image files.
+
+    The shape and dtype of the stack are determined from the header of the
+    first file when possible, so that creating the stack does not decode any
+    pixels. Planes are read on demand with a thread pool shared by all
+    stacks, so that requests spanning several planes are read in parallel,
+    and the most recently used planes are kept in memory.
+
+    Parameters
+    ----------
+    filenames : list of str
+        Files making up the stack, one plane per file.
+    cache_bytes : int
+        Approximate number of bytes of decoded planes to keep in memory.
+        At least one plane is always cached.
+    prefetch : int
+        Number of planes following the last requested one to read ahead in
+        the background, which keeps scrolling through the stack responsive.
+
+    Attributes
+    ----------
+    shape : tuple of int
+        Shape of the stack, ``(len(filenames), *plane_shape)``.
+    dtype : np.dtype
+        Data type of the stack.
+    """
+
+    def __init__(
+        self,
+        filenames: Sequence[str],
+        *,
+        cache_bytes: int = 256 * 2**20,
+        prefetch: int = 0,
+    ) -> None:
+        if not filenames:
+            raise ValueError(trans._('No files found', deferred=True))
+        self._filenames = list(filenames)
+        self._cache_bytes = cache_bytes
+        self._prefetch = prefetch
+        self._init_state()
+
+        header = _imread_header(self._filenames[0])
+        if header is None:
+            # no cheap way to get the metadata, decode the first plane but
+            # keep it in the cache so the read is not wasted.
+            first = imread(self._filenames[0])
+            self._plane_shape, self.dtype = first.shape, first.dtype
+            self._cache[0] = first
+        else:
+            self._plane_shape, self.dtype = header
+
+    def _init_state(self) -> None:
+        self._lock = threading.Lock()
+        self._cache: OrderedDict[int, np.ndarray] = OrderedDict()
+        self._pending: dict[int, Future] = {}
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        for key in ('_lock', '_cache', '_pending'):
+            del state[key]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._init_state()
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        return (len(self._filenames), *self._plane_shape)
+
+    @property
+    def ndim(self) -> int:
+        return len(self.shape)
+
+    @property
+    def size(self) -> int:
+        return int(np.prod(self.shape))
+
+    def __len__(self) -> int:
+        return len(self._filenames)
+
+    @property
+    def _max_cached_planes(self) -> int:
+        plane_nbytes = int(np.prod(self._plane_shape)) * self.dtype.itemsize
+        return max(1, self._cache_bytes // max(plane_nbytes, 1))
+
+    def _read_plane(self, index: int) -> np.ndarray:
+        try:
+            plane = imread(self._filenames[index])
+            if plane.shape != self._plane_shape:
+                raise ValueError(
+                    trans._(
+                        'To stack multiple files into a single array, all input arrays must have the same shape. Expected {expected} but {filename} has shape {shape}.',
+                        deferred=True,
+                        expected=self._plane_shape,
+                        filename=self._filenames[index],
+                        shape=plane.shape,
+                    )
+                )
+            plane = plane.astype(self.dtype, copy=False)
+            with self._lock:
+                self._cache[index] = plane
+                self._cache.move_to_end(index)
+                while len(self._cache) > self._max_cached_planes:
+                    self._cache.popitem(last=False)
+        finally:
+            with self._lock:
+                self._pending.pop(index, None)
+        return plane
+
+    def _submit(self, index: int) -> Union[np.ndarray, Future]:
+        """Return the cached plane, or a future resolving to it.
+
+        Must be called with ``self._lock`` held.
+        """
+        if index in self._cache:
+            self._cache.move_to_end(index)
+            return self._cache[index]
+        future = self._pending.get(index)
+        if future is None:
+            future = _get_read_executor().submit(self._read_plane, index)
+            self._pending[index] = future
+        return future
+
+    def get_planes(self, indices: Sequence[int]) -> list[np.ndarray]:
+        """Return the planes at ``indices``, reading missing ones in parallel.
+
+        Parameters
+        ----------
+        indices : sequence of int
+            Indices of the planes to return.
+
+        Returns
+        -------
+        list of np.ndarray
+            The requested planes, in the order of ``indices``.
+        """
+        n_planes = len(self._filenames)
+        with self._lock:
+            results = [self._submit(int(i)) for i in indices]
+            if self._prefetch and len(indices):
+                last = int(indices[-1])
+                for i in range(
+                    last + 1, min(last + 1 + self._prefetch, n_planes)
+                ):
+                    self._submit(i)
+        return [r.result() if isinstance(r, Future) else r for r in results]
+
+    def __getitem__(self, key) -> np.ndarray:
+        if not isinstance(key, tuple):
+            key = (key,)
+        if not key:
+            key = (slice(None),)
+        plane_key, rest = key[0], key[1:]
+        if plane_key is Ellipsis:
+            plane_key, rest = slice(None), key
+        if isinstance(plane_key, (int, np.integer)):
+            return self.get_planes([plane_key])[0][rest]
+        indices = np.arange(len(self._filenames))[plane_key]
+        if indices.size == 0:
+            empty = np.empty((0, *self._plane_shape), dtype=self.dtype)
+            return empty[(slice(None), *rest)]
+        return np.stack([p[rest] for p in self.get_planes(indices)])
+
+    def __array__(self, dtype=None, copy=None) -> np.ndarray:
+        arr = self[:]
+        return arr if dtype is None else arr.astype(dtype, copy=False)
+
+    def to_dask(self) -> da.Array:
+        """Return a dask array with one chunk per plane backed by this stack."""
+        return da.from_array(
+            self,
+            chunks=(1, *self._plane_shape),
+            name='imread-stack-' + tokenize(self._filenames),
+            meta=np.empty((0,) * self.ndim, dtype=self.dtype),
+        )
+
+    def close(self) -> None:
+        """Cancel pending plane reads and drop cached planes."""
+        with self._lock:
+            pending = list(self._pending.values())
+            self._cache.clear()
+        for future in pending:
+            future.cancel()
+
+
 def _guess_zarr_path(path: str) -> bool:
     """Guess whether string path is part of a zarr hierarchy."""
     return any(part.endswith('.zarr') for part in Path(path).parts)
 
 
-def read_zarr_dataset(path: str):
+def _read_json(path: Path) -> dict:
+    """Return the content of a JSON metadata file, or {} if it is missing."""
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+def _multiscales_paths(attrs: dict) -> Optional[list[str]]:
+    """Return the dataset paths of OME-Zarr multiscales metadata, if any.
+
+    Parameters
+    ----------
+    attrs : dict
+        Attributes (``.zattrs``) of a zarr group.
+
+    Returns
+    -------
+    list of str or None
+        Paths of the pyramid levels, from highest to lowest resolution, as
+        listed in the first ``multiscales`` entry, or None if the group has
+        no multiscales metadata.
+    """
+    try:
+        datasets = attrs['multiscales'][0]['datasets']
+        return [str(d['path']) for d in datasets]
+    except (KeyError, IndexError, TypeError):
+        return None
+
+
+def _open_zarr_array(array, use_dask: bool):
+    """Wrap a zarr array (or a path to one) into a dask array if requested."""
+    if isinstance(array, Path):
+        import zarr
+
+        array = zarr.open_array(str(array), mode='r')
+    return da.from_zarr(array) if use_dask else array
+
+
+def _read_consolidated_zarr_group(group, use_dask: bool) -> list:
+    """Read all arrays in a zarr group opened from consolidated metadata.
+
+    No filesystem access happens here, the layout of the hierarchy comes
+    from the consolidated metadata only.
+    """
+    import zarr
+
+    paths = _multiscales_paths(dict(group.attrs))
+    if paths is None:
+        paths = sorted(
+            name
+            for name in (*group.array_keys(), *group.group_keys())
+            if not name.startswith('.')
+        )
+    image = []
+    for name in paths:
+        node = group[name]
+        if isinstance(node, zarr.Group):
+            image.append(_read_consolidated_zarr_group(node, use_dask))
+        else:
+            image.append(_open_zarr_array(node, use_dask))
+    return image
+
+
+def _read_zarr_group(path: Path, use_dask: bool) -> list:
+    """Read all arrays in a zarr group, e.g. the levels of a multiscale image.
+
+    Consolidated metadata (``.zmetadata``) is used when present, so that the
+    hierarchy is opened with a single metadata read. Otherwise, levels are
+    taken from OME-Zarr ``multiscales`` metadata if present, or else from the
+    sorted subdirectories of the group, and are opened concurrently.
+    """
+    if (path / '.zmetadata').exists():
+        import zarr
+
+        group = zarr.open_consolidated(str(path), mode='r')
+        return _read_consolidated_zarr_group(group, use_dask)
+
+    paths = _multiscales_paths(_read_json(path / '.zattrs'))
+    if paths is not None:
+        subpaths = [path / p for p in paths]
+    else:
+        subpaths = [
+            subpath
+            for subpath in sorted(path.iterdir())
+            if not subpath.name.startswith('.') and subpath.is_dir()
+        ]
+    if not subpaths:
+        return []
+    with ThreadPoolExecutor(
+        max_workers=min(len(subpaths), _default_max_workers())
+    ) as executor:
+        return list(
+            executor.map(
+                lambda p: read_zarr_dataset(p, use_dask=use_dask)[0],
+                subpaths,
+            )
+        )
+
+
+def read_zarr_dataset(path: str, *, use_dask: bool = True):
     """Read a zarr dataset, including an array or a group of arrays.
 
+    For groups, consolidated metadata (``.zmetadata``) and OME-Zarr
+    ``multiscales`` metadata are used when present to find the arrays
+    without listing the group, otherwise the subdirectories of the group are
+    read concurrently.
+
     Parameters
     ----------
     path : str
         Path to directory ending in '.zarr'. Path can contain either an array
         or a group of arrays in the case of multiscale data.
+    use_dask : bool
+        Whether to wrap the arrays in dask arrays. If False, the
+        ``zarr.Array`` objects are returned directly.
 
     Returns
     -------
@@ -122,15 +487,11 @@ def read_zarr_dataset(path: str):
     path = Path(path)
     if (path / '.zarray').exists():
         # load zarr array
-        image = da.from_zarr(path)
+        image = _open_zarr_array(path, use_dask)
         shape = image.shape
     elif (path / '.zgroup').exists():
         # else load zarr all arrays inside file, useful for multiscale data
-        image = [
-            read_zarr_dataset(subpath)[0]
-            for subpath in sorted(path.iterdir())
-            if not subpath.name.startswith('.') and subpath.is_dir()
-        ]
+        image = _read_zarr_group(path, use_dask)
         assert image, 'No arrays found in zarr group'
         shape = image[0].shape
     else:  # pragma: no cover
@@ -211,6 +572,11 @@ def magic_imread(
             )
         )
 
+    if not any(_guess_zarr_path(f) for f in filenames_expanded):
+        return _read_image_files(
+            filenames_expanded, use_dask=use_dask, stack=stack
+        )
+
     # then, read in images
     images = []
     shape = None
@@ -259,6 +625,53 @@ def magic_imread(
     return image
 
 
+def _read_image_files(filenames: list[str], *, use_dask: bool, stack: bool):
+    """Read non-zarr image files, in parallel and lazily if ``use_dask``.
+
+    Parameters
+    ----------
+    filenames : list of str
+        Image files to read, none of which is part of a zarr hierarchy.
+    use_dask : bool
+        Whether to return lazy dask arrays backed by :class:`ImageStack`.
+    stack : bool
+        Whether to stack the images into a single array.
+
+    Returns
+    -------
+    image : array-like
+        Array or list of images
+    """
+    if len(filenames) == 1:
+        if use_dask:
+            return ImageStack(filenames).to_dask()[0]
+        return imread(filenames[0])
+
+    if stack:
+        image_stack = ImageStack(filenames, prefetch=2 if use_dask else 0)
+        if use_dask:
+            return image_stack.to_dask()
+        try:
+            return np.asarray(image_stack)
+        except ValueError as e:
+            if 'input arrays must have the same shape' in str(e):
+                msg = trans._(
+                    'To stack multiple files into a single array with numpy, all input arrays must have the same shape. Set `use_dask` to True to stack arrays with different shapes.',
+                    deferred=True,
+                )
+                raise ValueError(msg) from e
+            raise  # pragma: no cover
+        finally:
+            image_stack.close()
+
+    executor = _get_read_executor()
+    if use_dask:
+        # only the headers are read here, each file is decoded on compute
+        stacks = executor.map(lambda f: ImageStack([f]), filenames)
+        return [image_stack.to_dask()[0] for image_stack in stacks]
+    return list(executor.map(imread, filenames))
+
+
 def _points_csv_to_layerdata(
     table: np.ndarray, column_names: list[str]
 ) -> 'FullLayerData':
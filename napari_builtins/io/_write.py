@@ -1,6 +1,9 @@
 import csv
+import itertools
 import os
 import shutil
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from tempfile import TemporaryDirectory
 from typing import TYPE_CHECKING, Any, Optional, Union
 
@@ -8,10 +11,17 @@ import numpy as np
 
 from napari.utils.io import imsave
 from napari.utils.misc import abspath_or_url
+from napari.utils.progress import progress
+from napari.utils.translations import trans
 
 if TYPE_CHECKING:
+    import numpy.typing as npt
+
     from napari.types import FullLayerData
 
+#: Maximum number of bytes of source data loaded at once by chunked writers.
+CHUNKED_WRITE_MAX_BYTES = 256 * 2**20
+
 
 def write_csv(
     filename: str,
@@ -95,6 +105,250 @@ def imsave_extensions() -> tuple[str, ...]:
     )
 
 
+def _is_lazy(data: Any) -> bool:
+    """Whether data should be written chunk by chunk rather than at once.
+
+    Any array that is not already in memory (dask, zarr, tensorstore, ...)
+    is written in chunks, so saving it never loads it entirely.
+    """
+    return not isinstance(data, (np.ndarray, list))
+
+
+def _iter_slabs(
+    shape: tuple[int, ...],
+    itemsize: int,
+    n_inner: int,
+    chunks: Optional[tuple[tuple[int, ...], ...]] = None,
+    max_bytes: int = CHUNKED_WRITE_MAX_BYTES,
+) -> Iterator[tuple[slice, ...]]:
+    """Yield index tuples covering ``shape`` in C order in slabs of planes.
+
+    The ``n_inner`` last axes (e.g. YX, or YXC for RGB data) are always
+    covered entirely, so that each slab is a contiguous run of planes. As
+    many trailing outer axes as fit in ``max_bytes`` are covered entirely
+    too, and the next axis is split in steps of equal size, aligned with the
+    source ``chunks`` along that axis when given.
+
+    Parameters
+    ----------
+    shape : tuple of int
+        Shape of the array to iterate over.
+    itemsize : int
+        Size in bytes of one element of the array.
+    n_inner : int
+        Number of trailing axes that each slab covers entirely.
+    chunks : tuple of tuple of int, optional
+        Dask-style chunk sizes of the source array along each axis.
+    max_bytes : int
+        Maximum number of bytes in a slab, unless a single plane is larger.
+
+    Yields
+    ------
+    tuple of slice
+        Index of the next slab. All slabs but the last ones along the split
+        axis have the same shape.
+    """
+    n_outer = len(shape) - n_inner
+    block_nbytes = int(np.prod(shape[n_outer:])) * itemsize
+    split_axis = n_outer - 1
+    while split_axis >= 0 and block_nbytes * shape[split_axis] <= max_bytes:
+        block_nbytes *= shape[split_axis]
+        split_axis -= 1
+    if split_axis < 0:
+        yield tuple(slice(0, size) for size in shape)
+        return
+
+    step = max(1, max_bytes // block_nbytes)
+    if chunks is not None and chunks[split_axis]:
+        step = min(step, chunks[split_axis][0])
+    trailing = tuple(slice(0, size) for size in shape[split_axis + 1 :])
+    for idx in itertools.product(*(range(s) for s in shape[:split_axis])):
+        for start in range(0, shape[split_axis], step):
+            stop = min(start + step, shape[split_axis])
+            yield (
+                *(slice(i, i + 1) for i in idx),
+                slice(start, stop),
+                *trailing,
+            )
+
+
+def _source_chunks(data: Any) -> Optional[tuple[tuple[int, ...], ...]]:
+    """Return dask-style chunk sizes of ``data``, if it is chunked."""
+    chunks = getattr(data, 'chunks', None)
+    if chunks is None or not len(chunks):
+        return None
+    if all(isinstance(c, (int, np.integer)) for c in chunks):
+        # zarr style, one chunk size per axis
+        return tuple(
+            (int(c),) * (s // int(c)) + ((s % int(c),) if s % int(c) else ())
+            for c, s in zip(chunks, data.shape)
+        )
+    return tuple(tuple(int(i) for i in c) for c in chunks)
+
+
+def write_tiff_chunked(
+    path: str,
+    data: Any,
+    dtype: Optional['npt.DTypeLike'] = None,
+    *,
+    rgb: bool = False,
+    max_bytes: int = CHUNKED_WRITE_MAX_BYTES,
+    max_workers: Optional[int] = None,
+) -> str:
+    """Write an array to a (Big)TIFF file without loading it entirely.
+
+    The array is read in slabs of whole planes of at most ``max_bytes`` bytes
+    (or a single plane if it is larger) and streamed to disk page by page.
+    Strips of each page are compressed in parallel.
+
+    Parameters
+    ----------
+    path : str
+        Path of the TIFF file to write.
+    data : array-like
+        N dimensional array supporting numpy indexing, e.g. a dask or zarr
+        array.
+    dtype : data-type, optional
+        Data type to write, by default the dtype of ``data``.
+    rgb : bool
+        Whether the last axis of ``data`` holds RGB(A) channels.
+    max_bytes : int
+        Maximum number of bytes of ``data`` loaded at once.
+    max_workers : int, optional
+        Maximum number of threads compressing strips, by default the number
+        of CPUs.
+
+    Returns
+    -------
+    path : str
+        The path that was written.
+    """
+    import tifffile
+
+    dtype = np.dtype(dtype if dtype is not None else data.dtype)
+    shape = tuple(data.shape)
+    n_inner = 3 if rgb else 2
+    nbytes = int(np.prod(shape)) * dtype.itemsize
+    slabs = list(
+        _iter_slabs(
+            shape, dtype.itemsize, n_inner, _source_chunks(data), max_bytes
+        )
+    )
+
+    def pages() -> Iterator[np.ndarray]:
+        with progress(
+            total=len(slabs),
+            desc=trans._('Saving {path}', path=os.path.basename(path)),
+        ) as pbr:
+            for slab_idx in slabs:
+                slab = np.asarray(data[slab_idx], dtype=dtype)
+                yield from slab.reshape((-1, *shape[len(shape) - n_inner :]))
+                pbr.update(1)
+
+    tifffile.imwrite(
+        path,
+        pages(),
+        shape=shape,
+        dtype=dtype,
+        photometric='rgb' if rgb else 'minisblack',
+        # same rule as tifffile uses for in-memory arrays
+        bigtiff=nbytes > 2**32 - 2**25,
+        compression=None if dtype == bool else ('zlib', 1),
+        maxworkers=max_workers or os.cpu_count(),
+    )
+    return path
+
+
+def write_zarr_chunked(
+    path: str,
+    data: Any,
+    dtype: Optional['npt.DTypeLike'] = None,
+    *,
+    n_inner: int = 2,
+    max_bytes: int = CHUNKED_WRITE_MAX_BYTES,
+    max_workers: Optional[int] = None,
+) -> str:
+    """Write an array to a zarr array without loading it entirely.
+
+    Slabs of whole planes of at most ``max_bytes`` bytes (or a single plane
+    if it is larger) are read from ``data`` and written to zarr
+    concurrently, with at most ``max_workers`` slabs in memory at once. The
+    zarr array is chunked by slab, so that no two slabs share a chunk.
+
+    Parameters
+    ----------
+    path : str
+        Path of the zarr array to write.
+    data : array-like
+        N dimensional array supporting numpy indexing, e.g. a dask array.
+    dtype : data-type, optional
+        Data type to write, by default the dtype of ``data``.
+    n_inner : int
+        Number of trailing axes that are never split across chunks.
+    max_bytes : int
+        Maximum number of bytes of ``data`` loaded by each worker.
+    max_workers : int, optional
+        Maximum number of slabs read and compressed concurrently, by default
+        the number of CPUs.
+
+    Returns
+    -------
+    path : str
+        The path that was written.
+    """
+    import zarr
+
+    dtype = np.dtype(dtype if dtype is not None else data.dtype)
+    shape = tuple(data.shape)
+    n_inner = min(n_inner, len(shape))
+    slabs = list(
+        _iter_slabs(
+            shape, dtype.itemsize, n_inner, _source_chunks(data), max_bytes
+        )
+    )
+    chunks = tuple(s.stop - s.start for s in slabs[0]) if slabs else shape
+    out = zarr.open_array(
+        path, mode='w', shape=shape, chunks=chunks, dtype=dtype
+    )
+    max_workers = max_workers or os.cpu_count() or 1
+
+    def write_slab(slab_idx: tuple[slice, ...]) -> None:
+        out[slab_idx] = np.asarray(data[slab_idx], dtype=dtype)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        with progress(
+            total=len(slabs),
+            desc=trans._('Saving {path}', path=os.path.basename(path)),
+        ) as pbr:
+            # bound the number of in-flight slabs to bound memory
+            pending: list = []
+            for slab_idx in slabs:
+                if len(pending) >= max_workers:
+                    pending.pop(0).result()
+                    pbr.update(1)
+                pending.append(executor.submit(write_slab, slab_idx))
+            for future in pending:
+                future.result()
+                pbr.update(1)
+    return path
+
+
+def _write_chunked(
+    path: str, data: Any, meta: dict, dtype: Optional['npt.DTypeLike'] = None
+) -> Optional[str]:
+    """Write lazy or zarr-destined data chunk by chunk, if supported."""
+    if isinstance(data, list):
+        # multiscale data is not supported by the chunked writers
+        return None
+    ext = os.path.splitext(path)[1].lower()
+    rgb = bool(meta.get('rgb', False))
+    if ext == '.zarr':
+        return write_zarr_chunked(path, data, dtype, n_inner=3 if rgb else 2)
+    if ext in ('.tif', '.tiff') and _is_lazy(data):
+        return write_tiff_chunked(path, data, dtype, rgb=rgb)
+    return None
+
+
 def napari_write_image(path: str, data: Any, meta: dict) -> Optional[str]:
     """Our internal fallback image writer at the end of the plugin chain.
 
@@ -120,6 +374,9 @@ def napari_write_image(path: str, data: Any, meta: dict) -> Optional[str]:
         path += '.tif'
         ext = '.tif'
 
+    if _write_chunked(path, data, meta):
+        return path
+
     if ext in imsave_extensions():
         imsave(path, data)
         return path
@@ -148,6 +405,10 @@ def napari_write_labels(path: str, data: Any, meta: dict) -> Optional[str]:
         Otherwise, if nothing was done, return ``None``.
     """
     dtype = data.dtype if data.dtype.itemsize >= 4 else np.uint32
+    if not os.path.splitext(path)[1]:
+        path += '.tif'
+    if _write_chunked(path, data, meta, dtype=dtype):
+        return path
     return napari_write_image(path, np.asarray(data, dtype=dtype), meta)
 
 